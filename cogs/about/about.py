@@ -8,7 +8,6 @@ from typing import TYPE_CHECKING
 # import pkg_resources
 import discord
 import psutil
-import pygit2
 from discord import app_commands
 from discord.app_commands import locale_str as _T
 from discord.app_commands.checks import bot_has_permissions
@@ -21,6 +20,8 @@ from core.ui.views import BaseView
 from core.utils.useful import count_python
 
 if TYPE_CHECKING:
+    import pygit2
+
     from core.bot import LatteMaid
 
 _ = I18n('about', __file__)
@@ -39,6 +40,8 @@ def format_commit(commit: pygit2.Commit) -> str:
 
 def get_last_parent() -> str:
     """Get the last parent of the repo"""
+    import pygit2
+
     repo = pygit2.Repository('./.git')
     parent = repo.head.target.hex  # type: ignore
     return parent[0:6]
@@ -46,6 +49,9 @@ def get_last_parent() -> str:
 
 def get_latest_commits(limit: int = 3) -> str:
     """Get the latest commits from the repo"""
+    # pygit2 is only used by the about command
+    import pygit2
+
     repo = pygit2.Repository('./.git')
     commits = list(itertools.islice(repo.walk(repo.head.target, pygit2.GIT_SORT_TOPOLOGICAL), limit))
     return '\n'.join(format_commit(c) for c in commits)
@@ -109,20 +109,20 @@ class Developer(commands.Cog, name='developer'):
         await interaction.followup.send(embed=embed, silent=True)
 
     @app_commands.command(name='sync', description='Syncs the application commands to Discord.')
-    @app_commands.rename(guild_id=_T('guild_id'))
-    @app_commands.describe(guild_id=_T('target guild id'))
+    @app_commands.rename(guild_id=_T('guild_id'), force=_T('force'))
+    @app_commands.describe(guild_id=_T('target guild id'), force=_T('sync even if commands did not change'))
     @bot_has_permissions(send_messages=True, embed_links=True)
     @app_commands.default_permissions(administrator=True)
     @app_commands.guild_only()
     @owner_only()
-    async def sync_tree(self, interaction: Interaction[LatteMaid], guild_id: str | None = None) -> None:
+    async def sync_tree(self, interaction: Interaction[LatteMaid], guild_id: str | None = None, force: bool = False) -> None:
         await interaction.response.defer(ephemeral=True)
 
         if guild_id is not None and guild_id.isdigit():
             obj = discord.Object(id=int(guild_id))
-            await self.bot.tree.sync(guild=obj)
+            await self.bot.tree.sync(guild=obj, force=force)
             return
-        synced = await self.bot.tree.sync()
+        synced = await self.bot.tree.sync(force=force)
 
         embed = Embed(description=f'sync tree: {len(synced)}').success()
         if guild_id is not None:
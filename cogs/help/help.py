@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Hashable
 
 import discord
 from discord import app_commands, ui
@@ -14,7 +14,7 @@ from core.cog import MaidCog
 from core.i18n import I18n, cog_i18n
 from core.ui.embed import MiadEmbed as Embed
 from core.ui.views import ViewAuthor
-from core.utils.pages import LattePages, ListPageSource
+from core.utils.pages import CachedListPageSource, LattePages
 
 if TYPE_CHECKING:
     from core.bot import LatteMaid
@@ -47,17 +47,32 @@ def cog_embed(cog: commands.Cog | MaidCog, locale: discord.Locale) -> Embed:
     return embed
 
 
-class HelpPageSource(ListPageSource):
+class HelpPageSource(CachedListPageSource):
     def __init__(self, cog: commands.Cog | MaidCog, source: list[Command[Any, ..., Any] | Group]) -> None:
         super().__init__(sorted(source, key=lambda c: c.qualified_name), per_page=6)
         self.cog = cog
 
+    def get_cache_key(self, menu: HelpCommandView, page_number: int) -> Hashable:
+        return (page_number, menu.locale)
+
     def format_page(
         self,
         menu: HelpCommandView,
         entries: list[Command[Any, ..., Any] | Group],
     ) -> Embed:
-        embed = cog_embed(self.cog, menu.locale)
+        return self._build_embed(entries, menu.locale)
+
+    def format_cached_page(
+        self,
+        menu: HelpCommandView,
+        entries: list[Command[Any, ..., Any] | Group],
+        key: Hashable,
+    ) -> Embed:
+        _, locale = key  # type: ignore
+        return self._build_embed(entries, locale)
+
+    def _build_embed(self, entries: list[Command[Any, ..., Any] | Group], locale: discord.Locale) -> Embed:
+        embed = cog_embed(self.cog, locale)
         assert embed.description is not None
         for command in entries:
             name = command.qualified_name
@@ -67,7 +82,7 @@ class HelpPageSource(ListPageSource):
             if model is not None:
                 assert isinstance(model, AppCommand)
                 name = model.mention
-                description = model.description_localizations.get(menu.locale, description)
+                description = model.description_localizations.get(locale, description)
 
             embed.description += f'\n{name} - {description}'
 
@@ -10,6 +10,7 @@ from discord.app_commands.translator import locale_str as _T
 from dotenv import load_dotenv
 
 import valorantx2 as valorantx
+from core.bus import ValorantCacheCleared
 from core.checks import owner_only
 from core.i18n import I18n
 
@@ -100,5 +101,7 @@ class Admin(MixinMeta):
             await self.valorant_client.cache_clear()
         finally:
             _log.info('valorant client cache is cleared.')
+        # the other processes clear theirs too
+        await self.bot.bus.publish(ValorantCacheCleared(), local=False)
 
         await interaction.followup.send('successfully cleared valorant client cache.', silent=True)
@@ -10,6 +10,7 @@ import yarl
 from valorantx.errors import RiotAuthenticationError
 from valorantx.utils import MISSING
 
+from core.metrics import metrics
 from valorantx2.auth import RiotAuth as RiotAuth_
 from valorantx2.errors import RiotAuthRateLimitedError
 
@@ -110,21 +111,33 @@ class RiotAuth(RiotAuth_):
         use_query_response_mode: bool = False,
         remember: bool = False,
     ) -> None:
+        # the reauthorizations are counted by reauthorize
+        kind = 'authorize' if username and password else None
         try:
             await self._authorize(username, password, use_query_response_mode, remember)
         except aiohttp.ClientResponseError as e:
+            if kind is not None:
+                metrics.count_riot_auth(kind, 'rate_limited' if e.status == 429 else 'failure')
             if e.headers is None:
                 return
             if e.status == 429:
                 retry_after = e.headers.get('Retry-After')
                 if retry_after and int(retry_after) >= 0:
                     raise RiotAuthRateLimitedError(int(retry_after))
+        except Exception:
+            if kind is not None:
+                metrics.count_riot_auth(kind, 'failure')
+            raise
+        else:
+            if kind is not None:
+                metrics.count_riot_auth(kind, 'success')
 
     async def reauthorize(self) -> None:
         _log.info(f're authorizing {self.game_name}#{self.tag_line}({self.puuid})')
 
         if not self.is_available():
             _log.debug(f'{self.game_name}#{self.tag_line}({self.puuid}) is not available')
+            metrics.count_riot_auth('reauthorize', 'unavailable')
             # TODO: something here
             return
 
@@ -142,14 +155,17 @@ class RiotAuth(RiotAuth_):
                     await asyncio.sleep(1)
                     continue
                 self._is_available = False
+                metrics.count_riot_auth('reauthorize', 'failure')
                 raise e
             else:
+                metrics.count_riot_auth('reauthorize', 'success')
                 _log.info(f'successfully re authorized {self.game_name}#{self.tag_line}({self.puuid})')
                 if self.bot is not MISSING:
                     self.bot.dispatch('re_authorized_successfully', self)
                 break
         else:
             self._is_available = False
+            metrics.count_riot_auth('reauthorize', 'failure')
             self.bot.dispatch('re_authorize_failed', self)
             raise RuntimeError(
                 f'failed to re authorize {self.game_name}#{self.tag_line}({self.puuid}) for user {self.owner_id}'
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+import io
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Sequence, TypeVar
 
 import discord
 from discord import Locale, SelectOption, ui
 
 from core.i18n import I18n
-from core.ui.embed import MiadEmbed as Embed
+from core.ui.embed import EmbedTemplateCache, MiadEmbed as Embed
 from core.ui.views import ViewAuthor
 from core.utils.pages import PageSource
 
@@ -19,6 +20,9 @@ __all__ = (
     'ValorantPageSource',
     'ValorantListPageSource',
     'AccountSelect',
+    'embed_templates',
+    'image_embed_kwargs',
+    'valorant_page_kwargs',
 )
 
 if TYPE_CHECKING:
@@ -35,6 +39,44 @@ V = TypeVar('V', bound='BaseView', covariant=True)
 _log = logging.getLogger(__name__)
 _ = I18n('valorant.features.base', Path(__file__).resolve().parent, read_only=True)
 
+# the static parts of the catalog item embeds keyed by (uuid, locale, variant),
+# cleared when the valorant content changes
+embed_templates: EmbedTemplateCache = EmbedTemplateCache()
+
+
+async def image_embed_kwargs(view: BaseView, embed: Embed, image: bytes, *, extension: str = 'png') -> dict[str, Any]:
+    # the same image was already uploaded, point to it instead of uploading it again
+    digest = view.bot.attachment_urls.hash(image)
+    url = await view.bot.attachment_urls.resolve(digest, session=view.bot.session)
+    if url is not None:
+        embed.set_image(url=url)
+        return {'embeds': [embed], 'content': None}
+
+    file = discord.File(io.BytesIO(image), filename=view.bot.attachment_urls.filename(digest, extension))
+    embed.set_image(url=f'attachment://{file.filename}')
+    return {'embeds': [embed], 'content': None, 'file': file}
+
+
+def valorant_page_kwargs(value: Any, *, edit: bool) -> dict[str, Any]:
+    """The message keyword arguments of a formatted valorant page."""
+    if isinstance(value, dict):
+        # a new message takes the file as is, an edit has to replace the attachments
+        file = value.pop('file', None)
+        if not edit:
+            if file is not None:
+                value['file'] = file
+        else:
+            value['attachments'] = [file] if file is not None else []
+        return value
+    elif isinstance(value, str):
+        return {'content': value, 'embed': None}
+    elif isinstance(value, discord.Embed):
+        return {'embed': value, 'content': None}
+    elif isinstance(value, list) and all(isinstance(v, discord.Embed) for v in value):  # type: ignore
+        return {'embeds': value, 'content': None}
+    else:
+        return {}
+
 
 class ValorantPageSource(PageSource):
     async def format_page_valorant(self, view: Any, page: int, riot_auth: RiotAuth) -> Embed:
@@ -42,7 +84,7 @@ class ValorantPageSource(PageSource):
 
 
 class ValorantListPageSource(ValorantPageSource, Generic[T]):
-    def __init__(self, entries: list[T], per_page: int = 12):
+    def __init__(self, entries: Sequence[T], per_page: int = 12):
         self.entries = entries
         self.per_page = per_page
 
@@ -170,16 +212,7 @@ class BaseView(ViewAuthor):
         if riot_auth is None:
             return {}
         value = await self.source.format_page_valorant(self, page, riot_auth)
-        if isinstance(value, dict):
-            return value
-        elif isinstance(value, str):
-            return {'content': value, 'embed': None}
-        elif isinstance(value, discord.Embed):
-            return {'embed': value, 'content': None}
-        elif isinstance(value, list) and all(isinstance(v, discord.Embed) for v in value):  # type: ignore
-            return {'embeds': value, 'content': None}
-        else:
-            return {}
+        return valorant_page_kwargs(value, edit=self.message is not None)
 
     async def _init(self) -> None:
         user = await self.bot.db.fetch_user(self.author.id)
@@ -198,9 +231,19 @@ class BaseView(ViewAuthor):
     async def switch_account_to(self, puuid: str, /) -> None:
         self.current_puuid = puuid
         page = getattr(self, 'current_page', 0)
+        if self.message is not None:
+            # the edit replaces the attachments, the held urls of the message are dead
+            self.bot.attachment_urls.forget_message(self.message.id)
         kwargs = await self._get_kwargs_from_valorant_page(page)
         if self.message is not None:
-            await self.message.edit(**kwargs, view=self)
+            self.message = await self.message.edit(**kwargs, view=self)
+            self.bot.attachment_urls.register_message(self.message)
+
+    async def on_timeout(self) -> None:
+        await super().on_timeout()
+        if self.message is not None:
+            # nothing edits the attachments of the message anymore, their urls can be reused
+            self.bot.attachment_urls.release_message(self.message.id)
 
     async def start_valorant(self) -> None:
         await self.interaction.response.defer()
@@ -209,3 +252,4 @@ class BaseView(ViewAuthor):
         if not kwargs:
             kwargs = {'content': _('no_data', self.locale)}
         self.message = await self.interaction.followup.send(**kwargs, view=self)
+        self.bot.attachment_urls.register_message(self.message)
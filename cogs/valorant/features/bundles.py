@@ -11,7 +11,7 @@ from discord.utils import format_dt
 import core.utils.chat_formatting as chat
 from core.ui.embed import MiadEmbed as Embed
 from core.ui.views import ViewAuthor
-from core.utils.pages import LattePages, ListPageSource
+from core.utils.pages import CachedListPageSource, LattePages
 from valorantx2.emojis import VALORANT_POINT_EMOJI
 from valorantx2.models import (
     Buddy,
@@ -33,6 +33,7 @@ from valorantx2.models import (
 )
 
 from ..utils import locale_converter
+from .base import embed_templates
 
 # fmt: off
 __all__ = (
@@ -85,22 +86,40 @@ def select_featured_bundles_e(bundles: list[FeaturedBundle], *, locale: discord.
     return embeds
 
 
-def bundle_item_e(
-    item: BundleItem | FeaturedBundleItem,
-    is_featured: bool = False,
-    *,
-    locale: discord.Locale = discord.Locale.american_english,
-) -> Embed:
+def _bundle_item_template_e(item: BundleItem | FeaturedBundleItem, locale: discord.Locale) -> Embed:
     valorant_locale = locale_converter.to_valorant(locale)
 
     emoji = item.rarity.emoji if isinstance(item, Skin) else ''  # type: ignore
     embed = Embed(
         title='{rarity} {name}'.format(rarity=emoji, name=chat.bold(item.display_name_localized(valorant_locale))),
-        description=f'{VALORANT_POINT_EMOJI} ',
     ).dark()
 
+    if isinstance(item, PlayerTitle):
+        item_icon = None
+    elif isinstance(item, PlayerCard):
+        item_icon = item.large_art
+    elif isinstance(item, Spray):
+        item_icon = item.animation_gif or item.full_transparent_icon or item.full_icon or item.display_icon
+    else:
+        item_icon = item.display_icon
+
+    if item_icon is not None:
+        embed.url = item_icon.url
+        embed.set_thumbnail(url=item_icon)
+
+    return embed
+
+
+def bundle_item_e(
+    item: BundleItem | FeaturedBundleItem,
+    is_featured: bool = False,
+    *,
+    locale: discord.Locale = discord.Locale.american_english,
+) -> Embed:
+    embed = embed_templates.get((item.uuid, locale, 'bundle_item'), lambda: _bundle_item_template_e(item, locale))
+    embed.description = f'{VALORANT_POINT_EMOJI} '
+
     is_melee = item.is_melee() if hasattr(item, 'is_melee') and isinstance(item, SkinLevel) else False
-    assert embed.description is not None
     if not is_featured or is_melee:
         embed.description += '{free} {price}'.format(
             free=(chat.bold('FREE') if is_featured else ''),
@@ -115,19 +134,6 @@ def bundle_item_e(
         else:
             embed.description += str(item.cost)
 
-    if isinstance(item, PlayerTitle):
-        item_icon = None
-    elif isinstance(item, PlayerCard):
-        item_icon = item.large_art
-    elif isinstance(item, Spray):
-        item_icon = item.animation_gif or item.full_transparent_icon or item.full_icon or item.display_icon
-    else:
-        item_icon = item.display_icon
-
-    if item_icon is not None:
-        embed.url = item_icon.url
-        embed.set_thumbnail(url=item_icon)
-
     return embed
 
 
@@ -205,7 +211,7 @@ class BundleEmbed:
     #     self.item_embeds = self.build_items_embeds()
 
 
-class FeaturedBundlePageSource(ListPageSource['Embed']):
+class FeaturedBundlePageSource(CachedListPageSource['Embed']):
     def __init__(self, bundle: FeaturedBundle, locale: discord.Locale) -> None:
         self.bundle: FeaturedBundle = bundle
         self.locale: discord.Locale = locale
@@ -223,6 +229,7 @@ class FeaturedBundlePageSource(ListPageSource['Embed']):
         self.bundle_embed.locale = self.locale
         self.entries = self.bundle_embed.build_items_embeds()
         self.embed = self.bundle_embed.build_banner_embed()
+        self.clear_cache()
 
 
 class FeaturedBundlePageView(LattePages):
@@ -1,21 +1,39 @@
 from __future__ import annotations
 
+import logging
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Hashable
 
 import discord
 
 from core.i18n import I18n
 from core.ui.embed import MiadEmbed as Embed
 from core.utils import chat_formatting as chat
-from valorantx2.enums import GameModeURL, RoundResultCode
+from core.utils.pages import CachedPageSource, LattePages
+from valorantx2.enums import GameModeURL
 
 from ..utils import locale_converter
 
 if TYPE_CHECKING:
-    # from core.bot import LatteMaid
+    from core.bot import LatteMaid
+    from valorantx2.career import CareerSummary
     from valorantx2.models import MatchPlayer
     from valorantx2.models.custom.match import MatchDetails
+    from valorantx2.valorant_api_client import ValorantAPIClient
+
+# fmt: off
+__all__ = (
+    'MatchDetailsEmbed',
+    'MatchDetailsPageSource',
+    'MatchDetailsView',
+    'career_summary_e',
+    'find_match_score_by_player',
+    'get_match_result_by_player',
+    'match_history_select_e',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
 
 _ = I18n('valorant.ui.carrier', Path(__file__).resolve().parent, read_only=True)
 
@@ -24,21 +42,20 @@ def find_match_score_by_player(match: MatchDetails, player: MatchPlayer) -> tupl
     left_team_score = 0
     right_team_score = 0
 
-    players = match.players
-    game_mode_url = match.match_info._game_mode_url
-    for team in match.teams:
-        if team.id == player.team_id:
-            left_team_score = team.rounds_won
+    for team_id, rounds_won in match.team_scores.items():
+        if team_id == player.team_id:
+            left_team_score = rounds_won
         else:
-            right_team_score = team.rounds_won
+            right_team_score = rounds_won
 
-    if game_mode_url == GameModeURL.deathmatch.value:
+    if match.match_info._game_mode_url == GameModeURL.deathmatch.value:
+        players = match.players_by_kills
         if player.is_winner():
-            _2nd_place = (sorted(players, key=lambda p: p.stats.kills, reverse=True)[1]) if len(players) > 1 else None
+            _2nd_place = players[1] if len(players) > 1 else None
             _1st_place = player
         else:
             _2nd_place = player
-            _1st_place = (sorted(players, key=lambda p: p.stats.kills, reverse=True)[0]) if len(players) > 0 else None
+            _1st_place = players[0] if len(players) > 0 else None
 
         left_team_score = (
             (_1st_place.stats.kills if player.is_winner() else _2nd_place is not None and _2nd_place.stats.kills)
@@ -61,24 +78,16 @@ def get_match_result_by_player(match: MatchDetails, player: MatchPlayer) -> str:
     if game_mode_url == GameModeURL.deathmatch.value:
         if player.is_winner():
             result = _('1ST PLACE')
-        else:
-            players = sorted(match.players, key=lambda p: p.stats.kills, reverse=True)
-            for i, p in enumerate(players, start=1):
-                player_before = players[i - 1]
-                player_after = players[i] if len(players) > i else None
-                if p == player:
-                    if i == 2:
-                        result = _('2ND PLACE')
-                    elif i == 3:
-                        result = _('3RD PLACE')
-                    else:
-                        result = _('{i}TH PLACE').format(i=i)
-
-                    if player_before is not None or player_after is not None:
-                        if player_before.stats.kills == p.stats.kills:
-                            result += _(' (TIED)')
-                        elif player_after is not None and player_after.stats.kills == p.stats.kills:
-                            result += _(' (TIED)')
+        elif (placement := match.placements.get(player.puuid)) is not None:
+            if placement.place == 2:
+                result = _('2ND PLACE')
+            elif placement.place == 3:
+                result = _('3RD PLACE')
+            else:
+                result = _('{i}TH PLACE').format(i=placement.place)
+
+            if placement.tied:
+                result += _(' (TIED)')
 
     elif not player.is_winner():
         result = _('DEFEAT')
@@ -153,6 +162,57 @@ def match_history_select_e(
     return embed
 
 
+def career_summary_e(
+    summary: CareerSummary,
+    *,
+    title: str,
+    agents: dict[str, CareerSummary],
+    maps: dict[str, CareerSummary],
+    valorant_api: ValorantAPIClient,
+    total: int | None = None,
+    locale: discord.Locale = discord.Locale.american_english,
+) -> Embed:
+    vlocale = locale_converter.to_valorant(locale)
+    embed = Embed(
+        title=title,
+        description='{matches} {w}W/{l}L/{d}D • {win_rate:.1f}%'.format(
+            matches=chat.bold(f'{summary.matches} Matches'),
+            w=summary.wins,
+            l=summary.losses,
+            d=summary.draws,
+            win_rate=summary.win_rate,
+        ),
+    ).purple()
+    embed.add_field(name='ACS', value=f'{summary.acs:.0f}')
+    embed.add_field(name='K/D', value=f'{summary.kd:.2f}')
+    embed.add_field(name='KDA', value=f'{summary.kda:.2f}')
+    embed.add_field(name='HS%', value=f'{summary.head_shot_percent:.1f}%')
+    embed.add_field(name='FK', value=str(summary.first_kills))
+
+    def display_agent(uuid: str) -> str:
+        agent = valorant_api.get_agent(uuid)
+        if agent is None:
+            return uuid
+        return f'{getattr(agent, "emoji", "")} {agent.display_name_localized(vlocale)}'.strip()
+
+    def display_rows(rows: dict[str, CareerSummary], display: Any) -> str:
+        top = sorted(rows.items(), key=lambda item: item[1].matches, reverse=True)[:5]
+        return '\n'.join(
+            f'{display(key)} • {row.matches} • {row.win_rate:.0f}% • {row.acs:.0f} ACS • {row.kda:.2f} KDA'
+            for key, row in top
+        )
+
+    if agents:
+        embed.add_field(name='Agents', value=display_rows(agents, display_agent), inline=False)
+    if maps:
+        # map ids are the map urls, e.g. /Game/Maps/Ascent/Ascent
+        embed.add_field(name='Maps', value=display_rows(maps, lambda map_id: map_id.rsplit('/', 1)[-1]), inline=False)
+    if total is not None and summary.matches < total:
+        # some details could not be fetched in time
+        embed.set_footer(text=_('{matches} of the last {total} matches').format(matches=summary.matches, total=total))
+    return embed
+
+
 # match details embed
 # below is so fk ugly code but i don't have any idea to make it better :(
 # but it works so i don't care
@@ -219,8 +279,8 @@ class MatchDetailsEmbed:
     ) -> Embed:
         vlocale = locale_converter.to_valorant(locale)
         embed = self.__template_e(player, locale=locale)
-        members = sorted(match.get_members(player), key=lambda p: p.stats.acs, reverse=True)
-        opponents = sorted(match.get_opponents(player), key=lambda p: p.stats.acs, reverse=True)
+        members = match.get_members_by_acs(player)
+        opponents = match.get_opponents_by_acs(player)
         if match.match_info._game_mode_url != GameModeURL.deathmatch.value:
             # MY TEAM
             myteam = '\n'.join([self.__display_player(player, p) for p in members])
@@ -253,7 +313,7 @@ class MatchDetailsEmbed:
             # page 2
 
         else:
-            players = sorted(self.match.players, key=lambda p: p.stats.score, reverse=True)
+            players = match.players_by_score
             embed.add_field(
                 name='Players',
                 value='\n'.join([self.__display_player(player, p) for p in players]),
@@ -261,16 +321,7 @@ class MatchDetailsEmbed:
             embed.add_field(name='SCORE', value='\n'.join([f'{p.stats.score}' for p in players]))
             embed.add_field(name='KDA', value='\n'.join([f'{p.stats.kda}' for p in players]))
 
-        timelines = []
-
-        for i, r in enumerate(self.match.round_results, start=1):
-            if i == 12:
-                timelines.append(' | ')
-
-            timelines.append(r.emoji_by_player(player))
-
-            if r.round_result_code == RoundResultCode.surrendered.value:
-                break
+        timelines = match.get_round_timeline(player)
 
         if match.match_info._game_mode_url not in [GameModeURL.escalation.value, GameModeURL.deathmatch.value]:
             if len(timelines) > 25:
@@ -289,8 +340,8 @@ class MatchDetailsEmbed:
         locale: discord.Locale,
     ) -> Embed:
         embed = self.__template_e(player, locale=locale)
-        members = sorted(match.get_members(player), key=lambda p: p.stats.acs, reverse=True)
-        opponents = sorted(match.get_opponents(player), key=lambda p: p.stats.acs, reverse=True)
+        members = match.get_members_by_acs(player)
+        opponents = match.get_opponents_by_acs(player)
 
         # MY TEAM
         embed.add_field(
@@ -323,27 +374,11 @@ class MatchDetailsEmbed:
         locale: discord.Locale,
     ) -> Embed:
         embed = self.__template_e(player, performance=True, locale=locale)
-        embed.add_field(
-            name='KDA',
-            value='\n'.join(
-                [
-                    p.kda
-                    for p in sorted(
-                        player.get_opponents_stats(),
-                        key=lambda p: p.opponent.display_name.lower(),
-                    )
-                ]
-            ),
-        )
+        opponents_stats = sorted(player.get_opponents_stats(), key=lambda p: p.opponent.display_name.lower())
+        embed.add_field(name='KDA', value='\n'.join(p.kda for p in opponents_stats))
         embed.add_field(
             name='Opponent',
-            value='\n'.join(
-                self.__display_player(player, p.opponent)
-                for p in sorted(
-                    player.get_opponents_stats(),
-                    key=lambda p: p.opponent.display_name.lower(),
-                )
-            ),
+            value='\n'.join(self.__display_player(player, p.opponent) for p in opponents_stats),
         )
 
         text = self.__display_abilities(player)
@@ -381,8 +416,8 @@ class MatchDetailsEmbed:
     def __build_page_1_m(self, match: MatchDetails, player: MatchPlayer, *, locale: discord.Locale) -> Embed:
         embed = self.__template_e(player, locale=locale)
 
-        members = sorted(match.get_members(player), key=lambda p: p.stats.acs, reverse=True)
-        opponents = sorted(match.get_opponents(player), key=lambda p: p.stats.acs, reverse=True)
+        members = match.get_members_by_acs(player)
+        opponents = match.get_opponents_by_acs(player)
 
         if match.match_info._game_mode_url != GameModeURL.deathmatch.value:
             # MY TEAM
@@ -403,25 +438,14 @@ class MatchDetailsEmbed:
                     inline=True,
                 )
         else:
-            players = sorted(match.players, key=lambda p: p.stats.score, reverse=True)
-            for p in players:
+            for p in match.players_by_score:
                 embed.add_field(
                     name=self.__display_player(player, p),
                     value=f'SCORE: {p.stats.score}\nKDA: {p.stats.kda}',
                     inline=True,
                 )
 
-        timelines = []
-
-        for i, r in enumerate(match.round_results, start=1):
-            # if r.result_code == valorantx.RoundResultCode.surrendered:
-            #     timelines.append('Surrendered')
-            #     break
-
-            if i == 12:
-                timelines.append(' | ')
-
-            timelines.append(r.emoji_by_player(player))
+        timelines = match.get_round_timeline(player)
 
         if match.match_info._game_mode_url not in [GameModeURL.escalation.value, GameModeURL.deathmatch.value]:
             # TODO: __contains__ is not implemented for GameModeType
@@ -436,8 +460,8 @@ class MatchDetailsEmbed:
     def __build_page_2_m(self, match: MatchDetails, player: MatchPlayer, *, locale: discord.Locale) -> Embed:
         embed = self.__template_e(player, locale=locale)
 
-        members = sorted(match.get_members(player), key=lambda p: p.stats.acs, reverse=True)
-        opponents = sorted(match.get_opponents(player), key=lambda p: p.stats.acs, reverse=True)
+        members = match.get_members_by_acs(player)
+        opponents = match.get_opponents_by_acs(player)
 
         # MY TEAM
         embed.add_field(name='\u200b', value=chat.bold('MY TEAM'))
@@ -550,6 +574,35 @@ class MatchDetailsEmbed:
 
     # build
 
+    def get_max_pages(self) -> int:
+        # deathmatch has no team page
+        return 2 if self.match.match_info._game_mode_url == GameModeURL.deathmatch.value else 3
+
+    def build_page(
+        self,
+        player: MatchPlayer,
+        page: int,
+        *,
+        mobile: bool = False,
+        locale: discord.Locale = discord.Locale.american_english,
+    ) -> Embed:
+        if not 0 <= page < self.get_max_pages():
+            raise IndexError(f'match details page {page} out of range')
+
+        if page == self.get_max_pages() - 1:
+            if mobile:
+                return self.__build_page_3_m(player, locale=locale)
+            return self.__build_page_3_d(player, locale=locale)
+
+        if page == 0:
+            if mobile:
+                return self.__build_page_1_m(self.match, player, locale=locale)
+            return self.__build_page_1_d(self.match, player, locale=locale)
+
+        if mobile:
+            return self.__build_page_2_m(self.match, player, locale=locale)
+        return self.__build_page_2_d(self.match, player, locale=locale)
+
     def build(
         self,
         puuid: str,
@@ -560,28 +613,84 @@ class MatchDetailsEmbed:
         if player is None:
             raise ValueError(f'player {puuid} was not in this match')
 
-        # desktop
+        pages = range(self.get_max_pages())
+        desktops = [self.build_page(player, page, locale=locale) for page in pages]
+        mobiles = [self.build_page(player, page, mobile=True, locale=locale) for page in pages]
+        return desktops, mobiles
 
-        desktops = [
-            self.__build_page_1_d(self.match, player, locale=locale),
-            # self.__build_page_2_d(self.match, player, locale=locale),
-            self.__build_page_3_d(player, locale=locale),
-        ]
 
-        # mobile
+class MatchDetailsPageSource(CachedPageSource):
+    """Renders the match details embeds of a player on demand.
 
-        mobiles = [
-            self.__build_page_1_m(self.match, player, locale=locale),
-            # self.__build_page_2_m(self.match, player, locale=locale),
-            self.__build_page_3_m(player, locale=locale),
-        ]
+    Each (player, page, layout, locale) embed is built once for the lifetime of the view.
+    """
 
-        # performance
-        if self.match.match_info._game_mode_url != GameModeURL.deathmatch.value:
-            desktops.insert(1, self.__build_page_2_d(self.match, player, locale=locale))
-            mobiles.insert(1, self.__build_page_2_m(self.match, player, locale=locale))
+    def __init__(self, match: MatchDetails, puuid: str, locale: discord.Locale) -> None:
+        player = match.get_player(puuid)
+        if player is None:
+            raise ValueError(f'player {puuid} was not in this match')
+        super().__init__()
+        self.match_embed: MatchDetailsEmbed = MatchDetailsEmbed(match)
+        self.player: MatchPlayer = player
+        self.locale: discord.Locale = locale
+        self._max_pages: int = self.match_embed.get_max_pages()
 
-        return desktops, mobiles
+    def is_paginating(self) -> bool:
+        return self._max_pages > 1
+
+    def get_max_pages(self) -> int:
+        return self._max_pages
+
+    async def get_page(self, page_number: int) -> int:
+        if not 0 <= page_number < self._max_pages:
+            raise IndexError(f'match details page {page_number} out of range')
+        return page_number
+
+    def get_cache_key(self, menu: MatchDetailsView, page_number: int) -> Hashable:
+        return (self.player.puuid, page_number, menu.is_on_mobile(), self.locale)
+
+    def format_page(self, menu: MatchDetailsView, page: int) -> Embed:
+        return self.match_embed.build_page(self.player, page, mobile=menu.is_on_mobile(), locale=self.locale)
+
+    def format_cached_page(self, menu: MatchDetailsView, page: int, key: Hashable) -> Embed:
+        _, _, mobile, locale = key  # type: ignore
+        return self.match_embed.build_page(self.player, page, mobile=mobile, locale=locale)
+
+
+class MatchDetailsView(LattePages):
+    source: MatchDetailsPageSource
+
+    def __init__(
+        self,
+        source: MatchDetailsPageSource,
+        *,
+        interaction: discord.Interaction[LatteMaid],
+        **kwargs: Any,
+    ) -> None:
+        self.__view_on_mobile__: bool = False
+        super().__init__(source, interaction=interaction, check_embeds=True, compact=True, **kwargs)
+
+    def fill_items(self) -> None:
+        super().fill_items()
+        self.remove_item(self.go_to_last_page)
+        self.remove_item(self.go_to_first_page)
+        self.remove_item(self.stop_pages)
+        self.add_item(self.toggle_ui)
+
+    def is_on_mobile(self) -> bool:
+        return self.__view_on_mobile__
+
+    async def interaction_check(self, interaction: discord.Interaction[LatteMaid], /) -> bool:
+        if await super().interaction_check(interaction):
+            self.source.locale = interaction.locale
+            return True
+        return False
+
+    @discord.ui.button(emoji='📱', style=discord.ButtonStyle.green)
+    async def toggle_ui(self, interaction: discord.Interaction[LatteMaid], button: discord.ui.Button) -> None:
+        button.emoji = '📱' if self.is_on_mobile() else '💻'
+        self.__view_on_mobile__ = not self.is_on_mobile()
+        await self.show_checked_page(interaction, self.current_page)
 
 
 # class SelectMatchHistory(ui.Select['CarrierView']):
@@ -698,80 +807,3 @@ class MatchDetailsEmbed:
 #         await self._init()
 #         await self.set_source()
 #         await self.start()
-
-
-# class MatchDetailsPageSource(ListPageSource):
-#     def __init__(self, match_details: MatchDetails, puuid: str, locale: discord.Locale) -> None:
-#         self.puuid = puuid
-#         self.locale = locale
-#         self.match_embed = e.MatchDetailsEmbed(match_details)
-#         super().__init__(self.build_entries(locale), per_page=1)
-
-#     def build_entries(self, locale: discord.Locale) -> list[tuple[Embed, Embed]]:
-#         entries = []
-#         try:
-#             desktops, mobiles = self.match_embed.build(self.puuid, locale=locale_converter.to_valorant(locale))
-#         except Exception as exc:
-#             _log.error(f'failed to build match details embed for {self.puuid}', exc_info=exc)
-#         else:
-#             for dt, mb in zip(desktops, mobiles):
-#                 entries.append((dt, mb))
-#         return entries
-
-#     def format_page(self, menu: MatchDetailsView, entries: tuple[Embed, Embed]) -> Embed:
-#         desktops, mobiles = entries
-
-#         # locale changed
-#         if menu.locale != self.locale:
-#             self.locale = menu.locale
-#             self.entries = self.build_entries(self.locale)
-#             desktops, mobiles = self.entries[menu.current_page]
-
-#         return mobiles if menu.is_on_mobile() else desktops
-
-
-# class MatchDetailsView(ViewAuthor, LattePages):
-#     __view_on_mobile__: bool = False
-
-#     def __init__(self, interaction: discord.Interaction[LatteMaid]) -> None:
-#         super().__init__(interaction)
-#         self.compact = True
-#         # self.source = source
-#         # self.carrier_view: Optional[CarrierView] = carrier_view
-#         # self.valorant_locale: ValorantLocale = locale_converter.to_valorant(interaction.locale)
-#         # self.back_to_home.label = _('Back', self.locale)
-
-#     def fill_items(self) -> None:
-#         # if self.carrier_view is not None:
-#         #     self.add_item(self.back_to_home)
-#         super().fill_items()
-#         self.remove_item(self.go_to_last_page)
-#         self.remove_item(self.go_to_first_page)
-#         self.remove_item(self.stop_pages)
-#         self.go_to_next_page.label = self.go_to_last_page.label
-#         self.go_to_previous_page.label = self.go_to_first_page.label
-#         # self.add_item(self.toggle_ui)
-
-#     def is_on_mobile(self) -> bool:
-#         return self.__view_on_mobile__
-
-#     # @ui.button(emoji='📱', style=ButtonStyle.green)
-#     # async def toggle_ui(self, interaction: discord.Interaction[LatteMaid], button: ui.Button) -> None:
-#     #     button.emoji = '📱' if self.is_on_mobile() else '💻'
-#     #     self.__view_on_mobile__ = not self.is_on_mobile()
-#     #     await self.show_checked_page(interaction, self.current_page)
-
-#     # @ui.button(label=_('Back'), style=ButtonStyle.gray, custom_id='home_button')
-#     # async def back_to_home(self, interaction: discord.Interaction[LatteMaid], button: ui.Button) -> None:
-#     #     # assert self.carrier_view is not None
-#     #     await interaction.response.defer()
-
-#     #     if self.carrier_view is None:
-#     #         return
-
-#     #     if self.message is None:
-#     #         return
-
-#     #     self.carrier_view.reset_timeout()
-
-#     #     await self.safe_edit_message(self.message, embeds=self.carrier_view.embeds, view=self.carrier_view)
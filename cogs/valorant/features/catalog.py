@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Sequence
+
+import discord
+
+import core.utils.chat_formatting as chat
+from core.ui.embed import MiadEmbed as Embed
+from core.utils.pages import LattePages, ListPageSource
+from valorantx2.models import PlayerCard, PlayerTitle, Skin, SkinChroma, SkinLevel, Spray
+
+from ..utils import locale_converter
+from .storefront import skin_e
+
+if TYPE_CHECKING:
+    from core.bot import LatteMaid
+    from valorantx2.valorant_api_client import ValorantAPIClient
+
+# fmt: off
+__all__ = (
+    'SkinCatalogView',
+    'catalog_item_e',
+    'get_catalog_item',
+    'search_catalog',
+)
+# fmt: on
+
+
+def get_catalog_item(valorant_api: ValorantAPIClient, kind: str, uuid: str) -> Any | None:
+    return getattr(valorant_api, f'get_{kind}')(uuid)
+
+
+def search_catalog(
+    valorant_api: ValorantAPIClient,
+    kind: str,
+    current: str,
+    *,
+    locale: discord.Locale,
+    limit: int = 25,
+) -> list[discord.app_commands.Choice[str]]:
+    index = valorant_api.get_search_index(kind, locale_converter.to_valorant(locale))
+    return [discord.app_commands.Choice(name=name[:100], value=uuid) for name, uuid in index.search(current, limit)]
+
+
+def catalog_item_e(item: Any, *, locale: discord.Locale = discord.Locale.american_english) -> Embed:
+    if isinstance(item, (Skin, SkinLevel, SkinChroma)):
+        return skin_e(item, locale=locale)
+
+    valorant_locale = locale_converter.to_valorant(locale)
+    embed = Embed(title=chat.bold(item.display_name_localized(valorant_locale))).purple()
+
+    if isinstance(item, PlayerTitle):
+        item_icon = None
+    elif isinstance(item, PlayerCard):
+        item_icon = item.large_art
+    elif isinstance(item, Spray):
+        item_icon = item.animation_gif or item.full_transparent_icon or item.full_icon or item.display_icon
+    else:
+        item_icon = item.display_icon
+
+    if item_icon is not None:
+        embed.url = item_icon.url
+        embed.set_thumbnail(url=item_icon)
+
+    return embed
+
+
+class SkinCatalogPageSource(ListPageSource[Skin]):
+    def __init__(self, skins: Sequence[Skin], locale: discord.Locale) -> None:
+        # skins is usually a lazy FacetSelection, only the shown page is materialized
+        super().__init__(skins, per_page=5)
+        self.locale: discord.Locale = locale
+
+    async def format_page(self, menu: SkinCatalogView, entries: list[Skin]) -> list[Embed]:
+        embeds = [
+            Embed(description=f'{len(self.entries)} skins • {menu.current_page + 1}/{self.get_max_pages()}').purple(),
+        ]
+        embeds.extend(skin_e(skin, locale=self.locale) for skin in entries)
+        return embeds
+
+
+class SkinCatalogView(LattePages):
+    source: SkinCatalogPageSource
+
+    def __init__(self, source: SkinCatalogPageSource, *, interaction: discord.Interaction[LatteMaid], **kwargs: Any):
+        super().__init__(source, interaction=interaction, check_embeds=True, compact=True, **kwargs)
+
+    async def interaction_check(self, interaction: discord.Interaction[LatteMaid], /) -> bool:
+        if await super().interaction_check(interaction):
+            self.source.locale = interaction.locale
+            return True
+        return False
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Hashable
 
 import discord
 
 from core.ui.embed import MiadEmbed as Embed
-from core.utils.pages import LattePages, ListPageSource
+from core.utils.pages import CachedListPageSource, LattePages
 from valorantx2.enums import RelationType
 from valorantx2.models import PlayerCard, PlayerTitle, SkinLevel
 
 from ..utils import locale_converter
-from .base import BaseView
+from .base import BaseView, embed_templates
 
 # fmt: off
 __all__ = (
@@ -42,13 +42,10 @@ class GamePassEmbed:
         elif self.contract.content.relation_type is RelationType.event:
             self.title = 'Eventpass'
 
-    # @cache ?
-    def build_page_embed(self, page: int, reward: RewardValorantAPI, locale: discord.Locale | None = None) -> Embed:
-        locale = locale or self.locale
-
+    def _build_page_template(self, page: int, reward: RewardValorantAPI, locale: discord.Locale) -> Embed:
         valorant_locale = locale_converter.to_valorant(locale)
 
-        embed = Embed(title=f'{self.title} // {self.riot_id}')
+        embed = Embed()
         embed.set_footer(text=f'TIER {page + 1} | {self.contract.display_name_localized(valorant_locale)}')
         item = reward.get_item()
         if item is not None:
@@ -65,15 +62,34 @@ class GamePassEmbed:
                         embed.set_thumbnail(url=item.display_icon)
         return embed
 
+    def build_page_embed(self, page: int, reward: RewardValorantAPI, locale: discord.Locale | None = None) -> Embed:
+        locale = locale or self.locale
+        key = (self.contract.uuid, page, locale, 'gamepass')
+        embed = embed_templates.get(key, lambda: self._build_page_template(page, reward, locale))  # type: ignore
+        embed.title = f'{self.title} // {self.riot_id}'
+        return embed
+
 
-class GamePassPageSource(ListPageSource['RewardValorantAPI']):
+class GamePassPageSource(CachedListPageSource['RewardValorantAPI']):
     def __init__(self, contract: Contract, riot_id: str, locale: discord.Locale) -> None:
         self.embed = GamePassEmbed(contract, riot_id, locale=locale)
         super().__init__(contract.content.get_all_rewards(), per_page=1)
 
-    async def format_page(self, menu: GamePassView, page: Any):
-        reward = self.entries[menu.current_page]
-        return self.embed.build_page_embed(menu.current_page, reward, locale=menu.locale)
+    async def get_page(self, page_number: int) -> int:
+        # the tier number is part of the embed
+        if not 0 <= page_number < len(self.entries):
+            raise IndexError(f'gamepass page {page_number} out of range')
+        return page_number
+
+    def get_cache_key(self, menu: GamePassView, page_number: int) -> Hashable:
+        return (page_number, menu.locale)
+
+    async def format_page(self, menu: GamePassView, page: int):
+        return self.embed.build_page_embed(page, self.entries[page], locale=menu.locale)
+
+    async def format_cached_page(self, menu: GamePassView, page: int, key: Hashable):
+        _, locale = key  # type: ignore
+        return self.embed.build_page_embed(page, self.entries[page], locale=locale)
 
 
 class GamePassView(BaseView, LattePages):
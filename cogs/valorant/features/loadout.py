@@ -13,16 +13,16 @@ from core.utils.pages import ListPageSource
 from valorantx2.models import SkinChroma
 
 from ..utils import locale_converter
-from .base import BaseView, ValorantPageSource
+from .base import embed_templates
+from .persistent import PersistentContext, PersistentFeature, PersistentState, register_feature
 
 # fmt: off
 __all__ = (
-    'CollectionView',
+    'CollectionFeature',
 )
 # fmt: on
 
 if TYPE_CHECKING:
-    from core.bot import LatteMaid
     from valorantx2.auth import RiotAuth
     from valorantx2.models import Gun, GunsLoadout, Loadout, Spray
 
@@ -68,27 +68,36 @@ def collection_front_e(
     return embed
 
 
-def skin_loadout_e(gun: Gun, *, locale: discord.Locale = discord.Locale.american_english) -> Embed:
+def _skin_loadout_template_e(gun: Gun, locale: discord.Locale) -> Embed:
     assert gun.skin_loadout is not None
+    skin = gun.skin_loadout
 
     vlocale = locale_converter.to_valorant(locale)
-    skin_name: str = gun.skin_loadout.display_name.from_locale(vlocale)
-    if isinstance(gun.skin_loadout, SkinChroma) and gun.skin_loadout.parent is not None:
-        skin_name = gun.skin_loadout.parent.display_name.from_locale(vlocale)
+    skin_name: str = skin.display_name.from_locale(vlocale)
+    if isinstance(skin, SkinChroma) and skin.parent is not None:
+        skin_name = skin.parent.display_name.from_locale(vlocale)
 
-    rarity = gun.skin_loadout.rarity
+    rarity = skin.rarity
 
     embed = Embed(
-        description=(rarity.emoji if rarity is not None else '')  # type: ignore
-        + ' '
-        + chat.bold(skin_name)
-        + (' ★' if gun.skin_loadout.is_favorite() else ''),
+        description=(rarity.emoji if rarity is not None else '') + ' ' + chat.bold(skin_name),  # type: ignore
         colour=int(rarity.highlight_color[0:6], 16) if rarity is not None else 0x0F1923,
     ).dark()
 
-    embed.set_thumbnail(url=gun.skin_loadout.display_icon_fix)
+    embed.set_thumbnail(url=skin.display_icon_fix)
+    return embed
+
+
+def skin_loadout_e(gun: Gun, *, locale: discord.Locale = discord.Locale.american_english) -> Embed:
+    assert gun.skin_loadout is not None
+    skin = gun.skin_loadout
+
+    embed = embed_templates.get((skin.uuid, locale, 'skin_loadout'), lambda: _skin_loadout_template_e(gun, locale))
+    if skin.is_favorite():
+        embed.description += ' ★'  # type: ignore
 
     if gun.buddy_loadout is not None:
+        vlocale = locale_converter.to_valorant(locale)
         buddy_name = gun.buddy_loadout.display_name.from_locale(vlocale)
         embed.set_footer(
             text=f'{buddy_name}' + (' ★' if gun.buddy_loadout.is_favorite() else ''),
@@ -112,26 +121,6 @@ def spray_loadout_e(
     return embed
 
 
-class CollectionFrontPageSource(ValorantPageSource):
-    def __init__(self) -> None:
-        super().__init__()
-        self.loadout: Loadout | None = None
-        self.skin_source: SkinCollectionSource | None = None
-        self.embed: Embed | None = None
-
-    async def format_page_valorant(self, view: BaseView, page: int, riot_auth: RiotAuth) -> Embed:
-        self.loadout = await view.valorant_client.fetch_loudout(riot_auth)
-        if self.loadout.guns is not None:
-            self.skin_source = SkinCollectionSource(self.loadout.guns)
-        self.embed = collection_front_e(
-            self.loadout,
-            # mmr,
-            riot_auth.riot_id,
-            locale=view.locale,
-        )
-        return self.embed
-
-
 class SkinCollectionSource(ListPageSource):
     def __init__(self, gun_loadout: GunsLoadout):
         def gun_priority(gun: Gun) -> int:
@@ -186,209 +175,73 @@ class SkinCollectionSource(ListPageSource):
                 return 18
 
         super().__init__(sorted(list(gun_loadout.to_list()), key=gun_priority), per_page=4)
-        self.current_page: int = 0
 
     async def format_page(
         self,
-        view: CollectionView,
+        view: PersistentContext,
         entries: list[Gun],
     ) -> list[Embed]:
         return [skin_loadout_e(skin, locale=view.locale) for skin in entries]
 
 
-class CollectionView(BaseView):
-    def __init__(self, interaction: discord.Interaction[LatteMaid]) -> None:
-        super().__init__(interaction)
-        self.source: CollectionFrontPageSource = CollectionFrontPageSource()
-        self.skin_prev_button = CollectionSkinPrevButton()
-        self.skin_next_button = CollectionSkinNextButton()
-
-    def _fill_components(self) -> None:
-        self.add_items(
-            CollectionSkinsButton(label=_('button.collection.skins', self.locale)),
-            CollectionSpraysButton(label=_('button.collection.sprays', self.locale)),
-        )
-
-    async def _init(self) -> None:
-        self._fill_components()
-        await super()._init()
-
-    # skin pages
-
-    async def show_skin_checked_page(self, interaction: discord.Interaction[LatteMaid], page_number: int) -> None:
-        if self.source.skin_source is None:
-            return
-        max_pages = self.source.skin_source.get_max_pages()
-        try:
-            if max_pages > page_number >= 0:
-                await self.show_skin_page(interaction, page_number)
-        except IndexError:
-            # An error happened that can be handled, so ignore it.
-            pass
-
-    async def show_skin_page(self, interaction: discord.Interaction[LatteMaid], page_number: int) -> None:
-        assert self.source.skin_source is not None
-        source = self.source.skin_source
-        page = await source.get_page(page_number)
-        source.current_page = page_number
-        embeds = await source.format_page(self, page)
-
-        # update buttons
-        self.skin_prev_button.disabled = page_number == 0
-        self.skin_next_button.disabled = page_number == 4
-
-        if interaction.response.is_done():
-            if self.message:
-                await self.message.edit(embeds=embeds, view=self)
-        else:
-            await interaction.response.edit_message(embeds=embeds, view=self)
-
-
-class CollectionSkinsButton(ui.Button['CollectionView']):
-    def __init__(
-        self,
-        *,
-        style: ButtonStyle = ButtonStyle.primary,
-        label: str | None = None,
-        disabled: bool = False,
-        custom_id: str | None = None,
-        # emoji: str | Emoji | PartialEmoji | None = None,
-    ):
-        super().__init__(
-            style=style, label=label, disabled=disabled, custom_id=custom_id, emoji='<:discordsagegun:1104332724631765043>'
-        )
-
-    async def callback(self, interaction: discord.Interaction[LatteMaid]) -> Any:
-        assert self.view is not None
-        assert self.view.message is not None
-        assert self.view.source.loadout is not None
-        assert self.view.source.skin_source is not None
-
-        await interaction.response.defer()
-        if self.view.source.loadout.guns is None:
-            return
-
-        self.view.clear_items()
-        self.view.add_items(
-            self.view.skin_prev_button,
-            self.view.skin_next_button,
-            CollectionBackToFrontButton(row=1),
-        )
-
-        await self.view.show_skin_page(interaction, 0)
-
-
-class CollectionSkinNextButton(ui.Button['CollectionView']):
-    def __init__(
-        self,
-        *,
-        style: ButtonStyle = ButtonStyle.primary,
-        disabled: bool = False,
-        custom_id: str | None = None,
-        url: str | None = None,
-        # emoji: str | Emoji | PartialEmoji | None = None,
-        row: int | None = None,
-    ):
-        super().__init__(style=style, label='≫', disabled=disabled, custom_id=custom_id, url=url, row=row)
-
-    async def callback(self, interaction: discord.Interaction[LatteMaid]) -> Any:
-        assert self.view is not None
-        assert self.view.message is not None
-        assert self.view.source.skin_source is not None
-
-        await interaction.response.defer()
-
-        await self.view.show_skin_page(interaction, self.view.source.skin_source.current_page + 1)
-
-
-class CollectionSkinPrevButton(ui.Button['CollectionView']):
-    def __init__(
-        self,
-        *,
-        style: ButtonStyle = ButtonStyle.primary,
-        disabled: bool = False,
-        custom_id: str | None = None,
-        url: str | None = None,
-        # emoji: str | Emoji | PartialEmoji | None = None,
-        row: int | None = None,
-    ):
-        super().__init__(style=style, label='≪', disabled=disabled, custom_id=custom_id, url=url, row=row)
-
-    async def callback(self, interaction: discord.Interaction[LatteMaid]) -> Any:
-        assert self.view is not None
-        assert self.view.message is not None
-        assert self.view.source.skin_source is not None
-
-        await interaction.response.defer()
-
-        await self.view.show_skin_page(interaction, self.view.source.skin_source.current_page - 1)
-
-
-class CollectionSpraysButton(ui.Button['CollectionView']):
-    def __init__(
-        self,
-        *,
-        style: ButtonStyle = ButtonStyle.primary,
-        label: str | None = None,
-        disabled: bool = False,
-        custom_id: str | None = None,
-        # emoji: str | Emoji | PartialEmoji | None = None,
-    ):
-        super().__init__(
-            style=style,
-            label=label,
-            disabled=disabled,
-            custom_id=custom_id,
-            emoji='<:spray:971941939190595667>',
-        )
-
-    async def callback(self, interaction: discord.Interaction[LatteMaid]) -> Any:
-        assert self.view is not None
-        assert self.view.message is not None
-        assert self.view.source.loadout is not None
-
-        await interaction.response.defer()
-        sprays = self.view.source.loadout.sprays
-        if sprays is None:
-            return
-
-        self.view.clear_items()
-        self.view.add_item(CollectionBackToFrontButton())
-
-        embeds = []
-        for slot, spray in enumerate(sprays.to_list(), start=1):
-            if spray is None:
-                continue
-            embed = spray_loadout_e(spray, slot, locale=interaction.locale)
-
-            # if embed._thumbnail.get('url'):
-            #     color_thief = await self.bot.get_or_fetch_colors(spray.uuid, embed._thumbnail['url'])
-            #     embed.colour = random.choice(color_thief)
-
-            embeds.append(embed)
+class CollectionFeature(PersistentFeature):
+    """The collection pages, driven by persistent components.
 
-        await self.view.message.edit(embeds=embeds, view=self.view)
+    Page 0 is the front page, the skins pages follow and the sprays page is the last one.
+    """
 
+    name = 'collection'
 
-class CollectionBackToFrontButton(ui.Button['CollectionView']):
-    def __init__(
+    async def render(
         self,
-        *,
-        disabled: bool = False,
-        custom_id: str | None = None,
-        # emoji: str | Emoji | PartialEmoji | None = None,
-        row: int | None = None,
-    ):
-        super().__init__(label='<', style=ButtonStyle.secondary, disabled=disabled, custom_id=custom_id, row=row)
-
-    async def callback(self, interaction: discord.Interaction[LatteMaid]) -> Any:
-        assert self.view is not None
-        assert self.view.message is not None
-        assert self.view.source.embed is not None
-
-        await interaction.response.defer()
-        self.view.clear_items()
-        self.view._fill_components()
-        self.view._fill_account_select()
-
-        await self.view.message.edit(embed=self.view.source.embed, view=self.view)
+        context: PersistentContext,
+        state: PersistentState,
+        riot_auth: RiotAuth,
+    ) -> tuple[Any, list[ui.Item[Any]]]:
+        locale = context.locale
+        loadout = await context.valorant_client.fetch_loudout(riot_auth)
+        skin_source = SkinCollectionSource(loadout.guns) if loadout.guns is not None else None
+        skin_pages = skin_source.get_max_pages() if skin_source is not None else 0
+        sprays_page = skin_pages + 1
+        page = state.page
+
+        if skin_source is not None and 1 <= page <= skin_pages:
+            value = await skin_source.format_page(context, await skin_source.get_page(page - 1))
+            items: list[ui.Item[Any]] = [
+                self.page_button(state, page - 1, slot=0, label='≪', disabled=page == 1),
+                self.page_button(state, page + 1, slot=1, label='≫', disabled=page == skin_pages),
+                self.page_button(state, 0, slot=2, label='<', style=ButtonStyle.secondary, row=1),
+            ]
+            return value, items
+
+        if page == sprays_page and loadout.sprays is not None:
+            embeds = [
+                spray_loadout_e(spray, slot, locale=locale)
+                for slot, spray in enumerate(loadout.sprays.to_list(), start=1)
+                if spray is not None
+            ]
+            return embeds, [self.page_button(state, 0, label='<', style=ButtonStyle.secondary)]
+
+        embed = collection_front_e(loadout, riot_auth.riot_id, locale=locale)
+        items = [
+            self.page_button(
+                state,
+                1,
+                slot=0,
+                label=_('button.collection.skins', locale),
+                emoji='<:discordsagegun:1104332724631765043>',
+                disabled=skin_source is None,
+            ),
+            self.page_button(
+                state,
+                sprays_page,
+                slot=1,
+                label=_('button.collection.sprays', locale),
+                emoji='<:spray:971941939190595667>',
+                disabled=loadout.sprays is None,
+            ),
+        ]
+        return embed, items
+
+
+register_feature(CollectionFeature())
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import io
+import logging
+from typing import NamedTuple, Sequence
+
+from core.utils.render_cache import RenderCache
+
+# fmt: off
+__all__ = (
+    'MMRChartRenderer',
+    'MMRPoint',
+    'mmr_chart_renderer',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
+WIDTH = 960
+HEIGHT = 360
+PADDING = 48
+BACKGROUND = (15, 25, 35)
+GRID_COLOUR = (45, 58, 70)
+TEXT_COLOUR = (236, 232, 225)
+LINE_COLOUR = (255, 70, 85)
+
+
+class MMRPoint(NamedTuple):
+    recorded_at: datetime.datetime
+    tier: int
+    rr: int
+
+    @property
+    def value(self) -> int:
+        # rr resets at each tier, so a tier is worth 100 rr on the chart
+        return self.tier * 100 + self.rr
+
+
+def _render(points: Sequence[MMRPoint]) -> bytes:
+    from PIL import Image, ImageDraw, ImageFont
+
+    image = Image.new('RGB', (WIDTH, HEIGHT), BACKGROUND)
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default()
+
+    values = [point.value for point in points]
+    # whole tiers around the points
+    low = (min(values) // 100) * 100
+    high = (max(values) // 100 + 1) * 100
+    span = high - low
+
+    def y(value: int) -> float:
+        return HEIGHT - PADDING - (value - low) / span * (HEIGHT - PADDING * 2)
+
+    def x(index: int) -> float:
+        if len(points) == 1:
+            return WIDTH / 2
+        return PADDING + index / (len(points) - 1) * (WIDTH - PADDING * 2)
+
+    for value in range(low, high + 1, 100):
+        draw.line((PADDING, y(value), WIDTH - PADDING, y(value)), fill=GRID_COLOUR, width=1)
+        draw.text((8, y(value) - 6), str(value // 100), font=font, fill=TEXT_COLOUR)
+
+    coordinates = [(x(index), y(value)) for index, value in enumerate(values)]
+    if len(coordinates) > 1:
+        draw.line(coordinates, fill=LINE_COLOUR, width=3, joint='curve')
+    for cx, cy in coordinates:
+        draw.ellipse((cx - 4, cy - 4, cx + 4, cy + 4), fill=LINE_COLOUR)
+
+    last = points[-1]
+    draw.text((PADDING, 12), f'{last.rr} RR', font=font, fill=TEXT_COLOUR)
+    draw.text((PADDING, HEIGHT - PADDING + 12), points[0].recorded_at.strftime('%Y-%m-%d'), font=font, fill=TEXT_COLOUR)
+    draw.text(
+        (WIDTH - PADDING - 64, HEIGHT - PADDING + 12),
+        last.recorded_at.strftime('%Y-%m-%d'),
+        font=font,
+        fill=TEXT_COLOUR,
+    )
+
+    fp = io.BytesIO()
+    image.save(fp, format='PNG', optimize=True)
+    return fp.getvalue()
+
+
+class MMRChartRenderer:
+    """Draws the rank history of a player.
+
+    Rendering runs in the default executor and the result is cached by the
+    player and their last point, a new competitive update renders a new chart.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._images: RenderCache[tuple[str, MMRPoint, int]] = RenderCache(maxsize)
+
+    def clear(self) -> None:
+        self._images.clear()
+
+    async def render(self, puuid: str, points: Sequence[MMRPoint]) -> bytes:
+        """|coro|
+
+        Returns the PNG bytes of the chart, ``points`` are ordered oldest first.
+        """
+        if not points:
+            raise ValueError('no points to draw')
+
+        points = list(points)
+        key = (puuid, points[-1], len(points))
+        loop = asyncio.get_running_loop()
+        # concurrent requests for the same chart wait for a single render
+        return await self._images.get_or_render(key, lambda: loop.run_in_executor(None, _render, points))
+
+
+mmr_chart_renderer: MMRChartRenderer = MMRChartRenderer()
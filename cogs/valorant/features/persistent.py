@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import discord
+from discord import ui
+
+from core.i18n import I18n
+
+from ..account_manager import AccountManager
+from .base import valorant_page_kwargs
+
+if TYPE_CHECKING:
+    import re
+
+    from typing_extensions import Self
+
+    from core.bot import LatteMaid
+    from valorantx2.auth import RiotAuth
+    from valorantx2.client import Client as ValorantClient
+
+# fmt: off
+__all__ = (
+    'PersistentAccountSelect',
+    'PersistentContext',
+    'PersistentFeature',
+    'PersistentPageButton',
+    'PersistentState',
+    'account_managers',
+    'persistent_features',
+    'register_feature',
+    'start_persistent',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+_ = I18n('valorant.features.persistent', Path(__file__).resolve().parent, read_only=True)
+
+# lm:<feature>:<author id>:<puuid>:<page>:<slot>, the slot keeps the custom ids of a message unique
+PAGE_TEMPLATE = r'lm:(?P<feature>[a-z_]+):(?P<author_id>[0-9]+):(?P<puuid>[0-9a-f-]+):(?P<page>[0-9]+):(?P<slot>[0-9]+)'
+# lm:<feature>:<author id>:account, the selected value is the puuid
+ACCOUNT_TEMPLATE = r'lm:(?P<feature>[a-z_]+):(?P<author_id>[0-9]+):account'
+
+# the accounts of a user are kept between clicks for this long, in seconds
+ACCOUNT_MANAGER_TTL = 60 * 10
+ACCOUNT_MANAGER_MAXSIZE = 256
+
+
+class PersistentState(NamedTuple):
+    feature: str
+    author_id: int
+    puuid: str
+    page: int
+
+    def to_custom_id(self, *, slot: int = 0) -> str:
+        return f'lm:{self.feature}:{self.author_id}:{self.puuid}:{self.page}:{slot}'
+
+
+class PersistentContext:
+    """Stands in for the view when a page is formatted from a component."""
+
+    def __init__(self, bot: LatteMaid, locale: discord.Locale, message: discord.Message | None = None) -> None:
+        self.bot: LatteMaid = bot
+        self.locale: discord.Locale = locale
+        self.message: discord.Message | None = message
+
+    @property
+    def valorant_client(self) -> ValorantClient:
+        return self.bot.valorant_client
+
+
+class _AccountManagers:
+    """The account managers of the users who recently clicked a persistent component."""
+
+    def __init__(self) -> None:
+        self._managers: dict[int, tuple[float, AccountManager]] = {}
+
+    async def get(self, bot: LatteMaid, author_id: int) -> AccountManager | None:
+        entry = self._managers.pop(author_id, None)
+        if entry is not None and entry[0] > time.monotonic():
+            self._managers[author_id] = entry
+            return entry[1]
+
+        user = await bot.db.fetch_user(author_id)
+        if user is None:
+            return None
+        manager = AccountManager(user, bot=bot, re_authorize=False)
+        await manager.wait_until_ready()
+
+        if len(self._managers) >= ACCOUNT_MANAGER_MAXSIZE:
+            del self._managers[next(iter(self._managers))]
+        self._managers[author_id] = (time.monotonic() + ACCOUNT_MANAGER_TTL, manager)
+        return manager
+
+    def invalidate(self, author_id: int) -> None:
+        self._managers.pop(author_id, None)
+
+    def clear(self) -> None:
+        self._managers.clear()
+
+
+account_managers: _AccountManagers = _AccountManagers()
+
+
+class PersistentFeature:
+    """A message whose state lives in the custom ids of its components.
+
+    Nothing is kept in memory per message, a click rebuilds the page from the
+    state and the cached valorant data, so the components keep working after a restart.
+    """
+
+    name: str
+
+    async def render(
+        self,
+        context: PersistentContext,
+        state: PersistentState,
+        riot_auth: RiotAuth,
+    ) -> tuple[Any, list[ui.Item[Any]]]:
+        """|coro|
+
+        Formats the page of the state, returns the page and its components.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def page_button(
+        state: PersistentState,
+        page: int,
+        *,
+        slot: int = 0,
+        label: str | None = None,
+        emoji: str | None = None,
+        style: discord.ButtonStyle = discord.ButtonStyle.primary,
+        disabled: bool = False,
+        row: int | None = None,
+    ) -> PersistentPageButton:
+        return PersistentPageButton(
+            state._replace(page=page),
+            slot=slot,
+            label=label,
+            emoji=emoji,
+            style=style,
+            disabled=disabled,
+            row=row,
+        )
+
+
+persistent_features: dict[str, PersistentFeature] = {}
+
+
+def register_feature(feature: PersistentFeature) -> PersistentFeature:
+    persistent_features[feature.name] = feature
+    return feature
+
+
+async def _build_message(
+    bot: LatteMaid,
+    state: PersistentState,
+    locale: discord.Locale,
+    *,
+    message: discord.Message | None = None,
+) -> dict[str, Any]:
+    manager = await account_managers.get(bot, state.author_id)
+    riot_auth = manager.get_account(state.puuid) if manager is not None else None
+    if manager is None or riot_auth is None:
+        kwargs: dict[str, Any] = {'content': _('No data found', locale), 'embeds': []}
+        if message is not None:
+            kwargs.update(attachments=[], view=None)
+        return kwargs
+
+    feature = persistent_features[state.feature]
+    context = PersistentContext(bot, locale, message)
+    value, items = await feature.render(context, state, riot_auth)
+    kwargs = valorant_page_kwargs(value, edit=message is not None)
+    if message is not None:
+        kwargs.setdefault('attachments', [])
+
+    # nothing keeps a reference to this view, the clicks are dispatched to the dynamic items
+    view = ui.View(timeout=None)
+    for item in items:
+        view.add_item(item)
+    if len(manager.accounts) > 1:
+        view.add_item(PersistentAccountSelect(state, manager.accounts))
+    kwargs['view'] = view
+    return kwargs
+
+
+async def _edit_persistent(interaction: discord.Interaction[LatteMaid], state: PersistentState) -> None:
+    await interaction.response.defer()
+    kwargs = await _build_message(interaction.client, state, interaction.locale, message=interaction.message)
+    await interaction.edit_original_response(**kwargs)
+
+
+async def start_persistent(interaction: discord.Interaction[LatteMaid], feature: str, *, page: int = 0) -> None:
+    """|coro|
+
+    Sends the first page of the feature for the main account of the user.
+    """
+    await interaction.response.defer()
+    manager = await account_managers.get(interaction.client, interaction.user.id)
+    if manager is None:
+        await interaction.followup.send(_('No data found', interaction.locale))
+        return
+    if manager.main_account is None:
+        raise ValueError('No accounts found')
+
+    state = PersistentState(feature, interaction.user.id, manager.main_account.puuid, page)
+    kwargs = await _build_message(interaction.client, state, interaction.locale)
+    # a persistent message can be edited at any time, the urls of its attachments are never reused
+    await interaction.followup.send(**kwargs)
+
+
+async def _check_author(interaction: discord.Interaction[LatteMaid], author_id: int) -> bool:
+    if interaction.user.id == author_id or await interaction.client.is_owner(interaction.user):
+        return True
+    await interaction.response.send_message(
+        _('This menu cannot be controlled by you, sorry!', interaction.locale),
+        ephemeral=True,
+    )
+    return False
+
+
+class PersistentPageButton(ui.DynamicItem[ui.Button], template=PAGE_TEMPLATE):
+    def __init__(
+        self,
+        state: PersistentState,
+        *,
+        slot: int = 0,
+        label: str | None = None,
+        emoji: str | None = None,
+        style: discord.ButtonStyle = discord.ButtonStyle.primary,
+        disabled: bool = False,
+        row: int | None = None,
+    ) -> None:
+        super().__init__(
+            ui.Button(
+                label=label,
+                emoji=emoji,
+                style=style,
+                disabled=disabled,
+                custom_id=state.to_custom_id(slot=slot),
+            ),
+            row=row,
+        )
+        self.state: PersistentState = state
+
+    @classmethod
+    async def from_custom_id(
+        cls,
+        interaction: discord.Interaction[LatteMaid],
+        item: ui.Button,
+        match: re.Match[str],
+        /,
+    ) -> Self:
+        state = PersistentState(match['feature'], int(match['author_id']), match['puuid'], int(match['page']))
+        return cls(state, slot=int(match['slot']))
+
+    async def interaction_check(self, interaction: discord.Interaction[LatteMaid], /) -> bool:
+        return await _check_author(interaction, self.state.author_id)
+
+    async def callback(self, interaction: discord.Interaction[LatteMaid]) -> None:
+        try:
+            await _edit_persistent(interaction, self.state)
+        except Exception as e:
+            interaction.client.dispatch('view_error', interaction, e, self)
+
+
+class PersistentAccountSelect(ui.DynamicItem[ui.Select], template=ACCOUNT_TEMPLATE):
+    def __init__(self, state: PersistentState, accounts: list[RiotAuth] | None = None) -> None:
+        options = [
+            discord.SelectOption(
+                label=account.display_name or account.riot_id,
+                value=account.puuid,
+                default=account.puuid == state.puuid,
+            )
+            for account in accounts or []
+        ]
+        super().__init__(
+            ui.Select(
+                options=options or [discord.SelectOption(label='-', value='-')],
+                custom_id=f'lm:{state.feature}:{state.author_id}:account',
+            ),
+            row=4,
+        )
+        self.state: PersistentState = state
+
+    @classmethod
+    async def from_custom_id(
+        cls,
+        interaction: discord.Interaction[LatteMaid],
+        item: ui.Select,
+        match: re.Match[str],
+        /,
+    ) -> Self:
+        # the puuid is the selected value
+        return cls(PersistentState(match['feature'], int(match['author_id']), '', 0))
+
+    async def interaction_check(self, interaction: discord.Interaction[LatteMaid], /) -> bool:
+        return await _check_author(interaction, self.state.author_id)
+
+    async def callback(self, interaction: discord.Interaction[LatteMaid]) -> None:
+        values = (interaction.data or {}).get('values') or []  # type: ignore
+        if not values:
+            await interaction.response.defer()
+            return
+        try:
+            await _edit_persistent(interaction, self.state._replace(puuid=values[0]))
+        except Exception as e:
+            interaction.client.dispatch('view_error', interaction, e, self)
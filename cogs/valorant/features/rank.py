@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import discord
+
+from core.i18n import I18n
+from core.ui.embed import MiadEmbed as Embed
+
+from ..utils import locale_converter
+from .base import BaseView, ValorantPageSource, image_embed_kwargs
+from .mmr_chart import MMRPoint, mmr_chart_renderer
+
+if TYPE_CHECKING:
+    from core.bot import LatteMaid
+    from valorantx2.auth import RiotAuth
+    from valorantx2.models.custom.competitive_tiers import Tier
+
+# fmt: off
+__all__ = (
+    'RankView',
+)
+# fmt: on
+
+_ = I18n('valorant.features.rank', Path(__file__).resolve().parent, read_only=True)
+
+# how many competitive updates the chart shows
+MAX_POINTS = 50
+
+
+def rank_e(
+    points: list[MMRPoint],
+    riot_id: str,
+    *,
+    tier: Tier | None = None,
+    locale: discord.Locale = discord.Locale.american_english,
+) -> Embed:
+    embed = Embed(title=_('rank.title', locale).format(riot_id=riot_id)).purple()
+    if not points:
+        embed.description = _('rank.no_matches', locale)
+        return embed
+
+    last = points[-1]
+    if tier is not None:
+        tier_name = f'{tier.emoji} {tier.display_name.from_locale(locale_converter.to_valorant(locale))}'
+    else:
+        tier_name = str(last.tier)
+    embed.description = _('rank.description', locale).format(tier=tier_name, rr=last.rr)
+    if len(points) > 1:
+        gained = last.value - points[0].value
+        embed.set_footer(text=_('rank.footer', locale).format(gained=f'{gained:+}', matches=len(points)))
+    return embed
+
+
+class RankPageSource(ValorantPageSource):
+    async def format_page_valorant(self, view: BaseView, page: int, riot_auth: RiotAuth) -> Embed | dict[str, Any]:
+        # records the new competitive updates, at most one request every 15 minutes
+        await view.valorant_client.fetch_competitive_updates(riot_auth=riot_auth)
+
+        points = [
+            MMRPoint(point.recorded_at, point.tier, point.rr)
+            async for point in view.bot.db.fetch_mmr_history(riot_auth.puuid, limit=MAX_POINTS)
+        ]
+        tier = view.valorant_client.valorant_api.get_latest_tier(points[-1].tier) if points else None
+        embed = rank_e(points, riot_id=riot_auth.riot_id, tier=tier, locale=view.locale)
+        if not points:
+            return embed
+
+        image = await mmr_chart_renderer.render(riot_auth.puuid, points)
+        return await image_embed_kwargs(view, embed, image)
+
+
+class RankView(BaseView):
+    def __init__(self, interaction: discord.Interaction[LatteMaid]) -> None:
+        super().__init__(interaction, RankPageSource())
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import io
+import logging
+import os
+from typing import TYPE_CHECKING, NamedTuple
+
+import discord
+
+from core.utils.render_cache import RenderCache
+from valorantx2.models import SkinLevelBonus
+
+from ..utils import locale_converter
+
+if TYPE_CHECKING:
+    import aiohttp
+    from PIL import ImageFont
+
+    from valorantx2.models import SkinLevelOffer
+
+# fmt: off
+__all__ = (
+    'StoreImageRenderer',
+    'StoreTile',
+    'store_image_renderer',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
+TILE_WIDTH = 512
+TILE_HEIGHT = 256
+COLUMNS = 2
+PADDING = 16
+BACKGROUND = (15, 25, 35)
+TEXT_COLOUR = (236, 232, 225)
+
+
+class StoreTile(NamedTuple):
+    uuid: str
+    name: str
+    price: str
+    colour: tuple[int, int, int]
+    icon_url: str | None
+
+    @classmethod
+    def from_offer(cls, skin: SkinLevelOffer | SkinLevelBonus, *, locale: discord.Locale) -> StoreTile:
+        valorant_locale = locale_converter.to_valorant(locale)
+        colour = BACKGROUND
+        if skin.rarity is not None:
+            highlight = skin.rarity.highlight_color
+            colour = (int(highlight[0:2], 16), int(highlight[2:4], 16), int(highlight[4:6], 16))
+        price = skin.discount_costs if isinstance(skin, SkinLevelBonus) else skin.cost
+        return cls(
+            uuid=skin.uuid,
+            name=skin.display_name_localized(valorant_locale),
+            price=f'VP {price}',
+            colour=colour,
+            icon_url=skin.display_icon.url if skin.display_icon is not None else None,
+        )
+
+
+# fonts with thai and latin glyphs, the first one found is used when STORE_IMAGE_FONT is not set
+FONT_PATHS: tuple[str, ...] = (
+    '/usr/share/fonts/truetype/tlwg/Garuda.ttf',
+    '/usr/share/fonts/truetype/noto/NotoSansThai-Regular.ttf',
+    '/usr/share/fonts/opentype/tlwg/Garuda.otf',
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_font_path() -> str | None:
+    path = os.getenv('STORE_IMAGE_FONT')
+    if path:
+        return path
+    for path in FONT_PATHS:
+        if os.path.isfile(path):
+            return path
+    _log.warning('no font with thai glyphs found, set STORE_IMAGE_FONT to draw thai skin names')
+    return None
+
+
+def _load_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    from PIL import ImageFont
+
+    # the default font has no thai glyphs
+    path = _get_font_path()
+    if path is not None:
+        return ImageFont.truetype(path, size)
+    return ImageFont.load_default(size)
+
+
+def _render(tiles: list[StoreTile], icons: dict[str, bytes]) -> bytes:
+    from PIL import Image, ImageDraw
+
+    rows = (len(tiles) + COLUMNS - 1) // COLUMNS
+    columns = min(len(tiles), COLUMNS)
+    image = Image.new('RGB', (columns * TILE_WIDTH, rows * TILE_HEIGHT), BACKGROUND)
+    draw = ImageDraw.Draw(image)
+    name_font = _load_font(26)
+    price_font = _load_font(22)
+
+    for index, tile in enumerate(tiles):
+        left = (index % COLUMNS) * TILE_WIDTH
+        top = (index // COLUMNS) * TILE_HEIGHT
+
+        # rarity background and edge
+        draw.rectangle((left, top, left + TILE_WIDTH - 1, top + TILE_HEIGHT - 1), fill=tuple(c // 4 for c in tile.colour))
+        draw.rectangle((left, top, left + 6, top + TILE_HEIGHT - 1), fill=tile.colour)
+
+        icon_bytes = icons.get(tile.icon_url) if tile.icon_url is not None else None
+        if icon_bytes is not None:
+            try:
+                with Image.open(io.BytesIO(icon_bytes)) as icon:
+                    icon = icon.convert('RGBA')
+                    icon.thumbnail((TILE_WIDTH - PADDING * 2, TILE_HEIGHT - PADDING * 2 - 64))
+                    x = left + (TILE_WIDTH - icon.width) // 2
+                    y = top + PADDING + (TILE_HEIGHT - PADDING * 2 - 64 - icon.height) // 2
+                    image.paste(icon, (x, y), icon)
+            except OSError as e:
+                _log.warning(f'failed to draw store icon {tile.icon_url}', exc_info=e)
+
+        draw.text((left + PADDING + 6, top + TILE_HEIGHT - 64), tile.name, font=name_font, fill=TEXT_COLOUR)
+        draw.text((left + PADDING + 6, top + TILE_HEIGHT - 32), tile.price, font=price_font, fill=tile.colour)
+
+    fp = io.BytesIO()
+    image.save(fp, format='PNG', optimize=True)
+    return fp.getvalue()
+
+
+class StoreImageRenderer:
+    """Composites store offers into a single image.
+
+    Rendering runs in the default executor and the result is cached by the
+    offers (uuid and price) and locale, so identical stores are rendered once.
+    """
+
+    def __init__(self, maxsize: int = 256, icons_maxsize: int = 512) -> None:
+        self.icons_maxsize: int = icons_maxsize
+        self._images: RenderCache[str] = RenderCache(maxsize)
+        self._icons: dict[str, bytes] = {}
+
+    @staticmethod
+    def get_key(tiles: list[StoreTile], locale: discord.Locale) -> str:
+        offers = sorted(f'{tile.uuid}:{tile.price}' for tile in tiles)
+        return hashlib.sha1(f'{locale}|{"|".join(offers)}'.encode()).hexdigest()
+
+    def clear(self) -> None:
+        self._images.clear()
+        self._icons.clear()
+
+    async def _fetch_icon(self, session: aiohttp.ClientSession, url: str) -> bytes | None:
+        try:
+            return self._icons[url]
+        except KeyError:
+            pass
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    return None
+                data = await response.read()
+        except Exception as e:
+            _log.warning(f'failed to fetch store icon {url}', exc_info=e)
+            return None
+        if len(self._icons) >= self.icons_maxsize:
+            del self._icons[next(iter(self._icons))]
+        self._icons[url] = data
+        return data
+
+    async def _render(self, session: aiohttp.ClientSession, tiles: list[StoreTile]) -> bytes:
+        urls = {tile.icon_url for tile in tiles if tile.icon_url is not None}
+        fetched = await asyncio.gather(*(self._fetch_icon(session, url) for url in urls))
+        icons = {url: data for url, data in zip(urls, fetched) if data is not None}
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _render, tiles, icons)
+
+    async def render(
+        self,
+        session: aiohttp.ClientSession,
+        tiles: list[StoreTile],
+        *,
+        locale: discord.Locale,
+    ) -> tuple[str, bytes]:
+        """|coro|
+
+        Returns the cache key and the PNG bytes of the composite image.
+        """
+        key = self.get_key(tiles, locale)
+        # concurrent requests for the same store wait for a single render
+        image = await self._images.get_or_render(key, lambda: self._render(session, tiles))
+        return key, image
+
+
+store_image_renderer: StoreImageRenderer = StoreImageRenderer()
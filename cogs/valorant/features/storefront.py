@@ -29,10 +29,12 @@ from valorantx2.models import (
 )
 
 from ..utils import locale_converter
-from .base import BaseView, ValorantPageSource
+from .base import BaseView, ValorantPageSource, embed_templates, image_embed_kwargs
+from .persistent import PersistentContext, PersistentFeature, PersistentState, register_feature
+from .store_image import StoreTile, store_image_renderer
 
 __all__ = (
-    'StoreFrontView',
+    'StoreFrontFeature',
     'NightMarketView',
 )
 
@@ -103,15 +105,28 @@ _ = I18n('valorant.features.storefront', Path(__file__).resolve().parent, read_o
 #     return embed
 
 
+def _skin_template_e(skin: Skin | SkinLevel | SkinChroma | SkinLevelOffer | SkinLevelBonus, locale: discord.Locale) -> Embed:
+    valorant_locale = locale_converter.to_valorant(locale)
+    embed = Embed(
+        title=f"{skin.rarity.emoji} {chat.bold(skin.display_name_localized(valorant_locale))}",  # type: ignore
+    ).purple()
+
+    if skin.display_icon is not None:
+        embed.url = skin.display_icon.url
+        embed.set_thumbnail(url=skin.display_icon)
+
+    if skin.rarity is not None:
+        embed.colour = int(skin.rarity.highlight_color[0:6], 16)
+
+    return embed
+
+
 def skin_e(
     skin: Skin | SkinLevel | SkinChroma | SkinLevelOffer | SkinLevelBonus,
     *,
     locale: discord.Locale,
 ) -> Embed:
-    valorant_locale = locale_converter.to_valorant(locale)
-    embed = Embed(
-        title=f"{skin.rarity.emoji} {chat.bold(skin.display_name_localized(valorant_locale))}",  # type: ignore
-    ).purple()
+    embed = embed_templates.get((skin.uuid, locale, 'skin'), lambda: _skin_template_e(skin, locale))
 
     if isinstance(skin, SkinLevelOffer):
         embed.description = f'{VALORANT_POINT_EMOJI} {chat.bold(str(skin.cost))}'
@@ -121,13 +136,6 @@ def skin_e(
             f'{VALORANT_POINT_EMOJI} {chat.strikethrough(str(skin.price))} (-{skin.discount_percent}%)'
         )
 
-    if skin.display_icon is not None:
-        embed.url = skin.display_icon.url
-        embed.set_thumbnail(url=skin.display_icon)
-
-    if skin.rarity is not None:
-        embed.colour = int(skin.rarity.highlight_color[0:6], 16)
-
     return embed
 
 
@@ -216,8 +224,22 @@ def store_accessories_e(
     return embeds
 
 
+async def store_image_kwargs(
+    view: BaseView,
+    header: Embed,
+    skins: list[SkinLevelOffer] | list[SkinLevelBonus],
+) -> dict[str, Any]:
+    tiles = [StoreTile.from_offer(skin, locale=view.locale) for skin in skins]
+    _, image = await store_image_renderer.render(view.bot.session, tiles, locale=view.locale)
+    return await image_embed_kwargs(view, header, image)
+
+
 class StoreFrontPageSource(ValorantPageSource):
-    async def format_page_valorant(self, view: BaseView, page: int, riot_auth: RiotAuth) -> list[Embed]:
+    def __init__(self, *, image: bool = False) -> None:
+        # render the offers as a single composite image instead of an embed per offer
+        self.image: bool = image
+
+    async def format_page_valorant(self, view: BaseView, page: int, riot_auth: RiotAuth) -> list[Embed] | dict[str, Any]:
         storefront = await view.valorant_client.fetch_storefront(riot_auth)
         if page == 0:  # featured
             embeds = store_featured_e(
@@ -225,6 +247,8 @@ class StoreFrontPageSource(ValorantPageSource):
                 riot_id=riot_auth.riot_id,
                 locale=view.locale,
             )
+            if self.image:
+                return await store_image_kwargs(view, embeds[0], storefront.skins_panel_layout.skins)
         elif page == 1:  # accessories
             embeds = store_accessories_e(
                 storefront.accessory_store,
@@ -237,50 +261,47 @@ class StoreFrontPageSource(ValorantPageSource):
 
 
 class NightMarketPageSource(ValorantPageSource):
-    async def format_page_valorant(self, view: BaseView, page: int, riot_auth: RiotAuth) -> list[Embed]:
+    def __init__(self, *, image: bool = False) -> None:
+        self.image: bool = image
+
+    async def format_page_valorant(self, view: BaseView, page: int, riot_auth: RiotAuth) -> list[Embed] | dict[str, Any]:
         storefront = await view.valorant_client.fetch_storefront(riot_auth)
         if storefront.bonus_store is None:
             return [Embed(description=_('Nightmarket is not available', view.locale))]
-        embeds = [nightmarket_front_e(storefront.bonus_store, riot_auth.riot_id, locale=view.locale)]
+        header = nightmarket_front_e(storefront.bonus_store, riot_auth.riot_id, locale=view.locale)
+        if self.image:
+            return await store_image_kwargs(view, header, storefront.bonus_store.skins)
+        embeds = [header]
         embeds += [skin_e(skin, locale=view.locale) for skin in storefront.bonus_store.skins]
         return embeds
 
 
-class StoreFrontView(BaseView):
-    def __init__(
+class StoreFrontFeature(PersistentFeature):
+    """The featured and accessories pages of the store, driven by persistent components."""
+
+    def __init__(self, *, image: bool = False) -> None:
+        self.name: str = 'store_image' if image else 'store'
+        self.source: StoreFrontPageSource = StoreFrontPageSource(image=image)
+
+    async def render(
         self,
-        interaction: discord.Interaction[LatteMaid],
-        # source: ValorantPageSource = discord.utils.MISSING,
-    ) -> None:
-        super().__init__(interaction, StoreFrontPageSource())
-        self.current_page: int = 0
-
-    async def _get_kwargs_from_valorant_page(self, page: int) -> dict[str, Any]:
-        kwargs = await super()._get_kwargs_from_valorant_page(page)
-        self.current_page = page
-        return kwargs
-
-    @ui.button(label='Featured', disabled=True)
-    async def featured(self, interaction: discord.Interaction[LatteMaid], button: ui.Button) -> None:
-        await interaction.response.defer()
-        if self.message is None:
-            return
-        button.disabled = True
-        self.accessories.disabled = False
-        kwargs = await self._get_kwargs_from_valorant_page(0)
-        await self.message.edit(**kwargs, view=self)
-
-    @ui.button(label='Accessories')
-    async def accessories(self, interaction: discord.Interaction[LatteMaid], button: ui.Button) -> None:
-        await interaction.response.defer()
-        if self.message is None:
-            return
-        button.disabled = True
-        self.featured.disabled = False
-        kwargs = await self._get_kwargs_from_valorant_page(1)
-        await self.message.edit(**kwargs, view=self)
+        context: PersistentContext,
+        state: PersistentState,
+        riot_auth: RiotAuth,
+    ) -> tuple[Any, list[ui.Item[Any]]]:
+        value = await self.source.format_page_valorant(context, state.page, riot_auth)  # type: ignore
+        style = discord.ButtonStyle.secondary
+        items: list[ui.Item[Any]] = [
+            self.page_button(state, 0, slot=0, label=_('Featured', context.locale), style=style, disabled=state.page == 0),
+            self.page_button(state, 1, slot=1, label=_('Accessories', context.locale), style=style, disabled=state.page == 1),
+        ]
+        return value, items
+
+
+register_feature(StoreFrontFeature())
+register_feature(StoreFrontFeature(image=True))
 
 
 class NightMarketView(BaseView):
-    def __init__(self, interaction: discord.Interaction[LatteMaid]) -> None:
-        super().__init__(interaction, NightMarketPageSource())
+    def __init__(self, interaction: discord.Interaction[LatteMaid], *, image: bool = False) -> None:
+        super().__init__(interaction, NightMarketPageSource(image=image))
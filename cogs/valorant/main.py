@@ -10,6 +10,7 @@ from discord import app_commands
 from discord.app_commands import Choice, locale_str as _T
 
 import valorantx2 as valorantx
+from core.bus import RiotAccountsChanged, ValorantCacheCleared
 from core.checks import cooldown_long, cooldown_medium, cooldown_short, dynamic_cooldown
 from core.cog import MaidCog
 from core.database.models import User
@@ -25,11 +26,15 @@ from .core.settings import SettingsView
 from .error import ErrorHandler, RiotAuthNotLinked
 from .events import Events
 from .features.bundles import FeaturedBundleView
+from .features.carrier import MatchDetailsPageSource, MatchDetailsView, career_summary_e
+from .features.catalog import SkinCatalogPageSource, SkinCatalogView, catalog_item_e, get_catalog_item, search_catalog
 from .features.gamepass import GamePassView
-from .features.loadout import CollectionView
+from .features.loadout import CollectionFeature
 from .features.mission import MissionView
 from .features.patchnote import PatchNoteView
-from .features.storefront import NightMarketView, StoreFrontView
+from .features.persistent import PersistentAccountSelect, PersistentPageButton, account_managers, start_persistent
+from .features.rank import RankView
+from .features.storefront import NightMarketView
 from .features.wallet import WalletView
 from .notifications import Notifications
 from .schedule import Schedule
@@ -72,11 +77,25 @@ class Valorant(Admin, ContextMenu, ErrorHandler, Events, Notifications, Schedule
         # self.notify_alert.start()
         self.version_checker.start()
         self.cache_control.start()
+        self.bot.add_dynamic_items(PersistentPageButton, PersistentAccountSelect)
+        self.bot.bus.subscribe(RiotAccountsChanged, self.handle_riot_accounts_changed)
+        self.bot.bus.subscribe(ValorantCacheCleared, self.handle_valorant_cache_cleared)
 
     async def cog_unload(self) -> None:
         # self.notify_alert.cancel()
         self.version_checker.cancel()
         self.cache_control.cancel()
+        self.bot.remove_dynamic_items(PersistentPageButton, PersistentAccountSelect)
+        self.bot.bus.unsubscribe(RiotAccountsChanged, self.handle_riot_accounts_changed)
+        self.bot.bus.unsubscribe(ValorantCacheCleared, self.handle_valorant_cache_cleared)
+
+    # invalidation
+
+    def handle_riot_accounts_changed(self, event: RiotAccountsChanged) -> None:
+        account_managers.invalidate(event.owner_id)
+
+    async def handle_valorant_cache_cleared(self, event: ValorantCacheCleared) -> None:
+        await self.valorant_client.cache_clear()
 
     # check
 
@@ -196,19 +215,22 @@ class Valorant(Admin, ContextMenu, ErrorHandler, Events, Notifications, Schedule
     # TODO: remove defer first
 
     @app_commands.command(name=_T('store'), description=_T('Shows your daily store in your accounts'))
+    @app_commands.rename(image=_T('image'))
+    @app_commands.describe(image=_T('Show the offers as a single image'))
     @app_commands.guild_only()
     @dynamic_cooldown(cooldown_short)
-    async def store(self, interaction: discord.Interaction[LatteMaid]) -> None:
-        view = StoreFrontView(interaction)
-        await view.start_valorant()
+    async def store(self, interaction: discord.Interaction[LatteMaid], image: bool = False) -> None:
+        await start_persistent(interaction, 'store_image' if image else 'store')
 
     @app_commands.command(name=_T('nightmarket'), description=_T('Show skin offers on the nightmarket'))
-    @app_commands.rename(hide=_T('hide'))
-    @app_commands.describe(hide=_T('Hide the skin offers'))
+    @app_commands.rename(hide=_T('hide'), image=_T('image'))
+    @app_commands.describe(hide=_T('Hide the skin offers'), image=_T('Show the offers as a single image'))
     @app_commands.guild_only()
     @dynamic_cooldown(cooldown_short)
-    async def nightmarket(self, interaction: discord.Interaction[LatteMaid], hide: bool = False) -> None:
-        view = NightMarketView(interaction)
+    async def nightmarket(
+        self, interaction: discord.Interaction[LatteMaid], hide: bool = False, image: bool = False
+    ) -> None:
+        view = NightMarketView(interaction, image=image)
         await view.start_valorant()
 
     # @app_commands.command(name=_T('agent_store'), description=_T('Show the current featured agents'))
@@ -234,6 +256,13 @@ class Valorant(Admin, ContextMenu, ErrorHandler, Events, Notifications, Schedule
         view = WalletView(interaction)
         await view.start_valorant()
 
+    @app_commands.command(name=_T('rank'), description=_T('View your rank history'))
+    @app_commands.guild_only()
+    @dynamic_cooldown(cooldown_short)
+    async def rank(self, interaction: discord.Interaction[LatteMaid]) -> None:
+        view = RankView(interaction)
+        await view.start_valorant()
+
     @app_commands.command(name=_T('battlepass'), description=_T('View your battlepass current tier'))
     @app_commands.rename(season=_T('season'))
     @app_commands.describe(season=_T('Select season to view'))
@@ -263,8 +292,7 @@ class Valorant(Admin, ContextMenu, ErrorHandler, Events, Notifications, Schedule
     @app_commands.guild_only()
     @dynamic_cooldown(cooldown_short)
     async def collection(self, interaction: discord.Interaction[LatteMaid]) -> None:
-        view = CollectionView(interaction)
-        await view.start_valorant()
+        await start_persistent(interaction, CollectionFeature.name)
 
     @app_commands.command(name=_T('agents'), description=_T('Agent Contracts'))
     @app_commands.guild_only()
@@ -298,7 +326,48 @@ class Valorant(Admin, ContextMenu, ErrorHandler, Events, Notifications, Schedule
         mode: Choice[str] | None = None,
         riot_id: str | None = None,
     ) -> None:
-        ...
+        user = await self.fetch_or_create_user(interaction.user.id)
+        await interaction.response.defer()
+
+        queue_id = mode.value if mode is not None else None
+
+        if riot_id is not None:
+            try:
+                game_name, tag_line = validate_riot_id(riot_id)
+            except ValueError:
+                raise BadArgument(_('invalid.riot_id', interaction.locale))
+
+            partial_user = await self.valorant_client.fetch_partial_user(game_name, tag_line)
+            puuid = partial_user.puuid
+            title = f'{game_name}#{tag_line}'
+        else:
+            riot_account = user.riot_accounts[0]
+            puuid = riot_account.puuid
+            title = riot_account.riot_id
+
+        match_ids = await self.valorant_client.fetch_indexed_match_ids(puuid, queue_id, limit=15)
+
+        # the career stats already hold the matches summarized before, only the others are fetched
+        career_stats = self.valorant_client.career_stats
+        missing = career_stats.get_missing_match_ids(puuid, match_ids)
+        if missing:
+            # details cached before the player was dropped from the career stats are added back
+            career_stats.add_matches(await self.valorant_client.fetch_match_details_many(missing))
+
+        summary = career_stats.summarize(puuid, match_ids=match_ids)
+        if not summary.matches:
+            raise BadArgument(_('match.no_match', interaction.locale))
+
+        embed = career_summary_e(
+            summary,
+            title=title,
+            agents=career_stats.summarize_by(puuid, 'agent', match_ids=match_ids),
+            maps=career_stats.summarize_by(puuid, 'map', match_ids=match_ids),
+            valorant_api=self.valorant_client.valorant_api,
+            total=len(match_ids),
+            locale=interaction.locale,
+        )
+        await interaction.followup.send(embed=embed)
 
     @app_commands.command(name=_T('match'), description=_T('Shows latest match details'))
     @app_commands.choices(
@@ -337,15 +406,19 @@ class Valorant(Admin, ContextMenu, ErrorHandler, Events, Notifications, Schedule
                 raise BadArgument(_('invalid.riot_id', interaction.locale))
 
             puuid = (await self.valorant_client.fetch_partial_user(game_name, tag_line)).puuid
+        else:
+            puuid = user.riot_accounts[0].puuid
 
-            match_history = await self.valorant_client.fetch_match_history(puuid, queue_id, end=1)
+        matches = await self.valorant_client.fetch_indexed_match_details(puuid, queue_id, limit=1)
 
-            if not len(match_history.match_details):
-                raise BadArgument(_('match.no_match', interaction.locale))
+        if not len(matches):
+            raise BadArgument(_('match.no_match', interaction.locale))
 
-            match_details = match_history.match_details[0]
+        match_details = matches[0]
 
-            return
+        source = MatchDetailsPageSource(match_details, puuid, interaction.locale)
+        view = MatchDetailsView(source, interaction=interaction)
+        await view.start()
 
     # patch notes
 
@@ -374,34 +447,43 @@ class Valorant(Admin, ContextMenu, ErrorHandler, Events, Notifications, Schedule
 
     # infomation commands
 
-    # @app_commands.command(name=_T('agent'), description=_T('View agent info'))
-    # @app_commands.guild_only()
-    # @app_commands.rename(agent='agent')
-    # # @dynamic_cooldown(cooldown_short)
-    # async def agent(self, interaction: discord.Interaction, agent: str | None = None) -> None:
-    #     ...
+    async def send_catalog_item(self, interaction: discord.Interaction[LatteMaid], kind: str, uuid: str) -> None:
+        item = get_catalog_item(self.valorant_client.valorant_api, kind, uuid)
+        if item is None:
+            raise BadArgument(_('catalog.not_found', interaction.locale))
+        await interaction.response.send_message(embed=catalog_item_e(item, locale=interaction.locale))
 
-    # @app_commands.command(name=_T('buddy'), description=_T('View buddy info'))
-    # @app_commands.guild_only()
-    # @app_commands.rename(buddy='buddy')
-    # # @dynamic_cooldown(cooldown_short)
-    # async def buddy(self, interaction: discord.Interaction, buddy: str | None = None) -> None:
-    #     ...
+    @app_commands.command(name=_T('agent'), description=_T('View agent info'))
+    @app_commands.rename(agent=_T('agent'))
+    @app_commands.describe(agent=_T('The agent you want to view'))
+    @app_commands.guild_only()
+    @dynamic_cooldown(cooldown_short)
+    async def agent(self, interaction: discord.Interaction[LatteMaid], agent: str) -> None:
+        await self.send_catalog_item(interaction, 'agent', agent)
 
-    # @app_commands.command(name=_T('bundle'), description='inspect a specific bundle')
-    # @app_commands.describe(bundle="The name of the bundle you want to inspect!")
-    # @app_commands.rename(bundle=_T('bundle'))
-    # @app_commands.guild_only()
-    # # @dynamic_cooldown(cooldown_short)
-    # async def bundle(self, interaction: discord.Interaction, bundle: str | None = None) -> None:
-    #     ...
+    @app_commands.command(name=_T('buddy'), description=_T('View buddy info'))
+    @app_commands.rename(buddy=_T('buddy'))
+    @app_commands.describe(buddy=_T('The buddy you want to view'))
+    @app_commands.guild_only()
+    @dynamic_cooldown(cooldown_short)
+    async def buddy(self, interaction: discord.Interaction[LatteMaid], buddy: str) -> None:
+        await self.send_catalog_item(interaction, 'buddy', buddy)
 
-    # @app_commands.command(name=_T('spray'), description=_T('View spray info'))
-    # @app_commands.guild_only()
-    # @app_commands.rename(spray='spray')
-    # # @dynamic_cooldown(cooldown_short)
-    # async def spray(self, interaction: discord.Interaction, spray: str | None = None) -> None:
-    #     ...
+    @app_commands.command(name=_T('bundle'), description=_T('Inspect a specific bundle'))
+    @app_commands.rename(bundle=_T('bundle'))
+    @app_commands.describe(bundle=_T('The bundle you want to inspect'))
+    @app_commands.guild_only()
+    @dynamic_cooldown(cooldown_short)
+    async def bundle(self, interaction: discord.Interaction[LatteMaid], bundle: str) -> None:
+        await self.send_catalog_item(interaction, 'bundle', bundle)
+
+    @app_commands.command(name=_T('spray'), description=_T('View spray info'))
+    @app_commands.rename(spray=_T('spray'))
+    @app_commands.describe(spray=_T('The spray you want to view'))
+    @app_commands.guild_only()
+    @dynamic_cooldown(cooldown_short)
+    async def spray(self, interaction: discord.Interaction[LatteMaid], spray: str) -> None:
+        await self.send_catalog_item(interaction, 'spray', spray)
 
     # player = app_commands.Group(name=_T('player'), description=_T('Player commands'), guild_only=True)
 
@@ -417,136 +499,89 @@ class Valorant(Admin, ContextMenu, ErrorHandler, Events, Notifications, Schedule
     # async def player_title(self, interaction: discord.Interaction) -> None:
     #     ...
 
-    # @app_commands.command(name=_T('weapon'), description=_T('View weapon info'))
-    # @app_commands.guild_only()
-    # @app_commands.rename(weapon='weapon')
-    # # @dynamic_cooldown(cooldown_short)
-    # async def weapon(self, interaction: discord.Interaction, weapon: str | None = None) -> None:
-    #     ...
-
-    # @app_commands.command(name=_T('skin'), description=_T('View skin info'))
-    # @app_commands.guild_only()
-    # @app_commands.rename(skin='skin')
-    # # @dynamic_cooldown(cooldown_short)
-    # async def skin(self, interaction: discord.Interaction, skin: str | None = None) -> None:
-    #     ...
-
-    # auto complete
-    # @bundle.autocomplete('bundle')
-    # @agent.autocomplete('agent')
-    # @buddy.autocomplete('buddy')
-    # @spray.autocomplete('spray')
-    # @weapon.autocomplete('weapon')
-    # @skin.autocomplete('skin')
-    # @player_card.autocomplete('card')
-    # @player_title.autocomplete('title')
-    # @battlepass.autocomplete('season')
-    # @eventpass.autocomplete('event')
-    # async def get_all_auto_complete(self, interaction: Interaction, current: str) -> List[Choice[str]]:
-
-    #     locale = self.v_locale(interaction.locale)
-
-    #     results: List[Choice[str]] = []
-    #     mex_index = 25
-
-    #     # TODO: cache choices
-
-    #     if interaction.command is self.bundle:
-
-    #         bundle_list = self.get_all_bundles()
-    #         namespace = interaction.namespace.bundle
-    #         mex_index = 15
-
-    #         for bundle in sorted(bundle_list, key=lambda a: a.name_localizations.from_locale(str(locale))):
-    #             if bundle.name_localizations.from_locale(str(locale)).lower().startswith(namespace.lower()):
-
-    #                 bundle_name = bundle.name_localizations.from_locale(str(locale))
-
-    #                 index = 2
-    #                 for choice in results:
-    #                     if choice.name.startswith(bundle_name):
-    #                         bundle_name = f"{bundle_name} {index}"
-    #                         index += 1
-
-    #                 results.append(app_commands.Choice(name=bundle_name, value=bundle.uuid))
-    #                 if len(results) >= mex_index:
-    #                     break
-
-    #     elif interaction.command is self.battlepass:
-
-    #         value_list = self.get_all_seasons()
-    #         namespace = interaction.namespace.season
-
-    #         for value in sorted(value_list, key=lambda a: a.start_time):
-    #             if value.name_localizations.from_locale(str(locale)).lower().startswith(namespace.lower()):
+    @app_commands.command(name=_T('weapon'), description=_T('View weapon info'))
+    @app_commands.rename(weapon=_T('weapon'))
+    @app_commands.describe(weapon=_T('The weapon you want to view'))
+    @app_commands.guild_only()
+    @dynamic_cooldown(cooldown_short)
+    async def weapon(self, interaction: discord.Interaction[LatteMaid], weapon: str) -> None:
+        await self.send_catalog_item(interaction, 'weapon', weapon)
 
-    #                 parent = value.parent
-    #                 parent_name = ''
-    #                 if parent is None:
-    #                     if value.uuid != '0df5adb9-4dcb-6899-1306-3e9860661dd3':  # closed beta
-    #                         continue
-    #                 else:
-    #                     parent_name = parent.name_localizations.from_locale(str(locale)) + ' '
+    @app_commands.command(name=_T('skin'), description=_T('View skin info'))
+    @app_commands.rename(skin=_T('skin'))
+    @app_commands.describe(skin=_T('The skin you want to view'))
+    @app_commands.guild_only()
+    @dynamic_cooldown(cooldown_short)
+    async def skin(self, interaction: discord.Interaction[LatteMaid], skin: str) -> None:
+        await self.send_catalog_item(interaction, 'skin', skin)
+
+    @app_commands.command(name=_T('skins'), description=_T('Browse skins by weapon, tier, bundle or price'))
+    @app_commands.rename(weapon=_T('weapon'), tier=_T('tier'), bundle=_T('bundle'), max_price=_T('max_price'))
+    @app_commands.describe(
+        weapon=_T('Only show skins of this weapon'),
+        tier=_T('Only show skins of this tier'),
+        bundle=_T('Only show skins of this bundle'),
+        max_price=_T('Only show skins up to this price'),
+    )
+    @app_commands.guild_only()
+    @dynamic_cooldown(cooldown_short)
+    async def skins(
+        self,
+        interaction: discord.Interaction[LatteMaid],
+        weapon: str | None = None,
+        tier: str | None = None,
+        bundle: str | None = None,
+        max_price: app_commands.Range[int, 0] | None = None,
+    ) -> None:
+        catalog = self.valorant_client.valorant_api.get_skin_catalog()
+        prices = None
+        if max_price is not None:
+            prices = [price for price in catalog.facet_values('price') if price <= max_price]  # type: ignore
 
-    #                 value_name = parent_name + value.name_localizations.from_locale(str(locale))
+        skins = catalog.select(weapon=weapon, content_tier=tier, bundle=bundle, price=prices)
+        if not len(skins):
+            raise BadArgument(_('catalog.no_skins', interaction.locale))
 
-    #                 if value_name == ' ':
-    #                     continue
+        source = SkinCatalogPageSource(skins, locale=interaction.locale)
+        view = SkinCatalogView(source, interaction=interaction)
+        await view.start()
 
-    #                 if not value_name.startswith('.') and not namespace.startswith('.'):
-    #                     results.append(Choice(name=value_name, value=value.uuid))
-    #                 elif namespace.startswith('.'):
-    #                     results.append(Choice(name=value_name, value=value.uuid))
+    # auto complete
 
-    #             if len(results) >= mex_index:
-    #                 break
+    @skins.autocomplete('weapon')
+    async def skins_weapon_autocomplete(
+        self, interaction: discord.Interaction[LatteMaid], current: str
+    ) -> list[Choice[str]]:
+        if not self.valorant_client.is_ready():
+            return []
+        return search_catalog(self.valorant_client.valorant_api, 'weapon', current, locale=interaction.locale)
 
-    #     else:
+    @skins.autocomplete('tier')
+    async def skins_tier_autocomplete(self, interaction: discord.Interaction[LatteMaid], current: str) -> list[Choice[str]]:
+        if not self.valorant_client.is_ready():
+            return []
+        return search_catalog(self.valorant_client.valorant_api, 'content_tier', current, locale=interaction.locale)
 
-    #         if interaction.command is self.agent:
-    #             value_list = self.get_all_agents()
-    #             namespace = interaction.namespace.agent
-    #         elif interaction.command is self.buddy:
-    #             value_list = self.get_all_buddies()
-    #             namespace = interaction.namespace.buddy
-    #         elif interaction.command is self.spray:
-    #             value_list = self.get_all_sprays()
-    #             namespace = interaction.namespace.spray
-    #         elif interaction.command is self.weapon:
-    #             value_list = self.get_all_weapons()
-    #             namespace = interaction.namespace.weapon
-    #         elif interaction.command is self.skin:
-    #             value_list = self.get_all_skins()
-    #             namespace = interaction.namespace.skin
-    #         elif interaction.command is self.player_card:
-    #             value_list = self.get_all_player_cards()
-    #             namespace = interaction.namespace.card
-    #         elif interaction.command is self.player_title:
-    #             value_list = self.get_all_player_titles()
-    #             namespace = interaction.namespace.title
-    #         elif interaction.command is self.eventpass:
-    #             value_list = self.get_all_events()
-    #             namespace = interaction.namespace.event
-    #         else:
-    #             return []
-
-    #         for value in sorted(value_list, key=lambda a: a.name_localizations.from_locale(str(locale))):
-    #             if value.name_localizations.from_locale(str(locale)).lower().startswith(namespace.lower()):
-
-    #                 value_name = value.name_localizations.from_locale(str(locale))
-
-    #                 if value_name == ' ':
-    #                     continue
-
-    #                 if not value_name.startswith('.') and not namespace.startswith('.'):
-    #                     results.append(Choice(name=value_name, value=value.uuid))
-    #                 elif namespace.startswith('.'):
-    #                     results.append(Choice(name=value_name, value=value.uuid))
-
-    #             if len(results) >= mex_index:
-    #                 break
-
-    #     return results[:mex_index]
+    @skins.autocomplete('bundle')
+    async def skins_bundle_autocomplete(
+        self, interaction: discord.Interaction[LatteMaid], current: str
+    ) -> list[Choice[str]]:
+        if not self.valorant_client.is_ready():
+            return []
+        return search_catalog(self.valorant_client.valorant_api, 'bundle', current, locale=interaction.locale)
+
+    @agent.autocomplete('agent')
+    @buddy.autocomplete('buddy')
+    @bundle.autocomplete('bundle')
+    @spray.autocomplete('spray')
+    @weapon.autocomplete('weapon')
+    @skin.autocomplete('skin')
+    async def catalog_autocomplete(self, interaction: discord.Interaction[LatteMaid], current: str) -> list[Choice[str]]:
+        if interaction.command is None or not self.valorant_client.is_ready():
+            return []
+        # the command name is the search kind
+        kind = interaction.command.name
+        return search_catalog(self.valorant_client.valorant_api, kind, current, locale=interaction.locale)
 
     # develeping commands
 
@@ -7,6 +7,8 @@ from core.i18n import I18n
 
 from .abc import MixinMeta
 from .auth import RiotAuth
+from .features.base import embed_templates
+from .utils import locale_converter
 
 _log = logging.getLogger(__name__)
 
@@ -22,14 +24,25 @@ times = [
 class Schedule(MixinMeta):
     async def do_checker_version(self) -> None:
         _log.info(f'checking valorant version')
-        version = await self.valorant_client.valorant_api.fetch_version()
+        valorant_api = self.valorant_client.valorant_api
+        version = await valorant_api.fetch_version()
 
         if version != self.valorant_client.version:
             self.valorant_client.version = version
-            await self.valorant_client.valorant_api.reload()
+            # the static content may already be loaded from the snapshot of this version
+            if not valorant_api.is_snapshot_of(version):
+                await valorant_api.reload()
+                embed_templates.clear()
             RiotAuth.RIOT_CLIENT_USER_AGENT = f'RiotClient/{version.riot_client_build} %s (Windows;10;;Professional, x64)'
             _log.info(f'valorant client version updated to {version}')
 
+        self.do_build_search_indexes()
+
+    def do_build_search_indexes(self) -> None:
+        locales = [locale_converter.to_valorant(locale) for locale in self.bot.translator.supported_locales]
+        self.valorant_client.valorant_api.build_search_indexes(locales)
+        _log.info('valorant search indexes built')
+
     @tasks.loop(time=times)
     async def version_checker(self) -> None:
         await self.do_checker_version()
@@ -39,6 +52,8 @@ class Schedule(MixinMeta):
         await self.bot.wait_until_ready()
         if not self.valorant_client.is_ready():
             return
+        # the static content may have been loaded from an outdated snapshot
+        await self.do_checker_version()
         _log.info(f'valorant version checker loop has been started')
 
     @version_checker.after_loop
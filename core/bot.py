@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import datetime
 import logging
 import os
 import random
-from typing import TYPE_CHECKING, Any, Literal, overload
+from typing import TYPE_CHECKING, Any, ContextManager, Literal, overload
 
 import aiohttp
 import discord
@@ -16,10 +17,14 @@ import valorantx2 as valorantx
 from core.enums import Emoji
 
 from . import __version__
+from .bus import InvalidationBus
+from .database.models.riot_account import get_fernet
 from .db import DatabaseConnection
+from .i18n import save_pending
+from .metrics import MetricsServer
 from .translator import Translator
 from .tree import LatteMaidTree
-from .utils.colorthief import ColorThief
+from .utils.attachments import AttachmentURLRegistry
 
 if TYPE_CHECKING:
     from cogs.about import About as AboutCog
@@ -27,6 +32,8 @@ if TYPE_CHECKING:
     from cogs.jsk import Jishaku as JishakuCog
     from cogs.valorant import Valorant as ValorantCog
 
+    from .utils.profiler import StartupProfiler
+
 load_dotenv()
 
 _log = logging.getLogger(__name__)
@@ -60,6 +67,11 @@ class LatteMaid(commands.AutoShardedBot):
         self,
         debug_mode: bool = False,
         tree_sync_at_startup: bool = False,
+        startup_profiler: StartupProfiler | None = None,
+        *,
+        cluster_id: int | None = None,
+        shard_ids: list[int] | None = None,
+        shard_count: int | None = None,
     ) -> None:
         # intents
         intents = discord.Intents.none()
@@ -80,9 +92,14 @@ class LatteMaid(commands.AutoShardedBot):
             application_id=os.getenv('CLIENT_ID') if not debug_mode else os.getenv('CLIENT_ID_TEST'),
             tree_cls=LatteMaidTree,
             activity=discord.Activity(type=discord.ActivityType.listening, name='luna ♡ ₊˚'),
+            shard_ids=shard_ids,
+            shard_count=shard_count,
         )
+        # cluster, None when a single process owns every shard
+        self.cluster_id: int | None = cluster_id
         self._debug_mode: bool = debug_mode
         self._tree_sync_at_startup: bool = tree_sync_at_startup
+        self.startup_profiler: StartupProfiler | None = startup_profiler
         self._version: str = __version__
         self.emoji: type[Emoji] = Emoji
         self.support_guild_id: int = 1097859504906965042
@@ -93,10 +110,19 @@ class LatteMaid(commands.AutoShardedBot):
         self.maintenance_time: datetime.datetime | None = None
         # palette
         self.palettes: dict[str, list[discord.Colour]] = {}
+        # uploaded images, reused instead of uploading the same content again
+        self.attachment_urls: AttachmentURLRegistry = AttachmentURLRegistry()
+        # invalidation events between the processes of the bot
+        self.bus: InvalidationBus = InvalidationBus.from_url(os.getenv('INVALIDATION_BUS_URL'))
         # database
-        self.db: DatabaseConnection = DatabaseConnection(os.environ['DATABASE_URL' + ('_TEST' if debug_mode else '')])
+        self.db: DatabaseConnection = DatabaseConnection(
+            os.environ['DATABASE_URL' + ('_TEST' if debug_mode else '')],
+            bus=self.bus,
+        )
         # valorant
         self.valorant_client: valorantx.Client = valorantx.Client(self)
+        # metrics, served when METRICS_PORT is set
+        self.metrics_server: MetricsServer | None = None
 
     @property
     def owner(self) -> discord.User:
@@ -123,6 +149,10 @@ class LatteMaid(commands.AutoShardedBot):
     def is_debug_mode(self) -> bool:
         return self._debug_mode
 
+    def is_primary_cluster(self) -> bool:
+        # global work such as the tree sync runs once, not once per cluster
+        return self.cluster_id is None or self.cluster_id == 0
+
     def get_invite_url(self) -> str:
         scopes = ('bot', 'applications.commands')
         permissions = discord.Permissions(int(os.getenv('INVITE_PERMISSIONS', 280576)))
@@ -148,10 +178,11 @@ class LatteMaid(commands.AutoShardedBot):
 
     # bot extension setup
 
-    async def tree_sync(self, guild_only: bool = False) -> None:
+    async def tree_sync(self, guild_only: bool = False, *, force: bool = False) -> None:
         # tree sync application commands
+        # unchanged trees are skipped by hash unless force is set
         if not guild_only:
-            await self.tree.sync()
+            await self.tree.sync(force=force)
         sync_guilds = [
             self.support_guild_id,
             # 1042503061454729289,  # EMOJI ABILITY 2
@@ -162,7 +193,7 @@ class LatteMaid(commands.AutoShardedBot):
         ]
         for guild_id in sync_guilds:
             try:
-                await self.tree.sync(guild=discord.Object(id=guild_id))
+                await self.tree.sync(guild=discord.Object(id=guild_id), force=force)
             except Exception as e:
                 _log.error(f'Failed to sync guild {guild_id}.', exc_info=e)
 
@@ -192,28 +223,66 @@ class LatteMaid(commands.AutoShardedBot):
         else:
             _log.info('valorant client is initialized.')
 
+    def _profile(self, name: str) -> ContextManager[None]:
+        if self.startup_profiler is None:
+            return contextlib.nullcontext()
+        return self.startup_profiler.measure(name)
+
     async def setup_hook(self) -> None:
         # asyncio.get_running_loop().set_debug(self.is_debug_mode())
 
         self.session = aiohttp.ClientSession()
 
-        self.translator = Translator(self)
-        await self.tree.set_translator(self.translator)
+        with self._profile('translator'):
+            self.translator = Translator(self)
+            await self.tree.set_translator(self.translator)
 
-        self.bot_app_info = await self.application_info()
-        self.owner_ids = [self.bot_app_info.owner.id, 385049730222129152]
+        with self._profile('application info'):
+            self.bot_app_info = await self.application_info()
+            self.owner_ids = [self.bot_app_info.owner.id, 385049730222129152]
+
+        # the application emojis replace the hardcoded ones of the same name
+        with self._profile('emojis'):
+            try:
+                emojis = await self.fetch_application_emojis()
+            except discord.HTTPException as e:
+                _log.warning('failed to fetch application emojis', exc_info=e)
+            else:
+                synced = valorantx.emoji_registry.sync(emojis)
+                _log.info('synced %d application emojis', synced)
 
         # database
-        await self.db.initialize()
+        with self._profile('database'):
+            # fail at startup rather than on the first riot account query
+            get_fernet()
+            await self.bus.start()
+            await self.db.initialize()
+
+        # metrics, each cluster listens on its own port
+        metrics_port = os.getenv('METRICS_PORT')
+        if metrics_port is not None:
+            self.metrics_server = MetricsServer(
+                self,
+                host=os.getenv('METRICS_HOST', '127.0.0.1'),
+                port=int(metrics_port) + (self.cluster_id or 0),
+            )
+            await self.metrics_server.start()
 
         # load cogs
-        await self.cogs_load()
+        with self._profile('extensions'):
+            await self.cogs_load()
 
         # tree sync
-        if self._tree_sync_at_startup:
-            await self.tree_sync()
+        if self._tree_sync_at_startup and self.is_primary_cluster():
+            with self._profile('tree sync'):
+                await self.tree_sync()
+
+        with self._profile('application command models'):
+            await self.tree.insert_model_to_commands()
 
-        await self.tree.insert_model_to_commands()
+        if self.startup_profiler is not None:
+            self.startup_profiler.uninstall()
+            self.startup_profiler.log_report()
 
         # valorant client
         # await self.run_valorant_client()
@@ -251,6 +320,7 @@ class LatteMaid(commands.AutoShardedBot):
         _log.info(
             f'logged in as: {self.user} '
             + (f'activity: {self.activity.name} ' if self.activity is not None else '')
+            + (f'cluster: {self.cluster_id} shards: {self.shard_ids} ' if self.cluster_id is not None else '')
             + f'servers: {len(self.guilds)} '
             + f'users: {sum(guild.member_count for guild in self.guilds if guild.member_count is not None)}'
         )
@@ -302,6 +372,10 @@ class LatteMaid(commands.AutoShardedBot):
             image = discord.Asset(state, url=str(image), key=id)
         file = await image.to_file(filename=id)
         to_bytes = file.fp
+
+        # Pillow is only needed here, no reason to pay for it at startup
+        from .utils.colorthief import ColorThief
+
         if palette > 0:
             palettes = [discord.Colour.from_rgb(*c) for c in ColorThief(to_bytes).get_palette(color_count=palette)]
         else:
@@ -314,7 +388,8 @@ class LatteMaid(commands.AutoShardedBot):
 
     async def load_extension(self, name: str, *, package: str | None = None) -> None:
         try:
-            await super().load_extension(name, package=package)
+            with self._profile(f'extension {name}'):
+                await super().load_extension(name, package=package)
         except Exception as e:
             _log.error('failed to load extension %s', name, exc_info=e)
             raise e
@@ -341,8 +416,12 @@ class LatteMaid(commands.AutoShardedBot):
 
     async def close(self) -> None:
         await self.cogs_unload()
+        await save_pending()
         await self.session.close()
         await self.db.close()
+        await self.bus.close()
+        if self.metrics_server is not None:
+            await self.metrics_server.close()
         await self.valorant_client.close()
         await super().close()
 
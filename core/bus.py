@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import socket
+from pathlib import Path
+from typing import Any, Awaitable, Callable, NamedTuple, TypeVar, Union
+
+# fmt: off
+__all__ = (
+    'BlacklistChanged',
+    'InvalidationBus',
+    'RedisTransport',
+    'RiotAccountsChanged',
+    'Transport',
+    'UnixSocketTransport',
+    'ValorantCacheCleared',
+    'register_event',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
+E = TypeVar('E', bound=tuple)
+Handler = Callable[[Any], Union[Awaitable[None], None]]
+
+REDIS_MAX_BACKOFF = 60.0
+
+
+# events
+
+
+class BlacklistChanged(NamedTuple):
+    id: int
+    removed: bool
+
+
+class RiotAccountsChanged(NamedTuple):
+    owner_id: int
+
+
+class ValorantCacheCleared(NamedTuple):
+    pass
+
+
+event_types: dict[str, type[tuple]] = {}
+
+
+def register_event(cls: type[E]) -> type[E]:
+    """Makes a NamedTuple known to the bus, its fields must be JSON serializable."""
+    event_types[cls.__name__] = cls
+    return cls
+
+
+for _event in (BlacklistChanged, RiotAccountsChanged, ValorantCacheCleared):
+    register_event(_event)
+
+
+# transports
+
+
+class Transport:
+    """Carries the encoded events between the processes."""
+
+    async def start(self, on_message: Callable[[bytes], None]) -> None:
+        raise NotImplementedError
+
+    async def send(self, data: bytes) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, on_message: Callable[[bytes], None]) -> None:
+        self.on_message: Callable[[bytes], None] = on_message
+
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        self.on_message(data)
+
+    def error_received(self, exc: Exception) -> None:
+        _log.warning('invalidation bus socket error', exc_info=exc)
+
+
+class UnixSocketTransport(Transport):
+    """Every process binds a datagram socket in ``directory`` and sends to the others.
+
+    There is no broker, a peer that died leaves a socket nobody listens on
+    and it is removed by the first process that fails to send to it.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory: Path = Path(directory)
+        self.path: Path = self.directory / f'{os.getpid()}.sock'
+        self._transport: asyncio.DatagramTransport | None = None
+        self._sender: socket.socket | None = None
+
+    async def start(self, on_message: Callable[[bytes], None]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with contextlib.suppress(FileNotFoundError):
+            self.path.unlink()
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(str(self.path))
+        sock.setblocking(False)
+        self._transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+            lambda: _DatagramProtocol(on_message),
+            sock=sock,
+        )
+        self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sender.setblocking(False)
+        _log.info('invalidation bus listening on %s', self.path)
+
+    async def send(self, data: bytes) -> None:
+        if self._sender is None:
+            return
+        for peer in self.directory.glob('*.sock'):
+            if peer == self.path:
+                continue
+            try:
+                self._sender.sendto(data, str(peer))
+            except (ConnectionRefusedError, FileNotFoundError):
+                _log.debug('removing stale invalidation bus socket %s', peer)
+                with contextlib.suppress(OSError):
+                    peer.unlink()
+            except BlockingIOError:
+                _log.warning('invalidation bus peer %s is not reading, dropped an event', peer)
+            except OSError as e:
+                _log.warning('failed to send to invalidation bus peer %s', peer, exc_info=e)
+
+    async def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        if self._sender is not None:
+            self._sender.close()
+            self._sender = None
+        with contextlib.suppress(FileNotFoundError):
+            self.path.unlink()
+
+
+class RedisTransport(Transport):
+    """Publishes the events on a redis channel, for processes on several hosts.
+
+    A lost connection is retried with a backoff, the events published meanwhile are not received.
+    """
+
+    def __init__(self, url: str, channel: str = 'lattemaid:invalidation') -> None:
+        self.url: str = url
+        self.channel: str = channel
+        self._redis: Any = None
+        self._reader: asyncio.Task[None] | None = None
+
+    async def start(self, on_message: Callable[[bytes], None]) -> None:
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError('redis is required for a redis invalidation bus') from e
+
+        self._redis = redis.from_url(self.url)
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.channel)
+        _log.info('invalidation bus subscribed to %s', self.channel)
+
+        self._reader = asyncio.create_task(self._read(pubsub, on_message))
+        self._reader.add_done_callback(self._on_reader_done)
+
+    async def _read(self, pubsub: Any, on_message: Callable[[bytes], None]) -> None:
+        backoff = 1.0
+        while True:
+            try:
+                async for message in pubsub.listen():
+                    backoff = 1.0
+                    if message['type'] == 'message':
+                        on_message(message['data'])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                _log.warning('invalidation bus lost %s, reconnecting in %.0fs', self.channel, backoff, exc_info=e)
+            else:
+                _log.warning('invalidation bus stopped reading %s, reconnecting in %.0fs', self.channel, backoff)
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, REDIS_MAX_BACKOFF)
+            try:
+                await pubsub.reset()
+                await pubsub.subscribe(self.channel)
+            except Exception as e:
+                _log.warning('failed to subscribe to %s', self.channel, exc_info=e)
+            else:
+                _log.info('invalidation bus subscribed to %s again', self.channel)
+
+    def _on_reader_done(self, task: asyncio.Task[None]) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            _log.error('invalidation bus reader of %s stopped', self.channel, exc_info=task.exception())
+
+    async def send(self, data: bytes) -> None:
+        if self._redis is not None:
+            await self._redis.publish(self.channel, data)
+
+    async def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+
+# bus
+
+
+class InvalidationBus:
+    """Tells the other processes which of their cached state is stale.
+
+    Without a transport the events only reach the handlers of this process.
+    """
+
+    def __init__(self, transport: Transport | None = None) -> None:
+        self.transport: Transport | None = transport
+        self.origin: str = f'{socket.gethostname()}:{os.getpid()}'
+        self._handlers: dict[type[tuple], list[Handler]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @classmethod
+    def from_url(cls, url: str | None) -> InvalidationBus:
+        """Creates the bus from ``unix:<directory>``, ``redis://...`` or nothing."""
+        if not url:
+            return cls()
+        if url.startswith('unix:'):
+            return cls(UnixSocketTransport(url[len('unix:') :]))
+        if url.startswith(('redis://', 'rediss://')):
+            return cls(RedisTransport(url))
+        raise ValueError(f'unsupported invalidation bus url {url!r}')
+
+    def subscribe(self, event_type: type[E], handler: Callable[[E], Awaitable[None] | None]) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type: type[E], handler: Callable[[E], Awaitable[None] | None]) -> None:
+        with contextlib.suppress(KeyError, ValueError):
+            self._handlers[event_type].remove(handler)
+
+    async def start(self) -> None:
+        if self.transport is not None:
+            await self.transport.start(self._on_message)
+
+    async def close(self) -> None:
+        if self.transport is not None:
+            await self.transport.close()
+        for task in self._tasks:
+            task.cancel()
+
+    async def publish(self, event: tuple, *, local: bool = True) -> None:
+        """|coro|
+
+        Sends the event to the other processes, ``local`` also runs the handlers of this one.
+        A failure to send is logged and never raised, the caller already changed its state.
+        """
+        if local:
+            self.dispatch(event)
+        if self.transport is None:
+            return
+
+        data = json.dumps({'origin': self.origin, 'type': type(event).__name__, 'data': list(event)}).encode()
+        try:
+            await self.transport.send(data)
+        except Exception as e:
+            _log.warning('failed to publish %r', event, exc_info=e)
+
+    def dispatch(self, event: tuple) -> None:
+        for handler in self._handlers.get(type(event), []):
+            try:
+                result = handler(event)
+            except Exception as e:
+                _log.error('invalidation handler %r failed for %r', handler, event, exc_info=e)
+                continue
+            if result is not None:
+                task = asyncio.ensure_future(result)
+                self._tasks.add(task)
+                task.add_done_callback(self._on_handler_done)
+
+    def _on_handler_done(self, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            _log.error('invalidation handler failed', exc_info=task.exception())
+
+    def _on_message(self, data: bytes) -> None:
+        try:
+            payload = json.loads(data)
+            if payload['origin'] == self.origin:
+                return
+            event = event_types[payload['type']](*payload['data'])
+        except Exception as e:
+            _log.warning('ignoring malformed invalidation event %r', data[:256], exc_info=e)
+            return
+        _log.debug('received %r from %s', event, payload['origin'])
+        self.dispatch(event)
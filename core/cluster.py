@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+import sys
+import time
+from typing import Sequence
+
+import aiohttp
+
+# fmt: off
+__all__ = (
+    'Cluster',
+    'ClusterSupervisor',
+    'WORKER_LOG_FORMAT',
+    'fetch_recommended_shards',
+    'split_shards',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
+# the workers log in this format on stderr, the supervisor parses it back into records
+WORKER_LOG_FORMAT = '{levelname}|{name}|{message}'
+
+# discord allows one identify per 5 seconds per bucket
+IDENTIFY_DELAY = 5.0
+# a worker that ran at least this long before crashing is restarted without backoff
+HEALTHY_UPTIME = 60.0
+MAX_BACKOFF = 60.0
+SHUTDOWN_TIMEOUT = 30.0
+
+
+def split_shards(shard_count: int, clusters: int) -> list[list[int]]:
+    """Splits the shards into contiguous ranges, one per cluster."""
+    if clusters < 1:
+        raise ValueError('at least one cluster is required')
+    clusters = min(clusters, shard_count)
+    size, extra = divmod(shard_count, clusters)
+    ranges: list[list[int]] = []
+    start = 0
+    for index in range(clusters):
+        end = start + size + (1 if index < extra else 0)
+        ranges.append(list(range(start, end)))
+        start = end
+    return ranges
+
+
+async def fetch_recommended_shards(token: str) -> int:
+    """|coro|
+
+    Returns the shard count recommended by discord for the bot.
+    """
+    headers = {'Authorization': f'Bot {token}'}
+    async with aiohttp.ClientSession() as session:
+        async with session.get('https://discord.com/api/v10/gateway/bot', headers=headers) as response:
+            response.raise_for_status()
+            data = await response.json()
+    return data['shards']
+
+
+class Cluster:
+    """A worker process running the bot for a range of shards."""
+
+    def __init__(self, cluster_id: int, shard_ids: list[int], shard_count: int, argv: Sequence[str]) -> None:
+        self.id: int = cluster_id
+        self.shard_ids: list[int] = shard_ids
+        self.shard_count: int = shard_count
+        self.argv: list[str] = list(argv)
+        self.process: asyncio.subprocess.Process | None = None
+        self.started_at: float = 0.0
+        self.restarts: int = 0
+        self._log: logging.Logger = logging.getLogger(f'{__name__}.{cluster_id}')
+
+    def __repr__(self) -> str:
+        return f'<Cluster id={self.id} shard_ids={self.shard_ids!r} restarts={self.restarts}>'
+
+    @property
+    def pid(self) -> int | None:
+        return self.process.pid if self.process is not None else None
+
+    def command(self) -> list[str]:
+        return [
+            sys.executable,
+            *self.argv,
+            '--cluster-id',
+            str(self.id),
+            '--shard-ids',
+            ','.join(map(str, self.shard_ids)),
+            '--shard-count',
+            str(self.shard_count),
+        ]
+
+    async def spawn(self) -> None:
+        env = dict(os.environ, PYTHONUNBUFFERED='1')
+        self.process = await asyncio.create_subprocess_exec(
+            *self.command(),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+        )
+        self.started_at = time.monotonic()
+        self._log.info('started cluster %d with shards %s (pid %d)', self.id, self.shard_ids, self.process.pid)
+
+    async def relay_logs(self) -> None:
+        """Re-emits the log lines of the worker through the logging of the supervisor."""
+        assert self.process is not None
+        streams = [stream for stream in (self.process.stdout, self.process.stderr) if stream is not None]
+        await asyncio.gather(*(self._relay(stream) for stream in streams))
+
+    async def _relay(self, stream: asyncio.StreamReader) -> None:
+        level, name = logging.INFO, self._log.name
+        while True:
+            line = await stream.readline()
+            if not line:
+                return
+            text = line.decode('utf-8', 'replace').rstrip()
+            if not text:
+                continue
+            levelname, _, rest = text.partition('|')
+            record_name, sep, message = rest.partition('|')
+            if sep and isinstance(logging.getLevelName(levelname), int):
+                level, name = logging.getLevelName(levelname), record_name
+            else:
+                # continuation lines such as tracebacks keep the last level
+                message = text
+            logging.getLogger(name).log(level, '[cluster %d] %s', self.id, message)
+
+    def terminate(self) -> None:
+        if self.process is not None and self.process.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                self.process.terminate()
+
+    def kill(self) -> None:
+        if self.process is not None and self.process.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                self.process.kill()
+
+
+class ClusterSupervisor:
+    """Runs one process per cluster and restarts the ones that crash.
+
+    Every worker owns its gateway connections, its valorant client and its
+    database pool, the supervisor only starts them and aggregates their logs.
+    """
+
+    def __init__(self, shard_count: int, clusters: int, argv: Sequence[str]) -> None:
+        self.clusters: list[Cluster] = [
+            Cluster(cluster_id, shard_ids, shard_count, argv)
+            for cluster_id, shard_ids in enumerate(split_shards(shard_count, clusters))
+        ]
+        self._closing: asyncio.Event = asyncio.Event()
+
+    def is_closing(self) -> bool:
+        return self._closing.is_set()
+
+    def close(self) -> None:
+        if not self._closing.is_set():
+            _log.info('stopping %d clusters', len(self.clusters))
+            self._closing.set()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            with contextlib.suppress(NotImplementedError):
+                loop.add_signal_handler(sig, self.close)
+
+        tasks: list[asyncio.Task[None]] = []
+        try:
+            for cluster in self.clusters:
+                if self.is_closing():
+                    break
+                tasks.append(asyncio.create_task(self._supervise(cluster), name=f'cluster-{cluster.id}'))
+                # stagger the identifies of the clusters
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._closing.wait(), timeout=IDENTIFY_DELAY * len(cluster.shard_ids))
+            # until a signal arrives or every cluster exited cleanly
+            closing = asyncio.ensure_future(self._closing.wait())
+            await asyncio.wait([closing, asyncio.gather(*tasks)], return_when=asyncio.FIRST_COMPLETED)
+            closing.cancel()
+        finally:
+            self.close()
+            await self._shutdown()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _supervise(self, cluster: Cluster) -> None:
+        backoff = 1.0
+        while not self.is_closing():
+            await cluster.spawn()
+            assert cluster.process is not None
+            if self.is_closing():
+                # the shutdown started while spawning
+                cluster.terminate()
+            relay = asyncio.create_task(cluster.relay_logs())
+            code = await cluster.process.wait()
+            await relay
+
+            if self.is_closing():
+                return
+            if code == 0:
+                _log.info('cluster %d exited cleanly, not restarting it', cluster.id)
+                return
+
+            uptime = time.monotonic() - cluster.started_at
+            if uptime >= HEALTHY_UPTIME:
+                backoff = 1.0
+            cluster.restarts += 1
+            _log.error(
+                'cluster %d exited with code %d after %.0fs, restarting in %.0fs',
+                cluster.id,
+                code,
+                uptime,
+                backoff,
+            )
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._closing.wait(), timeout=backoff)
+            backoff = min(backoff * 2, MAX_BACKOFF)
+
+    async def _shutdown(self) -> None:
+        running = [cluster for cluster in self.clusters if cluster.process is not None]
+        for cluster in running:
+            cluster.terminate()
+
+        async def wait(cluster: Cluster) -> None:
+            assert cluster.process is not None
+            try:
+                await asyncio.wait_for(cluster.process.wait(), timeout=SHUTDOWN_TIMEOUT)
+            except asyncio.TimeoutError:
+                _log.warning('cluster %d did not stop in time, killing it', cluster.id)
+                cluster.kill()
+                await cluster.process.wait()
+
+        await asyncio.gather(*(wait(cluster) for cluster in running))
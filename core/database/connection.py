@@ -2,10 +2,10 @@
 import asyncio
 import datetime
 import logging
-from typing import AsyncIterator
+from typing import AsyncIterator, Iterable
 
 from sqlalchemy import select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from .errors import (
@@ -23,6 +23,8 @@ from .errors import (
 from .models.app_command import AppCommand
 from .models.base import Base
 from .models.blacklist import BlackList
+from .models.match_history import MatchHistoryEntry
+from .models.mmr_history import MMRHistory
 from .models.notification import Notification
 from .models.notification_settings import NotificationSettings
 from .models.riot_account import RiotAccount
@@ -53,6 +55,10 @@ class DatabaseConnection:
     def is_closed(self) -> bool:
         return self._is_closed
 
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._async_engine
+
     async def initialize(self, drop_table: bool = False) -> None:
         self._async_engine = create_async_engine(self.__uri, echo=self._echo)
         self._async_session = async_sessionmaker(self._async_engine, expire_on_commit=False, autoflush=False)
@@ -127,8 +133,10 @@ class DatabaseConnection:
             user = await User.find_by_id(session, id)
             if not user:
                 raise UserDoesNotExist(id)
+            puuids = [riot_account.puuid for riot_account in user.riot_accounts]
             try:
                 await User.delete(session, user)
+                await self._remove_unlinked_history(session, puuids)
             except SQLAlchemyError as e:
                 await session.rollback()
                 self._log.error(f'failed to delete user with id {id!r} due to {e!r}')
@@ -207,6 +215,132 @@ class DatabaseConnection:
             async for app_command in AppCommand.find_all_by_name(session, name):
                 yield app_command
 
+    # match history
+
+    async def add_match_history_entries(
+        self,
+        puuid: str,
+        entries: Iterable[tuple[str, str, datetime.datetime]],
+    ) -> list[MatchHistoryEntry]:
+        entries = list(entries)
+        async with self._async_session() as session:
+            # a concurrent sync may add the same matches between the read and the insert, then it is tried again
+            for _ in range(2):
+                known = await MatchHistoryEntry.find_match_ids(session, puuid, (match_id for match_id, _, _ in entries))
+                try:
+                    rows = await MatchHistoryEntry.create_all(
+                        session,
+                        puuid,
+                        (entry for entry in entries if entry[0] not in known),
+                    )
+                    await session.commit()
+                except IntegrityError as e:
+                    self._log.debug(f'match history entries for puuid {puuid!r} were added concurrently: {e!r}')
+                    await session.rollback()
+                    continue
+                self._log.debug(f'added {len(rows)} match history entries for puuid {puuid!r}')
+                return rows
+
+            self._log.error(f'failed to add match history entries for puuid {puuid!r}')
+            return []
+
+    async def fetch_match_history_entries(
+        self,
+        puuid: str,
+        *,
+        queue_id: str | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[MatchHistoryEntry]:
+        async with self._async_session() as session:
+            async for entry in MatchHistoryEntry.find_all_by_puuid(session, puuid, queue_id=queue_id, limit=limit):
+                yield entry
+
+    async def fetch_latest_match_history_entry(self, puuid: str, /) -> MatchHistoryEntry | None:
+        async with self._async_session() as session:
+            return await MatchHistoryEntry.find_latest_by_puuid(session, puuid)
+
+    async def fetch_known_match_ids(self, puuid: str, match_ids: Iterable[str]) -> set[str]:
+        async with self._async_session() as session:
+            return await MatchHistoryEntry.find_match_ids(session, puuid, match_ids)
+
+    async def _remove_unlinked_history(self, session: AsyncSession, puuids: Iterable[str]) -> None:
+        # the match and mmr history of a player are kept while any user still has the account linked
+        for puuid in set(puuids):
+            if not await RiotAccount.exists_by_puuid(session, puuid):
+                await MatchHistoryEntry.delete_all_by_puuid(session, puuid)
+                await MMRHistory.delete_all_by_puuid(session, puuid)
+                self._log.info(f'deleted match and mmr history for unlinked puuid {puuid!r}')
+
+    async def remove_match_history_entries(self, puuid: str, /) -> bool:
+        async with self._async_session() as session:
+            try:
+                await MatchHistoryEntry.delete_all_by_puuid(session, puuid)
+            except SQLAlchemyError as e:
+                self._log.error(f'failed to delete match history for puuid {puuid!r}: {e!r}')
+                await session.rollback()
+                return False
+            else:
+                await session.commit()
+                self._log.info(f'deleted match history for puuid {puuid!r}')
+                return True
+
+    # mmr history
+
+    async def add_mmr_history(
+        self,
+        puuid: str,
+        points: Iterable[tuple[datetime.datetime, int, int, str]],
+    ) -> list[MMRHistory]:
+        # the same competitive update may be fetched more than once
+        points = {point[0]: point for point in points}
+        async with self._async_session() as session:
+            for _ in range(2):
+                known = await MMRHistory.find_recorded_at(session, puuid, points)
+                try:
+                    rows = await MMRHistory.create_all(
+                        session,
+                        puuid,
+                        (point for recorded_at, point in points.items() if recorded_at not in known),
+                    )
+                    await session.commit()
+                except IntegrityError as e:
+                    self._log.debug(f'mmr history points for puuid {puuid!r} were added concurrently: {e!r}')
+                    await session.rollback()
+                    continue
+                self._log.debug(f'added {len(rows)} mmr history points for puuid {puuid!r}')
+                return rows
+
+            self._log.error(f'failed to add mmr history points for puuid {puuid!r}')
+            return []
+
+    async def fetch_mmr_history(
+        self,
+        puuid: str,
+        *,
+        season_id: str | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[MMRHistory]:
+        async with self._async_session() as session:
+            async for point in MMRHistory.find_all_by_puuid(session, puuid, season_id=season_id, limit=limit):
+                yield point
+
+    async def fetch_latest_mmr_history(self, puuid: str, /) -> MMRHistory | None:
+        async with self._async_session() as session:
+            return await MMRHistory.find_latest_by_puuid(session, puuid)
+
+    async def remove_mmr_history(self, puuid: str, /) -> bool:
+        async with self._async_session() as session:
+            try:
+                await MMRHistory.delete_all_by_puuid(session, puuid)
+            except SQLAlchemyError as e:
+                self._log.error(f'failed to delete mmr history for puuid {puuid!r}: {e!r}')
+                await session.rollback()
+                return False
+            else:
+                await session.commit()
+                self._log.info(f'deleted mmr history for puuid {puuid!r}')
+                return True
+
     # riot account
 
     async def add_riot_account(
@@ -253,6 +387,10 @@ class DatabaseConnection:
             self._log.info(f'created riot account {game_name}#{tag_line}({puuid}) for user with id {owner_id}')
             return riot_account
 
+    async def is_riot_account_linked(self, puuid: str, /) -> bool:
+        async with self._async_session() as session:
+            return await RiotAccount.exists_by_puuid(session, puuid)
+
     async def fetch_riot_account_by_puuid_and_owner_id(self, puuid: str, owner_id: int) -> RiotAccount | None:
         async with self._async_session() as session:
             riot_account = await RiotAccount.find_by_puuid_and_owner_id(session, puuid, owner_id)
@@ -325,6 +463,7 @@ class DatabaseConnection:
 
             try:
                 await RiotAccount.delete(session, riot_account)
+                await self._remove_unlinked_history(session, [puuid])
             except SQLAlchemyError as e:
                 self._log.error(f'failed to delete riot account with puuid {puuid!r} for user with id {owner_id!r}: {e!r}')
                 await session.rollback()
@@ -336,8 +475,10 @@ class DatabaseConnection:
 
     async def remove_riot_accounts(self, owner_id: int) -> bool:
         async with self._async_session() as session:
+            puuids = [riot_account.puuid async for riot_account in RiotAccount.find_all_by_owner_id(session, owner_id)]
             try:
                 await RiotAccount.delete_all_by_owner_id(session, owner_id)
+                await self._remove_unlinked_history(session, puuids)
             except SQLAlchemyError as e:
                 self._log.error(f'failed to delete all riot accounts for user with id {owner_id!r}: {e!r}')
                 await session.rollback()
@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-from cryptography.fernet import Fernet, MultiFernet
+if TYPE_CHECKING:
+    from cryptography.fernet import MultiFernet
 
 __all__ = (
     'Encryption',
@@ -21,11 +25,17 @@ class Encryption(ABC):
 class FernetEngine(Encryption):
     def __init__(self, keys: tuple[str | bytes, ...]) -> None:
         self.__keys: tuple[str | bytes, ...] = keys
-        self.fernet: MultiFernet = MultiFernet([Fernet(key) for key in self.__keys])
+        self.fernet: MultiFernet = self.__build(self.__keys)
+
+    @staticmethod
+    def __build(keys: tuple[str | bytes, ...]) -> MultiFernet:
+        from cryptography.fernet import Fernet, MultiFernet
+
+        return MultiFernet([Fernet(key) for key in keys])
 
     def add_key(self, key: str | bytes) -> None:
         self.__keys += (key,)
-        self.fernet = MultiFernet([Fernet(key) for key in self.__keys])
+        self.fernet = self.__build(self.__keys)
 
     def rotate(self, value: bytes) -> bytes:
         return self.fernet.rotate(value)
@@ -1,6 +1,8 @@
 from .app_command import *
 from .base import *
 from .blacklist import *
+from .match_history import *
+from .mmr_history import *
 from .notification import *
 from .notification_settings import *
 from .riot_account import *
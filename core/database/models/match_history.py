@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, AsyncIterator, Iterable
+
+from sqlalchemy import Index, String, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+# fmt: off
+__all__ = (
+    'MatchHistoryEntry',
+)
+# fmt: on
+
+
+class MatchHistoryEntry(Base):
+    __tablename__ = 'match_history'
+    __table_args__ = (Index('match_history_puuid_started_at_idx', 'puuid', 'started_at'),)
+
+    puuid: Mapped[str] = mapped_column('puuid', String(length=36), primary_key=True)
+    match_id: Mapped[str] = mapped_column('match_id', String(length=36), primary_key=True)
+    queue_id: Mapped[str] = mapped_column('queue_id', String(length=32), nullable=False, default='')
+    started_at: Mapped[datetime.datetime] = mapped_column('started_at', nullable=False)
+
+    @classmethod
+    async def find_all_by_puuid(
+        cls,
+        session: AsyncSession,
+        puuid: str,
+        *,
+        queue_id: str | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[Self]:
+        stmt = select(cls).where(cls.puuid == puuid)
+        if queue_id is not None:
+            stmt = stmt.where(cls.queue_id == queue_id)
+        stmt = stmt.order_by(cls.started_at.desc()).limit(limit)
+        stream = await session.stream_scalars(stmt)
+        async for row in stream:
+            yield row
+
+    @classmethod
+    async def find_latest_by_puuid(cls, session: AsyncSession, puuid: str) -> Self | None:
+        stmt = select(cls).where(cls.puuid == puuid)
+        return await session.scalar(stmt.order_by(cls.started_at.desc()).limit(1))
+
+    @classmethod
+    async def find_match_ids(cls, session: AsyncSession, puuid: str, match_ids: Iterable[str]) -> set[str]:
+        stmt = select(cls.match_id).where(cls.puuid == puuid).where(cls.match_id.in_(list(match_ids)))
+        return set(await session.scalars(stmt))
+
+    @classmethod
+    async def create_all(
+        cls,
+        session: AsyncSession,
+        puuid: str,
+        entries: Iterable[tuple[str, str, datetime.datetime]],
+    ) -> list[Self]:
+        rows = [
+            cls(puuid=puuid, match_id=match_id, queue_id=queue_id, started_at=started_at)
+            for match_id, queue_id, started_at in entries
+        ]
+        session.add_all(rows)
+        await session.flush()
+        return rows
+
+    @classmethod
+    async def delete_all_by_puuid(cls, session: AsyncSession, puuid: str) -> None:
+        stmt = delete(cls).where(cls.puuid == puuid)
+        await session.execute(stmt)
+        await session.flush()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, AsyncIterator, Iterable
+
+from sqlalchemy import String, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+# fmt: off
+__all__ = (
+    'MMRHistory',
+)
+# fmt: on
+
+
+class MMRHistory(Base):
+    __tablename__ = 'mmr_history'
+
+    puuid: Mapped[str] = mapped_column('puuid', String(length=36), primary_key=True)
+    recorded_at: Mapped[datetime.datetime] = mapped_column('recorded_at', primary_key=True)
+    tier: Mapped[int] = mapped_column('tier', nullable=False)
+    rr: Mapped[int] = mapped_column('rr', nullable=False)
+    season_id: Mapped[str] = mapped_column('season_id', String(length=36), nullable=False)
+
+    @classmethod
+    async def find_all_by_puuid(
+        cls,
+        session: AsyncSession,
+        puuid: str,
+        *,
+        season_id: str | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[Self]:
+        """The latest ``limit`` points of the player, oldest first."""
+        stmt = select(cls).where(cls.puuid == puuid)
+        if season_id is not None:
+            stmt = stmt.where(cls.season_id == season_id)
+        latest = stmt.order_by(cls.recorded_at.desc()).limit(limit).subquery()
+        stmt = select(cls).join(latest, (cls.puuid == latest.c.puuid) & (cls.recorded_at == latest.c.recorded_at))
+        stream = await session.stream_scalars(stmt.order_by(cls.recorded_at))
+        async for row in stream:
+            yield row
+
+    @classmethod
+    async def find_latest_by_puuid(cls, session: AsyncSession, puuid: str) -> Self | None:
+        stmt = select(cls).where(cls.puuid == puuid)
+        return await session.scalar(stmt.order_by(cls.recorded_at.desc()).limit(1))
+
+    @classmethod
+    async def find_recorded_at(
+        cls,
+        session: AsyncSession,
+        puuid: str,
+        recorded_at: Iterable[datetime.datetime],
+    ) -> set[datetime.datetime]:
+        stmt = select(cls.recorded_at).where(cls.puuid == puuid).where(cls.recorded_at.in_(list(recorded_at)))
+        return set(await session.scalars(stmt))
+
+    @classmethod
+    async def create_all(
+        cls,
+        session: AsyncSession,
+        puuid: str,
+        points: Iterable[tuple[datetime.datetime, int, int, str]],
+    ) -> list[Self]:
+        rows = [
+            cls(puuid=puuid, recorded_at=recorded_at, tier=tier, rr=rr, season_id=season_id)
+            for recorded_at, tier, rr, season_id in points
+        ]
+        session.add_all(rows)
+        await session.flush()
+        return rows
+
+    @classmethod
+    async def delete_all_by_puuid(cls, session: AsyncSession, puuid: str) -> None:
+        stmt = delete(cls).where(cls.puuid == puuid)
+        await session.execute(stmt)
+        await session.flush()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import os
 from typing import TYPE_CHECKING, AsyncIterator
 
@@ -24,12 +25,16 @@ __all__ = (
 )
 # fmt: on
 
-load_dotenv()
 
-if 'CRYPTOGRAPHY_KEYS' not in os.environ:
-    raise RuntimeError('CRYPTOGRAPHY_KEYS is not set in the environment')
+@functools.cache
+def get_fernet() -> FernetEngine:
+    # built on first use instead of at import time, importing the models stays cheap
+    load_dotenv()
 
-fernet = FernetEngine(tuple(os.environ['CRYPTOGRAPHY_KEYS'].split(',')))
+    if 'CRYPTOGRAPHY_KEYS' not in os.environ:
+        raise RuntimeError('CRYPTOGRAPHY_KEYS is not set in the environment')
+
+    return FernetEngine(tuple(os.environ['CRYPTOGRAPHY_KEYS'].split(',')))
 
 
 class RiotAccount(Base):
@@ -61,35 +66,35 @@ class RiotAccount(Base):
     # NOTE: that there is no point in using a hybrid_property in this case, as your database can't encrypt and decrypt on the server side.
     @property
     def id_token(self) -> str:
-        return fernet.decrypt(self._id_token.encode())
+        return get_fernet().decrypt(self._id_token.encode())
 
     @id_token.setter
     def id_token(self, value: str) -> None:
-        self._id_token = fernet.encrypt(value.encode())
+        self._id_token = get_fernet().encrypt(value.encode())
 
     @property
     def access_token(self) -> str:
-        return fernet.decrypt(self._access_token.encode())
+        return get_fernet().decrypt(self._access_token.encode())
 
     @access_token.setter
     def access_token(self, value: str) -> None:
-        self._access_token = fernet.encrypt(value.encode())
+        self._access_token = get_fernet().encrypt(value.encode())
 
     @property
     def entitlements_token(self) -> str:
-        return fernet.decrypt(self._entitlements_token.encode())
+        return get_fernet().decrypt(self._entitlements_token.encode())
 
     @entitlements_token.setter
     def entitlements_token(self, value: str) -> None:
-        self._entitlements_token = fernet.encrypt(value.encode())
+        self._entitlements_token = get_fernet().encrypt(value.encode())
 
     @property
     def ssid(self) -> str:
-        return fernet.decrypt(self._ssid.encode())
+        return get_fernet().decrypt(self._ssid.encode())
 
     @ssid.setter
     def ssid(self, value: str) -> None:
-        self._ssid = fernet.encrypt(value.encode())
+        self._ssid = get_fernet().encrypt(value.encode())
 
     @hybrid_method
     def is_main_account(self) -> bool:
@@ -118,6 +123,11 @@ class RiotAccount(Base):
         stmt = select(cls).where(cls.id == id)
         return await session.scalar(stmt.order_by(cls.id))
 
+    @classmethod
+    async def exists_by_puuid(cls, session: AsyncSession, puuid: str) -> bool:
+        stmt = select(cls.id).where(cls.puuid == puuid).limit(1)
+        return await session.scalar(stmt) is not None
+
     @classmethod
     async def find_by_puuid_and_owner_id(cls, session: AsyncSession, puuid: str, owner_id: int) -> Self | None:
         stmt = select(cls).where(cls.puuid == puuid).where(cls.owner_id == owner_id)
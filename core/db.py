@@ -2,10 +2,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from typing import TYPE_CHECKING, Any
 
+from core.bus import BlacklistChanged, RiotAccountsChanged
 from core.database.connection import DatabaseConnection as _DatabaseConnection
 from core.database.models.blacklist import BlackList
 
+if TYPE_CHECKING:
+    from core.bus import InvalidationBus
+    from core.database.models.riot_account import RiotAccount
+
 # fmt: off
 __all__ = (
     'DatabaseConnection',
@@ -14,11 +20,19 @@ __all__ = (
 
 
 class DatabaseConnection(_DatabaseConnection):
-    def __init__(self, uri: str, echo: bool = False) -> None:
+    def __init__(self, uri: str, echo: bool = False, *, bus: InvalidationBus | None = None) -> None:
         super().__init__(uri, echo=echo)
         self._log = logging.getLogger(__name__)
         self._blacklist: dict[int, BlackList] = {}
         self.lock = asyncio.Lock()
+        # tells the other processes about the changes made by this one
+        self.bus: InvalidationBus | None = bus
+        if bus is not None:
+            bus.subscribe(BlacklistChanged, self._on_blacklist_changed)
+
+    async def _publish(self, event: tuple, *, local: bool = True) -> None:
+        if self.bus is not None:
+            await self.bus.publish(event, local=local)
 
     async def initialize(self, drop_table: bool = False) -> None:
         await super().initialize(drop_table)
@@ -45,6 +59,7 @@ class DatabaseConnection(_DatabaseConnection):
     async def add_blacklist(self, id: int, /, *, reason: str | None = None) -> BlackList:
         blacklist = await super().add_blacklist(id)
         self._blacklist[blacklist.id] = blacklist
+        await self._publish(BlacklistChanged(blacklist.id, removed=False), local=False)
         return blacklist
 
     def get_blacklist(self, id: int, /) -> BlackList | None:
@@ -52,9 +67,49 @@ class DatabaseConnection(_DatabaseConnection):
 
     async def remove_blacklist(self, id: int, /) -> None:
         await super().remove_blacklist(id)
+        await self._publish(BlacklistChanged(id, removed=True), local=False)
         try:
             del self._blacklist[id]
         except KeyError:
             pass
         else:
             self._log.info('deleted blacklist %d from cache', id)
+
+    async def _on_blacklist_changed(self, event: BlacklistChanged) -> None:
+        if event.removed:
+            self._blacklist.pop(event.id, None)
+            return
+        blacklist = await super().fetch_blacklist(event.id)
+        if blacklist is not None:
+            self._blacklist[blacklist.id] = blacklist
+
+    # users and riot accounts, the account managers built from them are stale after a change
+
+    async def remove_user(self, id: int, /) -> bool:
+        removed = await super().remove_user(id)
+        if removed:
+            await self._publish(RiotAccountsChanged(id))
+        return removed
+
+    async def add_riot_account(self, owner_id: int, **kwargs: Any) -> RiotAccount:
+        riot_account = await super().add_riot_account(owner_id, **kwargs)
+        await self._publish(RiotAccountsChanged(owner_id))
+        return riot_account
+
+    async def update_riot_account(self, puuid: str, owner_id: int, **kwargs: Any) -> bool:
+        updated = await super().update_riot_account(puuid, owner_id, **kwargs)
+        if updated:
+            await self._publish(RiotAccountsChanged(owner_id))
+        return updated
+
+    async def remove_riot_account(self, puuid: str, owner_id: int) -> RiotAccount | None:
+        riot_account = await super().remove_riot_account(puuid, owner_id)
+        if riot_account is not None:
+            await self._publish(RiotAccountsChanged(owner_id))
+        return riot_account
+
+    async def remove_riot_accounts(self, owner_id: int) -> bool:
+        removed = await super().remove_riot_accounts(owner_id)
+        if removed:
+            await self._publish(RiotAccountsChanged(owner_id))
+        return removed
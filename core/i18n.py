@@ -5,6 +5,7 @@ import contextlib
 import json
 import logging
 import os
+import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar, overload
 
@@ -13,6 +14,7 @@ from discord import Locale
 __all__ = (
     'I18n',
     'cog_i18n',
+    'save_pending',
 )
 
 if TYPE_CHECKING:
@@ -33,8 +35,14 @@ def get_path(
     return cog_folder / 'locales' / 'strings' / '{locale}.{fmt}'.format(locale=locale, fmt=fmt)
 
 
-# i18ns: dict[str, I18n] = {}
-# TODO: add i18n to bot
+i18ns: dict[str, I18n] = {}
+
+
+async def save_pending() -> None:
+    """Writes the locales still waiting on the save delay, the bot calls this when it closes."""
+    for i18n in list(i18ns.values()):
+        if i18n.is_dirty():
+            await i18n.save()
 
 
 class I18n:
@@ -49,19 +57,23 @@ class I18n:
         *,
         read_only: bool = False,
         load_later: bool = False,
+        save_delay: float = 5.0,
     ) -> None:
         self.cog_folder: Path = Path(file_location).resolve().parent
         self.cog_name: str = name
         self.supported_locales: list[Locale] = supported_locales
         self.read_only: bool = read_only
+        self.save_delay: float = save_delay
         self.loop = asyncio.get_event_loop()
         self.lock = asyncio.Lock()
         self._data: dict[str, dict[str, dict[str, str]]] = {}
+        self._dirty: set[str] = set()
+        self._save_handle: asyncio.TimerHandle | None = None
         if load_later:
             self.loop.create_task(self.load())
         else:
             self._load()
-        # i18ns[self.cog_name] = self
+        i18ns[self.cog_name] = self
 
     async def load(self) -> None:
         async with self.lock:
@@ -70,40 +82,81 @@ class I18n:
     def _load(self) -> None:
         for locale in self.supported_locales:
             self.load_from_file(locale.value)
-        if not self.read_only:
-            self.loop.create_task(self.save())
+        # only write back locales that are missing on disk
+        if self._dirty:
+            self.loop.call_soon_threadsafe(self.schedule_save)
         _log.info(f'loaded cogs.{self.cog_name}')
 
     def load_from_file(self, locale: str) -> None:
         locale_path = get_path(self.cog_folder, locale)
         if not locale_path.exists():
             self._data[locale] = {}
+            self.mark_dirty(locale)
 
         with contextlib.suppress(IOError, FileNotFoundError):
             with locale_path.open(encoding='utf-8') as file:
                 self._data[locale] = json.load(file)
 
+    def is_dirty(self, locale: str | None = None) -> bool:
+        if locale is None:
+            return bool(self._dirty)
+        return locale in self._dirty
+
+    def mark_dirty(self, locale: str) -> None:
+        if self.read_only:
+            return
+        self._dirty.add(locale)
+
+    def schedule_save(self) -> None:
+        """Debounces :meth:`save`, every call within ``save_delay`` seconds pushes the write back."""
+        if self.read_only or not self._dirty:
+            return
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+        self._save_handle = self.loop.call_later(self.save_delay, self._flush)
+
+    def _flush(self) -> None:
+        self._save_handle = None
+        self.loop.create_task(self.save())
+
     async def save(self) -> None:
-        for locale in self._data:
-            async with self.lock:
-                await self.loop.run_in_executor(None, self._dump, locale)
-        _log.debug(f'saved i18n for {self.cog_name}')
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
 
-    def _dump(self, locale: str) -> None:
-        if locale not in self._data:
-            self._data[locale] = {}
+        async with self.lock:
+            for locale in list(self._dirty):
+                # snapshot on the loop thread, the executor must not see a dict being mutated
+                data = self._data.setdefault(locale, {}).copy()
+                try:
+                    await self.loop.run_in_executor(None, self._dump, locale, data)
+                except Exception as e:
+                    # stays dirty, the next save tries again
+                    _log.error(f'failed to save i18n for {self.cog_name} in {locale}', exc_info=e)
+                    continue
+                # keys added while writing still need a save
+                if self._data.get(locale) == data:
+                    self._dirty.discard(locale)
+        _log.debug(f'saved i18n for {self.cog_name}')
 
+    def _dump(self, locale: str, data: dict[str, Any]) -> None:
         locale_path = get_path(self.cog_folder, locale)
         with contextlib.suppress(IOError, FileExistsError):
             if not locale_path.parent.exists():
                 locale_path.parent.mkdir(parents=True)
                 _log.debug(f'created {locale_path.parent}')
 
-        data = self._data[locale]
-
-        with locale_path.open('w', encoding='utf-8') as file:
-            json.dump(data.copy(), file, indent=4, ensure_ascii=False)
-            _log.debug(f'saved i18n for {self.cog_name} in {locale}')
+        # write to a temp file and rename it, a crash mid-write never leaves a truncated locale file
+        fd, tmp_path = tempfile.mkstemp(prefix=f'.{locale}.', suffix='.tmp', dir=locale_path.parent)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(data, file, indent=4, ensure_ascii=False)
+            os.replace(tmp_path, locale_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+        _log.debug(f'saved i18n for {self.cog_name} in {locale}')
 
     def get_locale(self, locale: str, default: Any = None) -> dict[str, str] | Any | None:
         """Retrieves a locale entry."""
@@ -112,15 +165,29 @@ class I18n:
     async def remove_locale(self, locale: str) -> None:
         """Removes a locale."""
         self._data.pop(locale, None)
-        await self.save()
+        self._dirty.discard(locale)
 
     async def add_locale(self, locale: str) -> None:
         """Adds a locale."""
         if locale in self._data:
             return
         self._data[locale] = {}
+        self.mark_dirty(locale)
         await self.save()
 
+    def add_text(self, key: str, locale: Locale | str, text: str) -> None:
+        """Adds a key to a locale, the file is written back later by :meth:`schedule_save`."""
+        if isinstance(locale, Locale):
+            locale = locale.value
+
+        locale_data = self._data.setdefault(locale, {})
+        if locale_data.get(key) == text:
+            return
+
+        locale_data[key] = text  # type: ignore
+        self.mark_dirty(locale)
+        self.schedule_save()
+
     @overload
     def get_text(self, key: str, locale: Locale | str) -> str | None:
         ...
@@ -0,0 +1,353 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Sequence
+
+import discord
+from aiohttp import web
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from valorantx2.http import RequestTrace
+
+    from .bot import LatteMaid
+
+# fmt: off
+__all__ = (
+    'Counter',
+    'Gauge',
+    'Histogram',
+    'MetricsRegistry',
+    'MetricsServer',
+    'metrics',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# how often the event loop lag is sampled, in seconds
+LOOP_LAG_INTERVAL = 0.5
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value))
+
+
+class _Metric:
+    type: str
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name: str = name
+        self.documentation: str = documentation
+        self.labelnames: tuple[str, ...] = tuple(labelnames)
+
+    def _key(self, labels: Sequence[Any]) -> tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f'{self.name} expects the labels {self.labelnames!r}')
+        return tuple(str(label) for label in labels)
+
+    def _samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.type}']
+        lines.extend(self._samples())
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    type = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: Any, amount: float = 1.0) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def _samples(self) -> Iterable[str]:
+        for key, value in self._values.items():
+            yield f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}'
+
+
+class Gauge(_Metric):
+    type = 'gauge'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        collect: Callable[[], Iterable[tuple[Sequence[Any], float]]] | None = None,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        # read at scrape time instead of being set
+        self.collect: Callable[[], Iterable[tuple[Sequence[Any], float]]] | None = collect
+
+    def set(self, *labels: Any, value: float) -> None:
+        self._values[self._key(labels)] = value
+
+    def _samples(self) -> Iterable[str]:
+        values = self._values
+        if self.collect is not None:
+            values = {self._key(labels): value for labels, value in self.collect()}
+        for key, value in values.items():
+            yield f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}'
+
+
+class Histogram(_Metric):
+    type = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets)) + (math.inf,)
+        # per labels, the count of each bucket (not cumulative), the sum and the count
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, *labels: Any, value: float) -> None:
+        key = self._key(labels)
+        entry = self._values.get(key)
+        if entry is None:
+            entry = self._values[key] = ([0] * len(self.buckets), [0.0, 0.0])
+        counts, totals = entry
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        totals[0] += value
+        totals[1] += 1
+
+    def _samples(self) -> Iterable[str]:
+        for key, (counts, (total, count)) in self._values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                yield f'{self.name}_bucket{labels} {cumulative}'
+            labels = _format_labels(self.labelnames, key)
+            yield f'{self.name}_sum{labels} {_format_value(total)}'
+            yield f'{self.name}_count{labels} {int(count)}'
+
+
+class MetricsRegistry:
+    """The metrics of the bot, in the prometheus text format.
+
+    Collecting is off until :attr:`enabled` is set, the hooks return at once then.
+    """
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self._metrics: dict[str, _Metric] = {}
+
+        self.command_first_response = self.register(
+            Histogram(
+                'lattemaid_command_first_response_seconds',
+                'Time from receiving an application command to its first response.',
+                ('command',),
+            )
+        )
+        self.riot_request = self.register(
+            Histogram(
+                'lattemaid_riot_request_seconds',
+                'Latency of the riot api requests.',
+                ('method', 'endpoint', 'region'),
+            )
+        )
+        self.riot_responses = self.register(
+            Counter(
+                'lattemaid_riot_responses_total',
+                'Riot api responses by status.',
+                ('method', 'endpoint', 'region', 'status'),
+            )
+        )
+        self.riot_auth = self.register(
+            Counter(
+                'lattemaid_riot_auth_total',
+                'Riot authorizations and reauthorizations by result.',
+                ('kind', 'result'),
+            )
+        )
+        self.db_query = self.register(
+            Histogram(
+                'lattemaid_db_query_seconds',
+                'Duration of the database statements.',
+                ('statement',),
+            )
+        )
+        self.db_session = self.register(
+            Histogram(
+                'lattemaid_db_session_seconds',
+                'Time a database connection is checked out of the pool.',
+            )
+        )
+        self.gateway_latency = self.register(
+            Gauge(
+                'lattemaid_gateway_latency_seconds',
+                'Heartbeat latency of each shard.',
+                ('shard',),
+            )
+        )
+        self.loop_lag = self.register(
+            Histogram(
+                'lattemaid_event_loop_lag_seconds',
+                'Delay of the event loop in running a scheduled callback.',
+                buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+            )
+        )
+
+    def register(self, metric: _Metric) -> Any:
+        if metric.name in self._metrics:
+            raise ValueError(f'metric {metric.name} is already registered')
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        return '\n'.join(metric.render() for metric in self._metrics.values()) + '\n'
+
+    # hooks
+
+    def track_interaction(self, interaction: discord.Interaction[Any]) -> None:
+        """Times the first response of an application command from now."""
+        if not self.enabled or interaction.command is None:
+            return
+        # InteractionResponse keeps no timings, the response is swapped for one that records it
+        if getattr(interaction, '_cs_response', None) is None:
+            interaction._cs_response = _TimedInteractionResponse(  # type: ignore
+                interaction,
+                self.command_first_response,
+                interaction.command.qualified_name,
+            )
+
+    def observe_riot_request(self, trace: RequestTrace) -> None:
+        if not self.enabled:
+            return
+        self.riot_request.observe(trace.method, trace.endpoint, trace.region, value=trace.elapsed)
+        self.riot_responses.inc(trace.method, trace.endpoint, trace.region, trace.status)
+
+    def count_riot_auth(self, kind: str, result: str) -> None:
+        if self.enabled:
+            self.riot_auth.inc(kind, result)
+
+    def instrument_engine(self, engine: AsyncEngine) -> None:
+        """Times the statements and the connection checkouts of the engine."""
+        from sqlalchemy import event
+
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, 'before_cursor_execute')
+        def before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+            conn.info.setdefault('lattemaid_query_started', []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, 'after_cursor_execute')
+        def after_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+            started = conn.info['lattemaid_query_started'].pop()
+            if self.enabled:
+                verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else 'UNKNOWN'
+                self.db_query.observe(verb, value=time.perf_counter() - started)
+
+        @event.listens_for(sync_engine, 'checkout')
+        def checkout(dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+            connection_record.info['lattemaid_checkout'] = time.perf_counter()
+
+        @event.listens_for(sync_engine, 'checkin')
+        def checkin(dbapi_connection: Any, connection_record: Any) -> None:
+            started = connection_record.info.pop('lattemaid_checkout', None)
+            if started is not None and self.enabled:
+                self.db_session.observe(value=time.perf_counter() - started)
+
+
+class _TimedInteractionResponse(discord.InteractionResponse):
+    # every response method of InteractionResponse ends by setting _response_type
+    def __init__(self, parent: discord.Interaction[Any], histogram: Histogram, command: str) -> None:
+        self._started: float = time.perf_counter()
+        self._histogram: Histogram = histogram
+        self._command: str = command
+        self._timed_response_type: Any = None
+        super().__init__(parent)
+
+    @property
+    def _response_type(self) -> Any:
+        return self._timed_response_type
+
+    @_response_type.setter
+    def _response_type(self, value: Any) -> None:
+        if value is not None and self._timed_response_type is None:
+            self._histogram.observe(self._command, value=time.perf_counter() - self._started)
+        self._timed_response_type = value
+
+
+metrics: MetricsRegistry = MetricsRegistry()
+
+
+class MetricsServer:
+    """Serves ``/metrics`` for the prometheus scraper and samples the event loop lag."""
+
+    def __init__(self, bot: LatteMaid, host: str = '127.0.0.1', port: int = 9100) -> None:
+        self.bot: LatteMaid = bot
+        self.host: str = host
+        self.port: int = port
+        self._runner: web.AppRunner | None = None
+        self._lag_task: asyncio.Task[None] | None = None
+
+    def _gateway_latencies(self) -> Iterable[tuple[Sequence[Any], float]]:
+        for shard_id, latency in self.bot.latencies:
+            if not math.isnan(latency) and not math.isinf(latency):
+                yield (shard_id,), latency
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(text=metrics.render(), content_type='text/plain', charset='utf-8')
+
+    async def _sample_loop_lag(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(LOOP_LAG_INTERVAL)
+            metrics.loop_lag.observe(value=max(0.0, time.perf_counter() - started - LOOP_LAG_INTERVAL))
+
+    async def start(self) -> None:
+        metrics.enabled = True
+        metrics.gateway_latency.collect = self._gateway_latencies
+        metrics.instrument_engine(self.bot.db.engine)
+        self.bot.valorant_client.http.request_hooks.append(metrics.observe_riot_request)
+
+        app = web.Application()
+        app.router.add_get('/metrics', self._handle_metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        self._lag_task = asyncio.create_task(self._sample_loop_lag())
+        _log.info('serving metrics on http://%s:%d/metrics', self.host, self.port)
+
+    async def close(self) -> None:
+        metrics.enabled = False
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            self._lag_task = None
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import json
 import logging
-from typing import TYPE_CHECKING
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import discord
 from discord import app_commands
 
+from .metrics import metrics
+
 if TYPE_CHECKING:
     from .bot import LatteMaid
 
@@ -13,13 +21,23 @@ if TYPE_CHECKING:
 _log = logging.getLogger(__name__)
 
 
+def hash_payload(payload: list[dict[str, Any]]) -> str:
+    # sort_keys makes the hash independent of dict ordering
+    dumped = json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(dumped.encode('utf-8')).hexdigest()
+
+
 class LatteMaidTree(app_commands.CommandTree['LatteMaid']):
+    SYNC_STATE_PATH: Path = Path('.cache') / 'app_commands.json'
+
     async def interaction_check(self, interaction: discord.Interaction[LatteMaid], /) -> bool:
         user = interaction.user
         guild = interaction.guild
         locale = interaction.locale
         command = interaction.command
 
+        metrics.track_interaction(interaction)
+
         if await self.client.is_owner(user):
             return True
 
@@ -89,12 +107,90 @@ class LatteMaidTree(app_commands.CommandTree['LatteMaid']):
 
         return True
 
-    async def sync(self, *, guild: discord.abc.Snowflake | None = None) -> list[app_commands.AppCommand]:
-        synced = await super().sync(guild=guild)
+    async def sync(
+        self,
+        *,
+        guild: discord.abc.Snowflake | None = None,
+        force: bool = False,
+    ) -> list[app_commands.AppCommand]:
+        if self.client.application_id is None:
+            raise app_commands.errors.MissingApplicationID
+
+        commands = self._get_all_commands(guild=guild)
+        payload = await self._get_payload(commands)
+        payload_hash = hash_payload(payload)
+
+        state = self._get_sync_state(guild=guild)
+        if not force and state is not None and state['hash'] == payload_hash:
+            _log.info('application commands %s are up to date, skipped sync' % (f'for guild {guild.id}' if guild else ''))
+            return [app_commands.AppCommand(data=data, state=self._state) for data in state['commands']]
+
+        try:
+            if guild is None:
+                data = await self._http.bulk_upsert_global_commands(self.client.application_id, payload=payload)
+            else:
+                data = await self._http.bulk_upsert_guild_commands(self.client.application_id, guild.id, payload=payload)
+        except discord.HTTPException as e:
+            if e.status == 400 and e.code == 50035:
+                raise app_commands.CommandSyncFailure(e, commands) from None
+            raise
+
+        self._set_sync_state({'hash': payload_hash, 'commands': data}, guild=guild)
+
+        synced = [app_commands.AppCommand(data=d, state=self._state) for d in data]
         if synced:
             _log.info('synced %s application commands %s' % (len(synced), f'for guild {guild.id}' if guild else ''))
         return synced
 
+    async def _get_payload(
+        self,
+        commands: list[app_commands.Command[Any, ..., Any] | app_commands.Group | app_commands.ContextMenu],
+    ) -> list[dict[str, Any]]:
+        translator = self.translator
+        if translator:
+            return [await command.get_translated_payload(self, translator) for command in commands]
+        return [command.to_dict(self) for command in commands]
+
+    # sync state
+
+    def _get_sync_key(self, *, guild: discord.abc.Snowflake | None = None) -> str:
+        # debug and production run different applications
+        return f'{self.client.application_id}:{guild.id if guild else "global"}'
+
+    def _read_sync_states(self) -> dict[str, Any]:
+        try:
+            with self.SYNC_STATE_PATH.open('r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _get_sync_state(self, *, guild: discord.abc.Snowflake | None = None) -> dict[str, Any] | None:
+        return self._read_sync_states().get(self._get_sync_key(guild=guild))
+
+    def _set_sync_state(self, state: dict[str, Any] | None, *, guild: discord.abc.Snowflake | None = None) -> None:
+        states = self._read_sync_states()
+        key = self._get_sync_key(guild=guild)
+        if state is None:
+            states.pop(key, None)
+        else:
+            states[key] = state
+
+        path = self.SYNC_STATE_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=f'.{path.name}.', suffix='.tmp', dir=path.parent)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(states, file, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            _log.warning('failed to save application command sync state', exc_info=e)
+
+    def clear_sync_state(self, *, guild: discord.abc.Snowflake | None = None) -> None:
+        """Forgets the last synced state, the next :meth:`sync` will always call discord."""
+        self._set_sync_state(None, guild=guild)
+
     async def on_error(
         self,
         interaction: discord.Interaction['LatteMaid'],
@@ -104,7 +200,17 @@ class LatteMaidTree(app_commands.CommandTree['LatteMaid']):
         await super().on_error(interaction, error)
 
     async def insert_model_to_commands(self) -> None:
-        server_app_commands = await self.fetch_commands(with_localizations=True)
+        server_app_commands: list[app_commands.AppCommand] | None = None
+
+        # the last sync response is still valid if the local commands did not change since
+        state = self._get_sync_state()
+        if state is not None and state['hash'] == hash_payload(await self._get_payload(self._get_all_commands())):
+            server_app_commands = [app_commands.AppCommand(data=data, state=self._state) for data in state['commands']]
+            _log.debug('reused %s cached application command models', len(server_app_commands))
+
+        if server_app_commands is None:
+            server_app_commands = await self.fetch_commands(with_localizations=True)
+
         for server in server_app_commands:
             command = self.get_command(server.name, type=server.type)
             if command is None:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import datetime
-from typing import TYPE_CHECKING, Any, Iterable
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable
 
 from discord import Colour, Embed as DiscordEmbed
 from discord.types.embed import EmbedType
@@ -11,6 +11,7 @@ if TYPE_CHECKING:
 
 # fmt: off
 __all__ = (
+    'EmbedTemplateCache',
     'MiadEmbed',
 )
 # fmt: on
@@ -42,6 +43,20 @@ class MiadEmbed(DiscordEmbed):
         for n, v in fields:
             self.add_field(name=n, value=v, inline=field_inline)
 
+    @classmethod
+    def from_template(cls, data: dict[str, Any]) -> Self:
+        # from_dict keeps references to the nested dicts and lists, copy them so the template stays untouched
+        data = data.copy()
+        for key, value in data.items():
+            if isinstance(value, dict):
+                data[key] = value.copy()
+            elif isinstance(value, list):
+                data[key] = [item.copy() for item in value]
+        self = cls.from_dict(data)
+        self.custom_id = None
+        self.extra = {}
+        return self
+
     def add_empty_field(self, *, inline: bool = False) -> Self:
         self.add_field(name='\u200b', value='\u200b', inline=inline)
         return self
@@ -117,3 +132,32 @@ class MiadEmbed(DiscordEmbed):
     def blurple(self) -> Self:
         self.colour = Colour.blurple()
         return self
+
+
+class EmbedTemplateCache:
+    """A size-bounded LRU cache of embed payloads.
+
+    The cached payload is the part of an embed that is shared between users,
+    callers apply their per-user fields on the copy returned by :meth:`get`.
+    """
+
+    def __init__(self, maxsize: int = 8192) -> None:
+        self.maxsize: int = maxsize
+        self._templates: dict[Hashable, dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get(self, key: Hashable, factory: Callable[[], DiscordEmbed]) -> MiadEmbed:
+        try:
+            data = self._templates.pop(key)
+        except KeyError:
+            data = factory().to_dict()
+            if len(self._templates) >= self.maxsize:
+                # the first key is the least recently used one
+                del self._templates[next(iter(self._templates))]
+        self._templates[key] = data
+        return MiadEmbed.from_template(data)
+
+    def clear(self) -> None:
+        self._templates.clear()
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from typing import TYPE_CHECKING, NamedTuple
+from urllib.parse import parse_qs, urlparse
+
+if TYPE_CHECKING:
+    import aiohttp
+    import discord
+
+# fmt: off
+__all__ = (
+    'AttachmentURLRegistry',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
+
+class _Entry(NamedTuple):
+    url: str
+    expires_at: float
+    checked_at: float
+
+
+def _get_expires_at(url: str, default: float) -> float:
+    # signed cdn urls carry their expiry as a hex timestamp in the ex parameter
+    ex = parse_qs(urlparse(url).query).get('ex')
+    if ex:
+        try:
+            return float(int(ex[0], 16))
+        except ValueError:
+            pass
+    return default
+
+
+class AttachmentURLRegistry:
+    """Maps the hash of uploaded content to the cdn url of its attachment.
+
+    Files named with :meth:`filename` are tracked until the message they were
+    sent with is passed to :meth:`register_message`. Editing the attachments of
+    a message deletes its files, so the urls are only handed out once the message
+    is passed to :meth:`release_message`, when nothing edits it anymore. Later
+    sends of the same content can then reference the url instead of uploading it again.
+
+    :meth:`forget_message` must be called before the attachments of a message
+    that was not released yet are edited.
+
+    Parameters
+    ----------
+    ttl: :class:`float`
+        How long a url without an expiry is trusted, in seconds.
+    margin: :class:`float`
+        How long before its expiry a url stops being handed out, in seconds.
+    revalidate_after: :class:`float`
+        How long after the last check a url is checked to still resolve, in seconds.
+    maxsize: :class:`int`
+        The maximum number of urls kept.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 60 * 60 * 12,
+        margin: float = 60 * 60,
+        revalidate_after: float = 60 * 30,
+        maxsize: int = 4096,
+    ) -> None:
+        self.ttl: float = ttl
+        self.margin: float = margin
+        self.revalidate_after: float = revalidate_after
+        self.maxsize: int = maxsize
+        self._entries: dict[str, _Entry] = {}
+        # message id -> digest -> url of the files of messages that may still be edited
+        self._held: dict[int, dict[str, str]] = {}
+        # filename -> digest of the files waiting for their message
+        self._pending: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def filename(self, digest: str, extension: str) -> str:
+        filename = f'{digest[:32]}.{extension}'
+        if len(self._pending) >= self.maxsize:
+            del self._pending[next(iter(self._pending))]
+        self._pending[filename] = digest
+        return filename
+
+    def get(self, digest: str) -> str | None:
+        entry = self._entries.get(digest)
+        if entry is None:
+            return None
+        if entry.expires_at - self.margin <= time.time():
+            self.discard(digest)
+            return None
+        return entry.url
+
+    async def resolve(self, digest: str, *, session: aiohttp.ClientSession) -> str | None:
+        """|coro|
+
+        Returns the url of the content if it is known and still resolves.
+        """
+        url = self.get(digest)
+        if url is None:
+            return None
+
+        entry = self._entries[digest]
+        now = time.time()
+        if now - entry.checked_at < self.revalidate_after:
+            return url
+
+        try:
+            async with session.head(url) as response:
+                ok = response.status == 200
+        except Exception as e:
+            _log.debug(f'failed to revalidate attachment url {url}', exc_info=e)
+            ok = False
+
+        if not ok:
+            self.discard(digest)
+            return None
+
+        self._entries[digest] = entry._replace(checked_at=now)
+        return url
+
+    def register(self, digest: str, url: str) -> None:
+        now = time.time()
+        self._entries.pop(digest, None)
+        if len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[digest] = _Entry(url, _get_expires_at(url, now + self.ttl), now)
+
+    def register_message(self, message: discord.Message | None) -> None:
+        """Holds the urls of the files sent with the message until it is released."""
+        if message is None:
+            return
+        urls: dict[str, str] = {}
+        for attachment in message.attachments:
+            digest = self._pending.pop(attachment.filename, None)
+            if digest is not None:
+                urls[digest] = attachment.url
+        if not urls:
+            return
+        if len(self._held) >= self.maxsize:
+            del self._held[next(iter(self._held))]
+        self._held.setdefault(message.id, {}).update(urls)
+
+    def release_message(self, message_id: int) -> None:
+        """Hands out the urls of a message whose attachments are not edited anymore."""
+        for digest, url in self._held.pop(message_id, {}).items():
+            self.register(digest, url)
+
+    def forget_message(self, message_id: int) -> None:
+        """Drops the held urls of a message whose attachments are about to change."""
+        self._held.pop(message_id, None)
+
+    def discard(self, digest: str) -> None:
+        self._entries.pop(digest, None)
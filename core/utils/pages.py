@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+
 # import traceback
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Hashable, Sequence, TypeVar
 
 import discord
 from discord.utils import MISSING
@@ -11,6 +14,8 @@ if TYPE_CHECKING:
 
 T = TypeVar('T')
 
+_log = logging.getLogger(__name__)
+
 # source: https://github.com/Rapptz/RoboDanny/blob/rewrite/cogs/utils/paginator.py
 
 
@@ -142,7 +147,7 @@ class ListPageSource(PageSource, Generic[T]):
         How many elements are in a page.
     """
 
-    def __init__(self, entries: list[T], per_page: int = 12):
+    def __init__(self, entries: Sequence[T], per_page: int = 12):
         self.entries = entries
         self.per_page = per_page
 
@@ -177,6 +182,108 @@ class ListPageSource(PageSource, Generic[T]):
             return self.entries[base : base + self.per_page]
 
 
+class CachedPageSource(PageSource):
+    """A page source whose formatted pages are kept for the lifetime of the view.
+
+    :class:`LattePages` formats the pages through :meth:`format_page_number`,
+    a page shown again is not formatted again and the next page is formatted in
+    the background once a page is shown. Formatted pages are sent again as is,
+    so they must not contain a :class:`discord.File`.
+
+    The key of a page is computed when its formatting is scheduled, sources whose
+    pages depend on the state of the menu format them with :meth:`format_cached_page`
+    from the values in the key, the menu may have changed by the time it runs.
+    Attributes
+    ------------
+    max_cached_pages: :class:`int`
+        How many formatted pages are kept, the least recently shown are dropped first.
+    """
+
+    max_cached_pages: int = 32
+
+    def __init__(self) -> None:
+        self._formatted: dict[Hashable, Any] = {}
+        self._pending: dict[Hashable, asyncio.Task[Any]] = {}
+
+    def get_cache_key(self, menu: Any, page_number: int) -> Hashable:
+        """The key of a formatted page.
+        Sources whose pages depend on the menu, e.g. its locale, must include it.
+        """
+        return page_number
+
+    def clear_cache(self) -> None:
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+        self._formatted.clear()
+
+    def format_cached_page(self, menu: Any, page: Any, key: Hashable) -> Any:
+        """|maybecoro|
+        Formats a page for the cache, ``key`` is the state of the menu the page is formatted for.
+        """
+        return self.format_page(menu, page)
+
+    async def _format(self, menu: Any, page_number: int, key: Hashable) -> Any:
+        page = await self.get_page(page_number)
+        return await discord.utils.maybe_coroutine(self.format_cached_page, menu, page, key)
+
+    def _on_formatted(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            _log.debug(f'failed to format page {key!r} of {self.__class__.__name__}', exc_info=exc)
+            return
+        if len(self._formatted) >= self.max_cached_pages:
+            del self._formatted[next(iter(self._formatted))]
+        self._formatted[key] = task.result()
+
+    def _schedule(self, menu: Any, page_number: int, key: Hashable) -> asyncio.Task[Any]:
+        task = self._pending[key] = asyncio.create_task(self._format(menu, page_number, key))
+        task.add_done_callback(lambda t: self._on_formatted(key, t))
+        return task
+
+    async def format_page_number(self, menu: Any, page_number: int) -> Any:
+        """|coro|
+        Returns the formatted page, formatting it only if it is not cached.
+        """
+        key = self.get_cache_key(menu, page_number)
+        try:
+            value = self._formatted.pop(key)
+        except KeyError:
+            pass
+        else:
+            # most recently shown last
+            self._formatted[key] = value
+            return value
+
+        task = self._pending.get(key)
+        if task is None:
+            task = self._schedule(menu, page_number, key)
+        # a prefetch shared with this call keeps running if the interaction is cancelled
+        return await asyncio.shield(task)
+
+    def prefetch(self, menu: Any, page_number: int) -> None:
+        """Starts formatting the page in the background."""
+        max_pages = self.get_max_pages()
+        if page_number < 0 or (max_pages is not None and page_number >= max_pages):
+            return
+        key = self.get_cache_key(menu, page_number)
+        if key in self._formatted or key in self._pending:
+            return
+        self._schedule(menu, page_number, key)
+
+
+class CachedListPageSource(CachedPageSource, ListPageSource[T]):
+    """A :class:`ListPageSource` whose formatted pages are cached, see :class:`CachedPageSource`."""
+
+    def __init__(self, entries: Sequence[T], per_page: int = 12):
+        ListPageSource.__init__(self, entries, per_page=per_page)
+        CachedPageSource.__init__(self)
+
+
 class LattePages(discord.ui.View):
     def __init__(
         self,
@@ -225,8 +332,22 @@ class LattePages(discord.ui.View):
 
     async def _get_kwargs_from_page(self, page: int) -> dict[str, Any]:
         value = await discord.utils.maybe_coroutine(self.source.format_page, self, page)
+        return self._get_kwargs_from_value(value)
+
+    async def _get_kwargs_from_page_number(self, page_number: int) -> dict[str, Any]:
+        source = self.source
+        if not isinstance(source, CachedPageSource):
+            page = await source.get_page(page_number)
+            return await self._get_kwargs_from_page(page)
+
+        value = await source.format_page_number(self, page_number)
+        source.prefetch(self, page_number + 1)
+        return self._get_kwargs_from_value(value)
+
+    def _get_kwargs_from_value(self, value: Any) -> dict[str, Any]:
         if isinstance(value, dict):
-            return value
+            # the value may be cached by the source
+            return dict(value)
         elif isinstance(value, str):
             return {'content': value, 'embed': None}
         elif isinstance(value, discord.Embed):
@@ -236,10 +357,13 @@ class LattePages(discord.ui.View):
         else:
             return {}
 
-    async def show_page(self, interaction: discord.Interaction, page_number: int) -> None:
-        page = await self.source.get_page(page_number)
+    async def show_page(self, interaction: discord.Interaction[LatteMaid], page_number: int) -> None:
         self.current_page = page_number
-        kwargs = await self._get_kwargs_from_page(page)
+        message = self.message if interaction.response.is_done() else interaction.message
+        if message is not None:
+            # the edit may replace the attachments, the held urls of the message are dead
+            interaction.client.attachment_urls.forget_message(message.id)
+        kwargs = await self._get_kwargs_from_page_number(page_number)
         self._update_labels(page_number)
         if kwargs:
             if interaction.response.is_done():
@@ -333,8 +457,9 @@ class LattePages(discord.ui.View):
             self.__prepare = True
 
         await self.source._prepare_once()
-        page = await self.source.get_page(page_number)
-        kwargs = await self._get_kwargs_from_page(page)
+        if self.message is not None:
+            self.interaction.client.attachment_urls.forget_message(self.message.id)
+        kwargs = await self._get_kwargs_from_page_number(page_number)
         if content:
             kwargs.setdefault('content', content)
 
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import contextlib
+import logging
+import sys
+import time
+from importlib.abc import Loader, MetaPathFinder
+from typing import TYPE_CHECKING, Any, Iterator, Sequence
+
+if TYPE_CHECKING:
+    from importlib.machinery import ModuleSpec
+    from types import ModuleType
+
+# fmt: off
+__all__ = (
+    'StartupProfiler',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
+
+class _TimedLoader(Loader):
+    def __init__(self, loader: Loader, profiler: StartupProfiler) -> None:
+        self._loader: Loader = loader
+        self._profiler: StartupProfiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        # hide the wrapper from the module itself
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+
+        with self._profiler.measure_import(module.__name__):
+            self._loader.exec_module(module)
+
+
+class _ImportFinder(MetaPathFinder):
+    def __init__(self, profiler: StartupProfiler) -> None:
+        self._profiler: StartupProfiler = profiler
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = _TimedLoader(spec.loader, self._profiler)
+            return spec
+        return None
+
+
+class StartupProfiler:
+    """Collects import times per module and setup times per phase/extension.
+
+    Import times are only collected between :meth:`install` and :meth:`uninstall`.
+    """
+
+    def __init__(self) -> None:
+        # name -> (cumulative, self)
+        self.imports: dict[str, tuple[float, float]] = {}
+        self.phases: dict[str, float] = {}
+        self._finder: _ImportFinder | None = None
+        self._stack: list[float] = []
+        self._started_at: float = time.perf_counter()
+
+    def install(self) -> None:
+        if self._finder is not None:
+            return
+        self._finder = _ImportFinder(self)
+        sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self) -> None:
+        if self._finder is None:
+            return
+        with contextlib.suppress(ValueError):
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+
+    @contextlib.contextmanager
+    def measure_import(self, name: str) -> Iterator[None]:
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            self.imports[name] = (elapsed, elapsed - children)
+
+    @contextlib.contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def report(self, limit: int = 25) -> str:
+        lines = [f'startup took {time.perf_counter() - self._started_at:.3f}s']
+
+        if self.imports:
+            lines.append(f'imports (top {limit} by self time, {len(self.imports)} modules):')
+            entries = sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)[:limit]
+            for name, (cumulative, own) in entries:
+                lines.append(f'  {own * 1000:9.2f}ms self {cumulative * 1000:9.2f}ms cumulative  {name}')
+
+        if self.phases:
+            lines.append('setup:')
+            for name, elapsed in sorted(self.phases.items(), key=lambda item: item[1], reverse=True):
+                lines.append(f'  {elapsed * 1000:9.2f}ms  {name}')
+
+        return '\n'.join(lines)
+
+    def log_report(self, limit: int = 25) -> None:
+        _log.info(self.report(limit))
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+# fmt: off
+__all__ = (
+    'RenderCache',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
+K = TypeVar('K', bound=Hashable)
+
+
+class RenderCache(Generic[K]):
+    """An LRU cache of rendered images, concurrent requests for a key share a single render.
+
+    The render runs in its own task. A caller that is cancelled only stops waiting,
+    the render still finishes and fills the cache for the other callers and the next ones.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize: int = maxsize
+        self._images: dict[K, bytes] = {}
+        self._pending: dict[K, asyncio.Task[bytes]] = {}
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def clear(self) -> None:
+        self._images.clear()
+
+    def get(self, key: K) -> bytes | None:
+        try:
+            image = self._images.pop(key)
+        except KeyError:
+            return None
+        self._images[key] = image
+        return image
+
+    def set(self, key: K, image: bytes) -> None:
+        self._images.pop(key, None)
+        if len(self._images) >= self.maxsize:
+            del self._images[next(iter(self._images))]
+        self._images[key] = image
+
+    async def get_or_render(self, key: K, render: Callable[[], Awaitable[bytes]]) -> bytes:
+        """|coro|
+
+        Returns the cached image of ``key``, or awaits ``render`` to create it once.
+        """
+        image = self.get(key)
+        if image is not None:
+            return image
+
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.create_task(self._render(key, render))
+            task.add_done_callback(self._on_render_done)
+        return await asyncio.shield(task)
+
+    async def _render(self, key: K, render: Callable[[], Awaitable[bytes]]) -> bytes:
+        try:
+            image = await render()
+        finally:
+            del self._pending[key]
+        self.set(key, image)
+        return image
+
+    @staticmethod
+    def _on_render_done(task: asyncio.Task[bytes]) -> None:
+        # every caller may have been cancelled, the failure is logged here instead
+        if not task.cancelled() and task.exception() is not None:
+            _log.debug('render failed', exc_info=task.exception())
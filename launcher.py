@@ -3,13 +3,16 @@ import asyncio
 import contextlib
 import logging
 import os
+import signal
+import tempfile
 from logging.handlers import RotatingFileHandler
 
 import aiohttp
 from discord import utils
 from discord.webhook import Webhook
 
-from core.bot import LatteMaid
+from core.cluster import WORKER_LOG_FORMAT, ClusterSupervisor, fetch_recommended_shards
+from core.utils.profiler import StartupProfiler
 
 try:
     import uvloop  # type: ignore
@@ -32,6 +35,27 @@ parser.add_argument(
     action='store_true',
     help='sync application commands to discord.',
 )
+parser.add_argument(
+    '--profile',
+    action='store_true',
+    help='report import and setup times per module and extension.',
+)
+parser.add_argument(
+    '-c',
+    '--clusters',
+    type=int,
+    default=1,
+    help='run the shards in this many worker processes.',
+)
+parser.add_argument(
+    '--shard-count',
+    type=int,
+    default=None,
+    help='total shard count, the recommended count is fetched when omitted.',
+)
+# set by the supervisor for its workers
+parser.add_argument('--cluster-id', type=int, default=None, help=argparse.SUPPRESS)
+parser.add_argument('--shard-ids', type=str, default=None, help=argparse.SUPPRESS)
 args = parser.parse_args()
 
 
@@ -71,6 +95,15 @@ def setup_logging():
         logging.getLogger('sqlalchemy').setLevel(logging.WARNING)
 
         log.setLevel(logging.INFO if args.prod else logging.DEBUG)
+
+        if args.cluster_id is not None:
+            # the supervisor writes the log file, workers only report to it
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter(WORKER_LOG_FORMAT, style='{'))
+            log.addHandler(handler)
+            yield
+            return
+
         handler = RotatingFileHandler(
             filename='lattemaid.log', encoding='utf-8', mode='w', maxBytes=max_bytes, backupCount=5
         )
@@ -116,16 +149,73 @@ async def setup_webhook():
 
 
 async def run_bot():
-    async with LatteMaid(
+    profiler = StartupProfiler() if args.profile else None
+    if profiler is not None:
+        profiler.install()
+
+    # imported here so the profiler sees the whole import chain
+    from core.bot import LatteMaid
+
+    shard_ids = [int(shard_id) for shard_id in args.shard_ids.split(',')] if args.shard_ids else None
+    bot = LatteMaid(
         debug_mode=not args.prod,
         tree_sync_at_startup=args.sync,
-    ) as bot, setup_webhook():
+        startup_profiler=profiler,
+        cluster_id=args.cluster_id,
+        shard_ids=shard_ids,
+        shard_count=args.shard_count,
+    )
+    if args.cluster_id is not None:
+        # the supervisor stops its workers with SIGTERM
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            with contextlib.suppress(NotImplementedError):
+                loop.add_signal_handler(sig, lambda: asyncio.create_task(bot.close()))
+        async with bot:
+            await bot.start()
+        return
+
+    async with bot, setup_webhook():
         await bot.start()
 
 
+async def run_clusters():
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    shard_count = args.shard_count
+    if shard_count is None:
+        token = os.getenv('DISCORD_TOKEN' if args.prod else 'DISCORD_TOKEN_TEST')
+        if token is None:
+            raise RuntimeError('No token provided.')
+        shard_count = await fetch_recommended_shards(token)
+
+    argv = [os.path.abspath(__file__)]
+    if args.prod:
+        argv.append('--prod')
+    if args.sync:
+        argv.append('--sync')
+    if args.profile:
+        argv.append('--profile')
+
+    supervisor = ClusterSupervisor(shard_count, args.clusters, argv)
+    logging.getLogger(__name__).info('running %d shards in %d clusters', shard_count, len(supervisor.clusters))
+    with contextlib.ExitStack() as stack:
+        if not os.getenv('INVALIDATION_BUS_URL'):
+            # the workers tell each other about stale state through unix sockets in here
+            directory = stack.enter_context(tempfile.TemporaryDirectory(prefix='lattemaid-bus-'))
+            os.environ['INVALIDATION_BUS_URL'] = f'unix:{directory}'
+        async with setup_webhook():
+            await supervisor.run()
+
+
 def main():
     with setup_logging():
-        asyncio.run(run_bot())
+        if args.clusters > 1 and args.cluster_id is None:
+            asyncio.run(run_clusters())
+        else:
+            asyncio.run(run_bot())
 
 
 if __name__ == '__main__':
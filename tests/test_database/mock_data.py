@@ -56,3 +56,19 @@ APP_COMMAND_DATA = [
         'failed': True,
     },
 ]
+
+MATCH_HISTORY_PUUID = '00000000-0000-0000-0000-000000000001'
+
+MATCH_HISTORY_DATA = [
+    ('00000000-0000-0000-0000-00000000000a', 'competitive', datetime.datetime(2023, 7, 1, 12, 0)),
+    ('00000000-0000-0000-0000-00000000000b', 'unrated', datetime.datetime(2023, 7, 2, 12, 0)),
+    ('00000000-0000-0000-0000-00000000000c', 'competitive', datetime.datetime(2023, 7, 3, 12, 0)),
+]
+
+MMR_HISTORY_PUUID = '00000000-0000-0000-0000-000000000002'
+
+MMR_HISTORY_DATA = [
+    (datetime.datetime(2023, 7, 1, 12, 0), 12, 40, 'season-1'),
+    (datetime.datetime(2023, 7, 2, 12, 0), 12, 61, 'season-1'),
+    (datetime.datetime(2023, 7, 3, 12, 0), 13, 5, 'season-2'),
+]
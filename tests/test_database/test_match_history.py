@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from .conftest import DatabaseSetup
+from .mock_data import MATCH_HISTORY_DATA, MATCH_HISTORY_PUUID
+
+if TYPE_CHECKING:
+    from core.database import DatabaseConnection
+
+
+class TestMatchHistory(DatabaseSetup):
+    @pytest.mark.asyncio
+    async def test_add_match_history_entries(self, db: DatabaseConnection) -> None:
+        entries = await db.add_match_history_entries(MATCH_HISTORY_PUUID, MATCH_HISTORY_DATA[:2])
+        assert len(entries) == 2
+
+        # known matches are skipped
+        entries = await db.add_match_history_entries(MATCH_HISTORY_PUUID, MATCH_HISTORY_DATA)
+        assert len(entries) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_match_history_entries(self, db: DatabaseConnection) -> None:
+        entries = [entry async for entry in db.fetch_match_history_entries(MATCH_HISTORY_PUUID)]
+        assert [entry.match_id for entry in entries] == [match_id for match_id, _, _ in reversed(MATCH_HISTORY_DATA)]
+
+        entries = [entry async for entry in db.fetch_match_history_entries(MATCH_HISTORY_PUUID, queue_id='competitive')]
+        assert len(entries) == 2
+        assert all(entry.queue_id == 'competitive' for entry in entries)
+
+        entries = [entry async for entry in db.fetch_match_history_entries(MATCH_HISTORY_PUUID, limit=1)]
+        assert len(entries) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_latest_match_history_entry(self, db: DatabaseConnection) -> None:
+        entry = await db.fetch_latest_match_history_entry(MATCH_HISTORY_PUUID)
+        assert entry is not None
+        assert entry.match_id == MATCH_HISTORY_DATA[-1][0]
+
+        assert await db.fetch_latest_match_history_entry('unknown') is None
+
+    @pytest.mark.asyncio
+    async def test_get_known_match_ids(self, db: DatabaseConnection) -> None:
+        known = await db.fetch_known_match_ids(MATCH_HISTORY_PUUID, [MATCH_HISTORY_DATA[0][0], 'unknown'])
+        assert known == {MATCH_HISTORY_DATA[0][0]}
+
+    @pytest.mark.asyncio
+    async def test_add_match_history_entries_concurrently(self, db: DatabaseConnection) -> None:
+        puuid = 'concurrent'
+        results = await asyncio.gather(
+            db.add_match_history_entries(puuid, MATCH_HISTORY_DATA),
+            db.add_match_history_entries(puuid, MATCH_HISTORY_DATA),
+        )
+        assert sum(len(entries) for entries in results) == len(MATCH_HISTORY_DATA)
+        assert len([entry async for entry in db.fetch_match_history_entries(puuid)]) == len(MATCH_HISTORY_DATA)
+
+    @pytest.mark.asyncio
+    async def test_remove_match_history_entries(self, db: DatabaseConnection) -> None:
+        assert await db.remove_match_history_entries(MATCH_HISTORY_PUUID)
+        assert await db.fetch_latest_match_history_entry(MATCH_HISTORY_PUUID) is None
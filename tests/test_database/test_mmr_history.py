@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from .conftest import DatabaseSetup
+from .mock_data import MMR_HISTORY_DATA, MMR_HISTORY_PUUID
+
+if TYPE_CHECKING:
+    from core.database import DatabaseConnection
+
+
+class TestMMRHistory(DatabaseSetup):
+    @pytest.mark.asyncio
+    async def test_add_mmr_history(self, db: DatabaseConnection) -> None:
+        points = await db.add_mmr_history(MMR_HISTORY_PUUID, MMR_HISTORY_DATA[:2] + MMR_HISTORY_DATA[:1])
+        assert len(points) == 2
+
+        # known points are skipped
+        points = await db.add_mmr_history(MMR_HISTORY_PUUID, MMR_HISTORY_DATA)
+        assert len(points) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_mmr_history(self, db: DatabaseConnection) -> None:
+        points = [point async for point in db.fetch_mmr_history(MMR_HISTORY_PUUID)]
+        assert [(p.recorded_at, p.tier, p.rr, p.season_id) for p in points] == MMR_HISTORY_DATA
+
+        # the latest points, oldest first
+        points = [point async for point in db.fetch_mmr_history(MMR_HISTORY_PUUID, limit=2)]
+        assert [p.recorded_at for p in points] == [recorded_at for recorded_at, _, _, _ in MMR_HISTORY_DATA[1:]]
+
+        points = [point async for point in db.fetch_mmr_history(MMR_HISTORY_PUUID, season_id='season-1')]
+        assert len(points) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_latest_mmr_history(self, db: DatabaseConnection) -> None:
+        point = await db.fetch_latest_mmr_history(MMR_HISTORY_PUUID)
+        assert point is not None
+        assert (point.tier, point.rr) == (13, 5)
+
+        assert await db.fetch_latest_mmr_history('unknown') is None
+
+    @pytest.mark.asyncio
+    async def test_remove_mmr_history(self, db: DatabaseConnection) -> None:
+        assert await db.remove_mmr_history(MMR_HISTORY_PUUID)
+        assert await db.fetch_latest_mmr_history(MMR_HISTORY_PUUID) is None
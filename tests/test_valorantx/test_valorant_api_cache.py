@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+pytest.importorskip('valorantx')
+
+from valorantx import Locale  # noqa: E402
+
+from valorantx2.valorant_api_cache import ValorantAPICache  # noqa: E402
+
+PAYLOAD = {
+    'status': 200,
+    'data': [
+        {
+            'uuid': 'weapon-1',
+            'skins': [
+                {'uuid': 'skin-1', 'chromas': [{'uuid': 'chroma-1'}], 'levels': [{'uuid': 'level-1'}, {'uuid': 'level-2'}]},
+                {'uuid': 'skin-2', 'chromas': [{'uuid': 'chroma-2'}], 'levels': [{'uuid': 'level-3'}]},
+            ],
+        },
+        {
+            'uuid': 'weapon-2',
+            'skins': [{'uuid': 'skin-3', 'chromas': [], 'levels': [{'uuid': 'level-4'}]}],
+        },
+    ],
+}
+
+
+class Entity:
+    def __init__(self, state: ValorantAPICache, data: dict[str, Any]) -> None:
+        self._state = state
+        self.uuid: str = data['uuid']
+
+
+class NestedCache(ValorantAPICache):
+    # a parent building its nested entities in its own store method, like weapons and agents do
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._test_weapons: dict[str, Entity] = {}
+        self._test_skins: dict[str, Entity] = {}
+        self._test_chromas: dict[str, Entity] = {}
+        self._test_levels: dict[str, Entity] = {}
+        super().__init__(**kwargs)
+
+    def store_test_weapon(self, data: dict[str, Any]) -> Entity:
+        for skin in data['skins']:
+            self._test_skins[skin['uuid']] = Entity(self, skin)
+            for chroma in skin['chromas']:
+                self._test_chromas[chroma['uuid']] = Entity(self, chroma)
+            for level in skin['levels']:
+                self._test_levels[level['uuid']] = Entity(self, level)
+        self._test_weapons[data['uuid']] = weapon = Entity(self, data)
+        return weapon
+
+
+def load(cache: NestedCache, target: NestedCache, *, modified: bool) -> None:
+    # the client diffs every document on the live cache before the entities are built
+    cache.diff_payload(PAYLOAD, modified=modified)
+    for item in PAYLOAD['data']:
+        target.store_test_weapon(item)
+
+
+def get_sizes(cache: NestedCache) -> dict[str, int]:
+    return {name: len(mapping) for name, mapping in cache._get_maps().items()}
+
+
+@pytest.mark.parametrize('modified', [False, True])
+def test_reload_unchanged_payload_keeps_every_map(modified: bool) -> None:
+    live = NestedCache(locale=Locale.english, http=None)  # type: ignore
+    load(live, live, modified=True)
+    live.commit_digests()
+    sizes = get_sizes(live)
+    skins = dict(live._test_skins)
+
+    staging = NestedCache(locale=Locale.english, http=None, live=live)  # type: ignore
+    load(live, staging, modified=modified)
+    live.swap(staging)
+    live.commit_digests()
+
+    assert get_sizes(live) == sizes
+    assert len(live._test_levels) == 4
+    # the nested entities are the ones of the previous load, not rebuilt
+    assert all(live._test_skins[uuid] is skin for uuid, skin in skins.items())
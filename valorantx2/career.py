@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import logging
+from array import array
+from typing import TYPE_CHECKING, Any, Collection, Iterable, NamedTuple
+
+if TYPE_CHECKING:
+    from .models.custom.match import MatchDetails
+
+# fmt: off
+__all__ = (
+    'CareerStats',
+    'CareerSummary',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
+# column name -> array typecode
+COLUMNS: dict[str, str] = {
+    'started_at': 'd',
+    'queue': 'H',
+    'agent': 'H',
+    'map': 'H',
+    'tier': 'B',
+    'won': 'B',
+    'draw': 'B',
+    'kills': 'H',
+    'deaths': 'H',
+    'assists': 'H',
+    'score': 'I',
+    'rounds': 'H',
+    'first_kills': 'H',
+    'head_shot_percent': 'f',
+}
+
+# fmt: off
+SUMMED: tuple[str, ...] = (
+    'won', 'draw', 'kills', 'deaths', 'assists', 'score', 'rounds', 'first_kills', 'head_shot_percent',
+)
+# fmt: on
+
+
+class CareerSummary(NamedTuple):
+    matches: int = 0
+    wins: int = 0
+    draws: int = 0
+    kills: int = 0
+    deaths: int = 0
+    assists: int = 0
+    score: int = 0
+    rounds: int = 0
+    first_kills: int = 0
+    head_shot_percent: float = 0.0
+
+    @classmethod
+    def from_sums(cls, matches: int, sums: dict[str, float]) -> CareerSummary:
+        return cls(
+            matches=matches,
+            wins=int(sums['won']),
+            draws=int(sums['draw']),
+            kills=int(sums['kills']),
+            deaths=int(sums['deaths']),
+            assists=int(sums['assists']),
+            score=int(sums['score']),
+            rounds=int(sums['rounds']),
+            first_kills=int(sums['first_kills']),
+            head_shot_percent=(sums['head_shot_percent'] / matches) if matches else 0.0,
+        )
+
+    @property
+    def losses(self) -> int:
+        return self.matches - self.wins - self.draws
+
+    @property
+    def win_rate(self) -> float:
+        return (self.wins / self.matches * 100) if self.matches else 0.0
+
+    @property
+    def kd(self) -> float:
+        return self.kills / max(self.deaths, 1)
+
+    @property
+    def kda(self) -> float:
+        return (self.kills + self.assists) / max(self.deaths, 1)
+
+    @property
+    def acs(self) -> float:
+        return (self.score / self.rounds) if self.rounds else 0.0
+
+
+class _PlayerColumns:
+    __slots__ = ('match_ids', 'columns')
+
+    def __init__(self) -> None:
+        # the match of each row
+        self.match_ids: list[str] = []
+        self.columns: dict[str, array[Any]] = {name: array(typecode) for name, typecode in COLUMNS.items()}
+
+    def __len__(self) -> int:
+        return len(self.match_ids)
+
+    def remove_oldest(self) -> None:
+        started_at = self.columns['started_at']
+        index = min(range(len(started_at)), key=started_at.__getitem__)
+        del self.match_ids[index]
+        for column in self.columns.values():
+            del column[index]
+
+
+class CareerStats:
+    """Per player match stats, stored column by column.
+
+    Every player of a match added with :meth:`add_match` gets a row, so the
+    stats of a player grow with the matches of everyone they played with.
+
+    Parameters
+    ----------
+    max_matches: :class:`int`
+        The maximum number of matches kept per player, the oldest are dropped first.
+    max_players: :class:`int`
+        The maximum number of players kept, the least recently used are dropped first.
+    """
+
+    def __init__(self, *, max_matches: int = 100, max_players: int = 4096) -> None:
+        self.max_matches: int = max_matches
+        self.max_players: int = max_players
+        self._players: dict[str, _PlayerColumns] = {}
+        # categorical values (queue, agent, map) are stored as small integer codes
+        self._codes: dict[str, int] = {}
+        self._values: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def __contains__(self, puuid: object) -> bool:
+        return puuid in self._players
+
+    def _encode(self, value: str | None) -> int:
+        value = value or ''
+        try:
+            return self._codes[value]
+        except KeyError:
+            code = self._codes[value] = len(self._values)
+            self._values.append(value)
+            return code
+
+    def clear(self) -> None:
+        self._players.clear()
+        self._codes.clear()
+        self._values.clear()
+
+    def _get_columns(self, puuid: str) -> _PlayerColumns | None:
+        columns = self._players.pop(puuid, None)
+        if columns is not None:
+            self._players[puuid] = columns
+        return columns
+
+    def _get_or_create_columns(self, puuid: str) -> _PlayerColumns:
+        columns = self._get_columns(puuid)
+        if columns is None:
+            if len(self._players) >= self.max_players:
+                del self._players[next(iter(self._players))]
+            columns = self._players[puuid] = _PlayerColumns()
+        return columns
+
+    def add_match(self, match: MatchDetails) -> bool:
+        """Adds a row for every player of the match.
+
+        Returns ``False`` if the match was already added.
+        """
+        match_id = match.match_info.match_id
+        started_at = match.started_at.timestamp()
+        queue = self._encode(match.match_info.queue_id)
+        map_ = self._encode(match.match_info.map_id)
+        draw = int(match.is_draw())
+
+        added = False
+        for player in match.players:
+            stats = player.stats
+            if stats is None:
+                continue
+            columns = self._get_or_create_columns(player.puuid)
+            if match_id in columns.match_ids:
+                continue
+
+            tier = player.competitive_tier
+            row = {
+                'started_at': started_at,
+                'queue': queue,
+                'agent': self._encode(player.agent.uuid if player.agent is not None else None),
+                'map': map_,
+                'tier': tier.tier if tier is not None else 0,
+                'won': int(player.is_winner() and not draw),
+                'draw': draw,
+                'kills': stats.kills,
+                'deaths': stats.deaths,
+                'assists': stats.assists,
+                'score': stats.score,
+                'rounds': stats.rounds_played,
+                'first_kills': stats.first_kills,
+                'head_shot_percent': stats.head_shot_percent,
+            }
+            for name, value in row.items():
+                columns.columns[name].append(value)
+            columns.match_ids.append(match_id)
+            if len(columns) > self.max_matches:
+                columns.remove_oldest()
+            added = True
+        return added
+
+    def add_matches(self, matches: Iterable[MatchDetails]) -> int:
+        return sum(self.add_match(match) for match in matches)
+
+    def get_match_count(self, puuid: str) -> int:
+        columns = self._get_columns(puuid)
+        return len(columns) if columns is not None else 0
+
+    def get_missing_match_ids(self, puuid: str, match_ids: Iterable[str]) -> list[str]:
+        """Returns the matches of ``match_ids`` that have no row of the player."""
+        columns = self._get_columns(puuid)
+        known = set(columns.match_ids) if columns is not None else set()
+        return [match_id for match_id in match_ids if match_id not in known]
+
+    # selection
+
+    def _select(
+        self,
+        columns: _PlayerColumns,
+        queue: str | None,
+        last: int | None,
+        match_ids: Collection[str] | None = None,
+    ) -> list[int]:
+        """Returns the row indexes matching the filters, most recent first."""
+        code = self._codes.get(queue) if queue is not None else None
+        if queue is not None and code is None:
+            return []
+
+        started_at = columns.columns['started_at']
+        order = sorted(range(len(started_at)), key=started_at.__getitem__, reverse=True)
+        if code is not None:
+            queues = columns.columns['queue']
+            order = [i for i in order if queues[i] == code]
+        if match_ids is not None:
+            match_ids = set(match_ids)
+            order = [i for i in order if columns.match_ids[i] in match_ids]
+        return order[:last] if last is not None else order
+
+    def _sums(self, columns: _PlayerColumns, rows: list[int]) -> dict[str, float]:
+        return {name: float(sum(columns.columns[name][i] for i in rows)) for name in SUMMED}
+
+    # aggregates
+
+    def summarize(
+        self,
+        puuid: str,
+        *,
+        queue: str | None = None,
+        last: int | None = None,
+        match_ids: Collection[str] | None = None,
+    ) -> CareerSummary:
+        """Aggregates the stats of the player.
+
+        Parameters
+        ----------
+        puuid: :class:`str`
+            The player.
+        queue: Optional[:class:`str`]
+            Only count the matches of this queue id.
+        last: Optional[:class:`int`]
+            Only count the most recent matches.
+        match_ids: Optional[Collection[:class:`str`]]
+            Only count these matches.
+        """
+        columns = self._get_columns(puuid)
+        if columns is None:
+            return CareerSummary()
+        rows = self._select(columns, queue, last, match_ids)
+        return CareerSummary.from_sums(len(rows), self._sums(columns, rows))
+
+    def summarize_by(
+        self,
+        puuid: str,
+        column: str,
+        *,
+        queue: str | None = None,
+        last: int | None = None,
+        match_ids: Collection[str] | None = None,
+    ) -> dict[str, CareerSummary]:
+        """Aggregates the stats of the player for every value of ``column``, ``'agent'`` or ``'map'``."""
+        if column not in ('agent', 'map', 'queue'):
+            raise ValueError(f'cannot group by {column!r}')
+
+        columns = self._get_columns(puuid)
+        if columns is None:
+            return {}
+        rows = self._select(columns, queue, last, match_ids)
+
+        grouped: dict[int, list[int]] = {}
+        codes = columns.columns[column]
+        for i in rows:
+            grouped.setdefault(codes[i], []).append(i)
+        return {
+            self._values[code]: CareerSummary.from_sums(len(indexes), self._sums(columns, indexes))
+            for code, indexes in grouped.items()
+        }
+
+    def get_latest_tier(self, puuid: str, *, queue: str = 'competitive') -> int:
+        columns = self._get_columns(puuid)
+        if columns is None:
+            return 0
+        rows = self._select(columns, queue, 1)
+        return int(columns.columns['tier'][rows[0]]) if len(rows) else 0
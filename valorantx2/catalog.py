@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Generic, Hashable, Iterable, Iterator, Sequence, TypeVar, overload
+
+# fmt: off
+__all__ = (
+    'FacetIndex',
+    'FacetSelection',
+)
+# fmt: on
+
+T = TypeVar('T')
+
+
+def _to_bitset(positions: Iterable[int], size: int) -> int:
+    bitmap = bytearray((size + 7) // 8)
+    for position in positions:
+        bitmap[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bitmap, 'little')
+
+
+class FacetSelection(Sequence[T]):
+    """A lazy, ordered view of the items whose bit is set in ``bits``."""
+
+    __slots__ = ('_items', '_bits', '_length')
+
+    def __init__(self, items: Sequence[T], bits: int) -> None:
+        self._items: Sequence[T] = items
+        self._bits: int = bits
+        self._length: int = bits.bit_count()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[T]:
+        return self._iter_from(0)
+
+    def __repr__(self) -> str:
+        return f'<FacetSelection length={self._length}>'
+
+    def _iter_from(self, start: int) -> Iterator[T]:
+        bits = self._bits
+        for _ in range(start):
+            bits &= bits - 1
+        while bits:
+            lowest = bits & -bits
+            yield self._items[lowest.bit_length() - 1]
+            bits ^= lowest
+
+    @overload
+    def __getitem__(self, index: int) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                return list(self)[index]
+            iterator = self._iter_from(start)
+            return [item for item, _ in zip(iterator, range(max(stop - start, 0)))]
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('selection index out of range')
+        return next(self._iter_from(index))
+
+    @property
+    def bits(self) -> int:
+        return self._bits
+
+
+class FacetIndex(Generic[T]):
+    """Maps every facet value to a bitset of item positions.
+
+    Parameters
+    ----------
+    items: Iterable[T]
+        The items to index, their order is the order of the selections.
+    facets: dict[str, Callable[[T], Iterable[Hashable]]]
+        The facet name and a function returning the facet values of an item.
+    """
+
+    __slots__ = ('items', '_facets', '_all')
+
+    def __init__(self, items: Iterable[T], facets: dict[str, Callable[[T], Iterable[Hashable]]]) -> None:
+        self.items: list[T] = list(items)
+        positions: dict[str, dict[Hashable, list[int]]] = {name: {} for name in facets}
+        for position, item in enumerate(self.items):
+            for name, get_values in facets.items():
+                for value in get_values(item):
+                    positions[name].setdefault(value, []).append(position)
+
+        size = len(self.items)
+        self._facets: dict[str, dict[Hashable, int]] = {
+            name: {value: _to_bitset(indexes, size) for value, indexes in values.items()}
+            for name, values in positions.items()
+        }
+        self._all: int = (1 << size) - 1
+
+    def facet_values(self, name: str) -> list[Hashable]:
+        return list(self._facets[name])
+
+    def select(self, **filters: Any) -> FacetSelection[T]:
+        """Returns the items matching every filter.
+
+        A filter value may be a single value or a collection of values, in which
+        case any of them matches. ``None`` skips the filter.
+        """
+        bits = self._all
+        for name, values in filters.items():
+            if values is None:
+                continue
+            facet = self._facets[name]
+            if not isinstance(values, (list, tuple, set, frozenset)):
+                values = (values,)
+
+            union = 0
+            for value in values:
+                union |= facet.get(value, 0)
+            bits &= union
+            if not bits:
+                break
+        return FacetSelection(self.items, bits)
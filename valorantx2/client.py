@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import datetime
 import logging
-from typing import TYPE_CHECKING, Iterator
+import time
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
 from async_lru import _LRUCacheWrapperInstanceMethod, alru_cache
 from valorantx.client import Client as _Client
@@ -11,19 +13,20 @@ from valorantx.models.contracts import Contracts
 from valorantx.models.daily_ticket import DailyTicket
 from valorantx.models.favorites import Favorites
 from valorantx.models.loadout import Loadout
+from valorantx.models.match import MatchHistory
 from valorantx.models.mmr import MatchmakingRating
 from valorantx.models.party import Party, PartyPlayer
 from valorantx.models.store import StoreFront, Wallet
 from valorantx.utils import MISSING
 
+from .career import CareerStats
 from .http import HTTPClient
-from .models import PartialUser, PatchNoteScraper
+from .models import PartialUser, PatchNoteScraper, PatchNoteStore
 from .models.custom.match import MatchDetails
 from .models.custom.store import AgentStore
-from .valorant_api_client import ValorantAPIClient
+from .valorant_api_client import DEFAULT_LOCALES, ValorantAPIClient
 
 if TYPE_CHECKING:
-    from valorantx.models.match import MatchHistory
     from valorantx.models.patchnotes import PatchNotes
     from valorantx.models.store import FeaturedBundle
 
@@ -40,18 +43,31 @@ __all__ = (
 
 _log = logging.getLogger(__name__)
 
+# riot returns at most 20 matches per history request
+MATCH_HISTORY_PAGE_SIZE = 20
+# how long a synced match history index is trusted, in seconds
+MATCH_HISTORY_SYNC_INTERVAL = 60
+
 
 # valorantx Client customized for lattemaid
 class Client(_Client):
-    def __init__(self, bot: LatteMaid = MISSING) -> None:
+    def __init__(self, bot: LatteMaid = MISSING, *, locales: Iterable[str] | None = DEFAULT_LOCALES) -> None:
         super().__init__(
             region=Region.AsiaPacific,  # default region
             locale=Locale.american_english,  # default locale
         )
         self.bot: LatteMaid = bot
         self.http: HTTPClient = HTTPClient(self.loop)
-        self.valorant_api: ValorantAPIClient = ValorantAPIClient(self.http._session, self.locale)
+        self.valorant_api: ValorantAPIClient = ValorantAPIClient(self.http._session, self.locale, locales=locales)
         self.lock: asyncio.Lock = asyncio.Lock()
+        # bounds the concurrent match details requests of all match histories
+        self.match_details_semaphore: asyncio.Semaphore = asyncio.Semaphore(8)
+        # stats of every player of the fetched matches
+        self.career_stats: CareerStats = CareerStats()
+        self._match_history_synced_at: dict[str, float] = {}
+        self._match_history_syncs: dict[str, asyncio.Task[int]] = {}
+        # validators and scraped fields of the patch notes, kept across restarts
+        self.patch_note_store: PatchNoteStore = PatchNoteStore()
 
     async def clear(self) -> None:
         super().clear()
@@ -75,6 +91,9 @@ class Client(_Client):
 
         Fetches patch notes from the given url.
 
+        Only the title and the banner are scraped, the request is conditional
+        on the last scrape of the url and stops once both are found.
+
         Parameters
         ----------
         url: :class:`str`
@@ -93,8 +112,7 @@ class Client(_Client):
         Forbidden
             You are not allowed to fetch the patch notes.
         """
-        text = await self.http.text_from_url(url)
-        return PatchNoteScraper.from_text(self, text)
+        return await PatchNoteScraper.fetch_from_url(self, url, store=self.patch_note_store)
 
     # henrikdev
 
@@ -179,10 +197,63 @@ class Client(_Client):
     @alru_cache(maxsize=1024, ttl=60 * 24 * 7)  # ttl 7 days
     async def fetch_match_details(self, match_id: str) -> MatchDetails:
         # TODO: save data to file or cache?
-        data = await self.http.get_match_details(match_id)
-        return MatchDetails(self, data)
+        async with self.match_details_semaphore:
+            data = await self.http.get_match_details(match_id)
+        match_details = MatchDetails(self, data)
+        self.career_stats.add_match(match_details)
+        return match_details
+
+    async def fetch_match_details_many(self, match_ids: list[str], *, timeout: float = 10.0) -> list[MatchDetails]:
+        """|coro|
+
+        Fetches the details of the given matches concurrently.
+
+        Cached details are returned right away, the others are fetched through
+        :meth:`fetch_match_details` so they are cached too.
+
+        Parameters
+        ----------
+        match_ids: List[:class:`str`]
+            The ids of the matches.
+        timeout: :class:`float`
+            How long to wait for the details, in seconds.
+
+        Returns
+        -------
+        List[:class:`MatchDetails`]
+            The details that were fetched in time, in the order of ``match_ids``.
+        """
+        tasks = [asyncio.ensure_future(self.fetch_match_details(match_id)) for match_id in match_ids]
+        if not tasks:
+            return []
+
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            _log.warning(f'fetching match details timed out, {len(pending)} of {len(tasks)} matches are missing')
+
+        match_details: list[MatchDetails] = []
+        for match_id, task in zip(match_ids, tasks):
+            if task not in done:
+                continue
+            exc = task.exception()
+            if exc is not None:
+                _log.warning(f'failed to fetch match details {match_id}', exc_info=exc)
+                continue
+            match_details.append(task.result())
+        return match_details
 
     @alru_cache(maxsize=512, ttl=60 * 10)  # ttl 10 minutes
+    async def fetch_match_history_data(
+        self,
+        puuid: str,
+        queue: str | None,
+        start: int,
+        end: int,
+    ) -> Any:
+        return await self.http.get_match_history(puuid, queue, start=start, end=end)
+
     async def fetch_match_history(
         self,
         puuid: str,  # required puuid
@@ -191,8 +262,134 @@ class Client(_Client):
         start: int = 0,
         end: int = 15,
         with_details: bool = True,
+        timeout: float = 10.0,
     ) -> MatchHistory:
-        return await super().fetch_match_history(puuid, queue=queue, start=start, end=end, with_details=with_details)
+        # the history itself is cached for 10 minutes and each match details for 7 days,
+        # a partial result is not cached so the missing details are fetched again next time
+        queue_id = queue.value if isinstance(queue, QueueType) else queue
+        data = await self.fetch_match_history_data(puuid, queue_id, start, end)
+        match_history = MatchHistory(client=self, data=data)
+        if with_details:
+            match_ids = [entry['MatchID'] for entry in data['History']]
+            match_history.match_details = await self.fetch_match_details_many(match_ids, timeout=timeout)
+        return match_history
+
+    # match history index
+
+    async def _sync_match_history(self, puuid: str, max_pages: int) -> int:
+        db = self.bot.db
+        latest = await db.fetch_latest_match_history_entry(puuid)
+        # an empty index only needs the latest page, older matches of a queue are fetched on demand
+        max_pages = max_pages if latest is not None else 1
+
+        entries: list[tuple[str, str, datetime.datetime]] = []
+        start = 0
+        for _ in range(max_pages):
+            data = await self.http.get_match_history(puuid, None, start=start, end=start + MATCH_HISTORY_PAGE_SIZE)
+            history = data.get('History') or []
+            known = await db.fetch_known_match_ids(puuid, (entry['MatchID'] for entry in history))
+            for entry in history:
+                if entry['MatchID'] in known:
+                    break
+                started_at = datetime.datetime.utcfromtimestamp(entry['GameStartTime'] / 1000)
+                entries.append((entry['MatchID'], entry.get('QueueID') or '', started_at))
+
+            start += MATCH_HISTORY_PAGE_SIZE
+            if known or len(history) < MATCH_HISTORY_PAGE_SIZE or start >= data.get('Total', 0):
+                break
+
+        if entries:
+            await db.add_match_history_entries(puuid, entries)
+        self._match_history_synced_at[puuid] = time.monotonic()
+        _log.debug(f'synced {len(entries)} new matches for {puuid}')
+        return len(entries)
+
+    async def sync_match_history(self, puuid: str, *, max_pages: int = 5, force: bool = False) -> int:
+        """|coro|
+
+        Adds the matches played since the last sync to the match history index.
+
+        Pages of the history are fetched until a known match is found, so a sync
+        usually costs a single request. Concurrent syncs of a player are shared.
+
+        Returns
+        -------
+        :class:`int`
+            The number of new matches.
+        """
+        synced_at = self._match_history_synced_at.get(puuid)
+        if not force and synced_at is not None and time.monotonic() - synced_at < MATCH_HISTORY_SYNC_INTERVAL:
+            return 0
+
+        task = self._match_history_syncs.get(puuid)
+        if task is None:
+            task = self._match_history_syncs[puuid] = asyncio.create_task(self._sync_match_history(puuid, max_pages))
+            task.add_done_callback(lambda _: self._match_history_syncs.pop(puuid, None))
+        return await asyncio.shield(task)
+
+    async def fetch_indexed_match_ids(
+        self,
+        puuid: str,
+        queue: str | QueueType | None = None,
+        *,
+        limit: int = 15,
+    ) -> list[str]:
+        """|coro|
+
+        Fetches the ids of the latest matches of the player from the match history index, most recent first.
+
+        The index is synced first and the queue is filtered locally, so every
+        queue of a player shares the same history requests. A queue with fewer
+        than ``limit`` indexed matches is fetched from the queue's own history,
+        which is added to the index too.
+        """
+        queue_id = queue.value if isinstance(queue, QueueType) else queue
+
+        # only linked accounts are indexed, the index of a looked up player would never be removed
+        if self.bot is MISSING or not await self.bot.db.is_riot_account_linked(puuid):
+            data = await self.fetch_match_history_data(puuid, queue_id, 0, limit)
+            return [entry['MatchID'] for entry in data.get('History') or []]
+
+        await self.sync_match_history(puuid)
+        db = self.bot.db
+        # the history of riot has an empty QueueID for custom games
+        indexed_queue_id = '' if queue_id == QueueType.custom.value else queue_id
+        match_ids = [
+            entry.match_id async for entry in db.fetch_match_history_entries(puuid, queue_id=indexed_queue_id, limit=limit)
+        ]
+
+        if len(match_ids) < limit:
+            # the index only holds the matches played since the first sync
+            data = await self.fetch_match_history_data(puuid, queue_id, 0, limit)
+            history = data.get('History') or []
+            entries = [
+                (
+                    entry['MatchID'],
+                    entry.get('QueueID') or '',
+                    datetime.datetime.utcfromtimestamp(entry['GameStartTime'] / 1000),
+                )
+                for entry in history
+            ]
+            if len(entries) > len(match_ids):
+                await db.add_match_history_entries(puuid, entries)
+                match_ids = [match_id for match_id, _, _ in entries]
+
+        return match_ids
+
+    async def fetch_indexed_match_details(
+        self,
+        puuid: str,
+        queue: str | QueueType | None = None,
+        *,
+        limit: int = 15,
+        timeout: float = 10.0,
+    ) -> list[MatchDetails]:
+        """|coro|
+
+        Fetches the details of the latest matches of the player, see :meth:`fetch_indexed_match_ids`.
+        """
+        match_ids = await self.fetch_indexed_match_ids(puuid, queue, limit=limit)
+        return await self.fetch_match_details_many(match_ids, timeout=timeout)
 
     # mmr
 
@@ -203,8 +400,46 @@ class Client(_Client):
         riot_auth: RiotAuth | None = None,
     ) -> MatchmakingRating:
         data = await self.http.get_mmr_player(puuid, riot_auth=riot_auth)
+        await self._record_mmr_history(data['Subject'], [data.get('LatestCompetitiveUpdate')])
         return MatchmakingRating(self, data)
 
+    @alru_cache(maxsize=512, ttl=60 * 15)  # ttl 15 minutes
+    async def fetch_competitive_updates(
+        self,
+        puuid: str | None = None,
+        riot_auth: RiotAuth | None = None,
+        *,
+        start: int = 0,
+        end: int = 20,
+    ) -> Any:
+        data = await self.http.get_mmr_competitive_updates(puuid, start=start, end=end, riot_auth=riot_auth)
+        await self._record_mmr_history(data['Subject'], data.get('Matches') or [])
+        return data
+
+    async def _record_mmr_history(self, puuid: str, updates: list[Any]) -> None:
+        # like the match history index, only the linked accounts are recorded
+        if self.bot is MISSING or not await self.bot.db.is_riot_account_linked(puuid):
+            return
+
+        points = [
+            (
+                datetime.datetime.utcfromtimestamp(update['MatchStartTime'] / 1000),
+                update['TierAfterUpdate'],
+                update['RankedRatingAfterUpdate'],
+                update['SeasonID'],
+            )
+            for update in updates
+            # unrated and placement updates have no season or tier
+            if update and update.get('SeasonID') and update.get('TierAfterUpdate')
+        ]
+        if not points:
+            return
+
+        try:
+            await self.bot.db.add_mmr_history(puuid, points)
+        except Exception as e:
+            _log.error(f'failed to record mmr history for {puuid}', exc_info=e)
+
     # loudout
 
     @alru_cache(maxsize=512, ttl=60 * 15)  # ttl 15 minutes
@@ -1,16 +1,29 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
+import json
 import logging
-from typing import TYPE_CHECKING, Any
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+from urllib.parse import urlsplit
+
+import aiohttp
 
 from valorantx.enums import Region, try_enum
 from valorantx.http import EndpointType, HTTPClient as _HTTPClient, Route
 
-from .errors import BadRequest
+from .errors import BadRequest, Forbidden, HTTPException, InternalServerError, NotFound
 
 if TYPE_CHECKING:
     from asyncio import AbstractEventLoop
 
+    from aiohttp import ClientResponse, ClientSession
+    from aiohttp.client import _RequestContextManager
     from valorantx.http import Response
     from valorantx.types import contracts, daily_ticket, favorites, loadout, mmr, party, store
 
@@ -19,27 +32,318 @@ if TYPE_CHECKING:
 
 # fmt: off
 __all__ = (
+    'BodyStore',
+    'CachedResponse',
+    'DiskBodyStore',
     'HTTPClient',
+    'MemoryBodyStore',
+    'RequestTrace',
+    'RevalidationCache',
+    'Revalidated',
 )
 # fmt: on
 
 _log = logging.getLogger(__name__)
 
+# static content served with validators, fetched without riot auth
+CACHEABLE_HOSTS: tuple[str, ...] = ('playvalorant.com', 'valorant-api.com')
+REVALIDATION_TRIES = 3
+REVALIDATION_MAX_DELAY = 10.0
+
+
+class RequestTrace(NamedTuple):
+    method: str
+    endpoint: str
+    region: str
+    status: str
+    elapsed: float
+
+
+def _endpoint_of(route: Route) -> tuple[str, str]:
+    host = urlsplit(route.url).hostname or ''
+    # the unformatted path, puuids and riot ids never reach the labels of a trace
+    path = getattr(route, 'path', None) or ''
+    if '://' in path:
+        # routes made from a full url
+        path = urlsplit(path).path
+    labels = host.split('.')
+    # pd.ap.a.pvp.net, glz-ap-1.ap.a.pvp.net, shared.ap.a.pvp.net
+    if host.endswith('.a.pvp.net') and len(labels) >= 5:
+        return f'{labels[0].split("-")[0]}{path}', labels[-4]
+    return f'{host}{path}', 'global'
+
+
+def _parse_body(body: bytes) -> Any:
+    text = body.decode('utf-8')
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def _digest(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _http_error(response: ClientResponse, data: Any) -> HTTPException:
+    if response.status == 403:
+        return Forbidden(response, data)
+    if response.status == 404:
+        return NotFound(response, data)
+    if response.status >= 500:
+        return InternalServerError(response, data)
+    return HTTPException(response, data)
+
+
+class CachedResponse(NamedTuple):
+    etag: str | None
+    last_modified: str | None
+    size: int
+    digest: str
+
+
+class Revalidated(NamedTuple):
+    data: Any
+    modified: bool
+
+
+class BodyStore:
+    """Where the bodies of the revalidated responses are kept."""
+
+    async def get(self, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    async def set(self, key: str, body: bytes) -> None:
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class MemoryBodyStore(BodyStore):
+    def __init__(self) -> None:
+        self._bodies: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self._bodies.get(key)
+
+    async def set(self, key: str, body: bytes) -> None:
+        self._bodies[key] = body
+
+    async def delete(self, key: str) -> None:
+        self._bodies.pop(key, None)
+
+
+class DiskBodyStore(BodyStore):
+    """One file per response, read back only when the response was not modified."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory: Path = directory
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f'{hashlib.sha1(key.encode()).hexdigest()}.body'
+
+    def _read(self, key: str) -> bytes | None:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, key: str, body: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=f'.{path.name}.', suffix='.tmp', dir=path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(body)
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+    def _delete(self, key: str) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            self._path(key).unlink()
+
+    async def get(self, key: str) -> bytes | None:
+        return await asyncio.get_running_loop().run_in_executor(None, self._read, key)
+
+    async def set(self, key: str, body: bytes) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self._write, key, body)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self._delete, key)
+
+
+class RevalidationCache:
+    """GET responses kept with their ``ETag`` and ``Last-Modified`` validators.
+
+    Only the validators stay in memory, the bodies live in the :class:`BodyStore`
+    and are parsed again on a ``304 Not Modified`` so every caller gets its own copy.
+    """
+
+    def __init__(self, maxsize: int = 1024, *, store: BodyStore | None = None) -> None:
+        self.maxsize: int = maxsize
+        self.store: BodyStore = store if store is not None else MemoryBodyStore()
+        self._entries: dict[str, CachedResponse] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+        self.saved_bytes: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> CachedResponse | None:
+        return self._entries.get(key)
+
+    def set(self, key: str, entry: CachedResponse) -> str | None:
+        """Stores the validators of ``key``, returns the evicted key if any."""
+        evicted = None
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            evicted = next(iter(self._entries))
+            del self._entries[evicted]
+        self._entries[key] = entry
+        return evicted
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = self.saved_bytes = 0
+
+    def get_validators(self) -> dict[str, CachedResponse]:
+        return dict(self._entries)
+
+    async def request(
+        self,
+        session: ClientSession,
+        key: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        parse: Callable[[bytes], Any] = _parse_body,
+    ) -> Any:
+        """|coro|
+
+        GETs ``url`` conditionally on the cached validators of ``key`` and returns the parsed body.
+        """
+        return (await self.revalidate(session, key, url, params=params, headers=headers, parse=parse)).data
+
+    async def revalidate(
+        self,
+        session: ClientSession,
+        key: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        parse: Callable[[bytes], Any] = _parse_body,
+    ) -> Revalidated:
+        """|coro|
+
+        Same as :meth:`request`, also telling whether the document changed since the last request.
+
+        Rate limits, server errors and connection errors are retried with a backoff,
+        other statuses raise :exc:`HTTPException`.
+        """
+        loop = asyncio.get_running_loop()
+        for tries in range(REVALIDATION_TRIES):
+            entry = self._entries.get(key)
+            request_headers = dict(headers) if headers else {}
+            if entry is not None:
+                if entry.etag is not None:
+                    request_headers['If-None-Match'] = entry.etag
+                if entry.last_modified is not None:
+                    request_headers['If-Modified-Since'] = entry.last_modified
+
+            last_try = tries == REVALIDATION_TRIES - 1
+            try:
+                async with session.get(url, params=params, headers=request_headers) as response:
+                    status = response.status
+                    if status == 304 and entry is not None:
+                        body = await self.store.get(key)
+                        if body is not None and _digest(body) == entry.digest:
+                            self.hits += 1
+                            self.saved_bytes += entry.size
+                            return Revalidated(await loop.run_in_executor(None, parse, body), False)
+                        # the body is gone, ask again without the validators
+                        _log.debug('body of %s is missing, requesting it again', key)
+                        self._entries.pop(key, None)
+                        continue
+                    if status == 200:
+                        body = await response.read()
+                        etag = response.headers.get('ETag')
+                        last_modified = response.headers.get('Last-Modified')
+                        break
+
+                    retry_after = response.headers.get('Retry-After')
+                    if (status == 429 or status >= 500) and not last_try:
+                        delay = float(retry_after) if retry_after and retry_after.isdigit() else 1 + tries * 2
+                        _log.warning('%s returned %d, retrying in %.0fs', url, status, delay)
+                        await asyncio.sleep(min(delay, REVALIDATION_MAX_DELAY))
+                        continue
+                    raise _http_error(response, await response.text())
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if last_try:
+                    raise
+                _log.warning('failed to request %s, retrying', url, exc_info=e)
+                await asyncio.sleep(1 + tries * 2)
+        else:
+            raise RuntimeError(f'{url} could not be revalidated')
+
+        self.misses += 1
+        # large documents are parsed off the event loop
+        data = await loop.run_in_executor(None, parse, body)
+        if etag is not None or last_modified is not None:
+            await self.store.set(key, body)
+            evicted = self.set(key, CachedResponse(etag, last_modified, len(body), _digest(body)))
+            if evicted is not None:
+                await self.store.delete(evicted)
+        return Revalidated(data, True)
+
 
 class HTTPClient(_HTTPClient):
     riot_auth: RiotAuth
 
     def __init__(self, loop: AbstractEventLoop) -> None:
         super().__init__(loop, re_authorize=False, region=Region.AsiaPacific)  # default is AsiaPacific
+        self.revalidation: RevalidationCache = RevalidationCache(maxsize=128)
+        # called after every riot request, for metrics
+        self.request_hooks: list[Callable[[RequestTrace], None]] = []
+
+    @staticmethod
+    def _is_cacheable(route: Route, kwargs: dict[str, Any]) -> bool:
+        if route.method != 'GET' or kwargs.get('riot_auth') is not None:
+            return False
+        host = urlsplit(route.url).hostname or ''
+        return any(host == h or host.endswith('.' + h) for h in CACHEABLE_HOSTS)
 
     async def request(self, route: Route, **kwargs: Any) -> Any:
+        if self._is_cacheable(route, kwargs):
+            params = kwargs.get('params')
+            key = f'{route.url} {sorted(params.items()) if params else ""}'
+            return await self.revalidation.request(
+                self._session,
+                key,
+                route.url,
+                params=params,
+                headers=kwargs.get('headers'),
+            )
+
         riot_auth: RiotAuth | None = kwargs.pop('riot_auth', None)
         data: dict[str, Any] | str | None = None
 
         for tries in range(3):
+            started = time.perf_counter()
             try:
                 data = await super().request(route, **kwargs)
             except BadRequest as e:
+                self._trace(route, str(e.status), started)
                 if riot_auth is None:
                     raise e
                 if e.code != 'BAD_CLAIMS':
@@ -49,11 +353,26 @@ class HTTPClient(_HTTPClient):
                     kwargs['headers'] = self._get_headers(riot_auth)
                     continue
                 raise e
+            except Exception as e:
+                self._trace(route, str(getattr(e, 'status', 'error')), started)
+                raise e
             else:
+                self._trace(route, '2xx', started)
                 break
 
         return data
 
+    def _trace(self, route: Route, status: str, started: float) -> None:
+        if not self.request_hooks:
+            return
+        endpoint, region = _endpoint_of(route)
+        trace = RequestTrace(route.method, endpoint, region, status, time.perf_counter() - started)
+        for hook in self.request_hooks:
+            try:
+                hook(trace)
+            except Exception as e:
+                _log.error('request hook %r failed', hook, exc_info=e)
+
     # account
 
     def get_account(self, game_name: str, tag_line: str) -> Response[account_henrikdev.Response]:
@@ -112,6 +431,23 @@ class HTTPClient(_HTTPClient):
         r = Route('GET', '/mmr/v1/players/{puuid}', region, puuid=puuid)
         return self.request(r, headers=headers, riot_auth=riot_auth)
 
+    def get_mmr_competitive_updates(
+        self,
+        puuid: str | None = None,
+        *,
+        start: int = 0,
+        end: int = 20,
+        queue: str = 'competitive',
+        riot_auth: RiotAuth | None = None,
+    ) -> Response[Any]:
+        riot_auth = riot_auth or self.riot_auth
+        headers = self._get_headers(riot_auth)
+        puuid = puuid or riot_auth.puuid
+        region = self._get_region(riot_auth)
+        params = {'startIndex': start, 'endIndex': end, 'queue': queue}
+        r = Route('GET', '/mmr/v1/players/{puuid}/competitiveupdates', region, puuid=puuid)
+        return self.request(r, headers=headers, params=params, riot_auth=riot_auth)
+
     # loadout
 
     def get_personal_player_loadout(self, *, riot_auth: RiotAuth | None = None) -> Response[loadout.Loadout]:
@@ -179,6 +515,12 @@ class HTTPClient(_HTTPClient):
         r = Route('POST', '/daily-ticket/v1/{puuid}/renew', region, EndpointType.pd, puuid=riot_auth.puuid)
         return self.request(r, headers=headers, riot_auth=riot_auth)
 
+    # site
+
+    def get_from_url(self, url: str, *, headers: dict[str, str] | None = None) -> _RequestContextManager:
+        """Streams a GET of an external page, the caller reads and releases the response."""
+        return self._session.get(url, headers=headers)
+
     # utils
     @staticmethod
     def _get_headers(riot_auth: RiotAuth, /) -> dict[str, str]:
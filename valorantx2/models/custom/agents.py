@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from valorantx.valorant_api.models import Ability as ValorantAPIAbility, Agent as ValorantAPIAgent
 
-from ...emojis import get_ability_emoji, get_agent_emoji
+from ...emojis import emoji_registry, normalize_key
 
 if TYPE_CHECKING:
     from valorantx.valorant_api.types.agents import Agent as AgentPayload
@@ -18,17 +19,13 @@ __all__ = (
 
 
 class Ability(ValorantAPIAbility):
+    @cached_property
+    def emoji_key(self) -> str:
+        return normalize_key(self.agent.display_name.default + '_' + self.display_name.default)
+
     @property
     def emoji(self) -> str:
-        key = (
-            (self.agent.display_name.default.lower() + '_' + self.display_name.default.lower())
-            .replace('/', '_')
-            .replace(' ', '_')
-            .replace('___', '_')
-            .replace('__', '_')
-            .replace("'", '')
-        )
-        return get_ability_emoji(key)
+        return emoji_registry.get('ability', self.emoji_key)
 
 
 class Agent(ValorantAPIAgent):
@@ -38,6 +35,10 @@ class Agent(ValorantAPIAgent):
             ability['slot'].lower(): Ability(state=self._state, data=ability, agent=self) for ability in data['abilities']
         }
 
+    @cached_property
+    def emoji_key(self) -> str:
+        return emoji_registry.bind(self.uuid, 'agent', normalize_key(self.display_name.default))
+
     @property
     def emoji(self) -> str:
-        return get_agent_emoji(self.display_name.default)
+        return emoji_registry.get('agent', self.emoji_key)
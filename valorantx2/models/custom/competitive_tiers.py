@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from valorantx.valorant_api.models import CompetitiveTier as ValorantAPICompetitiveTier, Tier as ValorantAPITier
 
-from ...emojis import get_tier_emoji
+from ...emojis import emoji_registry, normalize_key
 
 if TYPE_CHECKING:
     from valorantx.valorant_api.types.competitive_tiers import CompetitiveTier as CompetitiveTierPayload
@@ -18,13 +19,20 @@ __all__ = (
 
 
 class Tier(ValorantAPITier):
+    @cached_property
+    def emoji_key(self) -> str:
+        # will not be used as a tier number because each season's rank is different
+        return normalize_key(self.display_name.default)
+
     @property
     def emoji(self) -> str:
-        # will not be used as a tier number because each season's rank is different
-        return get_tier_emoji(self.display_name.default)
+        return emoji_registry.get('tier', self.emoji_key)
 
 
 class CompetitiveTier(ValorantAPICompetitiveTier):
     def __init__(self, state: ValorantAPICache, data: CompetitiveTierPayload) -> None:
         super().__init__(state, data)
         self._tiers: dict[int, Tier] = {tier['tier']: Tier(state=self._state, data=tier) for tier in data['tiers']}
+
+    def get_tier(self, tier: int) -> Tier | None:
+        return self._tiers.get(tier)
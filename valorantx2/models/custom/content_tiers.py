@@ -1,6 +1,8 @@
+from functools import cached_property
+
 from valorantx.valorant_api.models import ContentTier as ValorantAPIContentTier
 
-from ...emojis import get_content_tier_emoji
+from ...emojis import emoji_registry, normalize_key
 
 # fmt: off
 __all__ = (
@@ -10,6 +12,10 @@ __all__ = (
 
 
 class ContentTier(ValorantAPIContentTier):
+    @cached_property
+    def emoji_key(self) -> str:
+        return emoji_registry.bind(self.uuid, 'content_tier', normalize_key(self.dev_name))
+
     @property
     def emoji(self) -> str:
-        return get_content_tier_emoji(self.dev_name)
+        return emoji_registry.get('content_tier', self.emoji_key)
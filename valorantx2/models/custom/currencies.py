@@ -1,6 +1,6 @@
 from valorantx.valorant_api.models import Currency as ValorantAPICurrency
 
-from ...emojis import get_currency_emoji
+from ...emojis import emoji_registry
 
 # fmt: off
 __all__ = (
@@ -12,4 +12,4 @@ __all__ = (
 class Currency(ValorantAPICurrency):
     @property
     def emoji(self) -> str:
-        return get_currency_emoji(self.uuid)
+        return emoji_registry.get('currency', self.uuid)
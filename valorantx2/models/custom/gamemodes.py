@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from valorantx.valorant_api import Localization
 from valorantx.valorant_api.models import GameMode as ValorantAPIGameMode
 
-from ...emojis import get_game_mode_emoji
+from ...emojis import emoji_registry, normalize_key
 
 if TYPE_CHECKING:
     from valorantx.valorant_api.types.gamemodes import GameMode as GameModePayload
@@ -23,10 +24,13 @@ class GameMode(ValorantAPIGameMode):
     def __init__(self, state: ValorantAPICache, data: GameModePayload) -> None:
         super().__init__(state=state, data=data)
 
+    @cached_property
+    def emoji_key(self) -> str:
+        return emoji_registry.bind(self.uuid, 'game_mode', normalize_key(self.display_name.default))
+
     @property
     def emoji(self) -> str:
-        # return get_game_mode_emoji(self.uuid)
-        return get_game_mode_emoji(self.display_name.default)
+        return emoji_registry.get('game_mode', self.emoji_key)
 
     def display_name_override(self, is_ranked: bool) -> None:
         if self.uuid == '96bd3920-4f36-d026-2b28-c683eb0bcac5':
@@ -73,3 +77,5 @@ class GameMode(ValorantAPIGameMode):
                     "zh-TW": "一般模式",
                 }
             self._display_name_localized = Localization(self._display_name, locale=self._state.locale)
+            # the emoji key follows the display name
+            self.__dict__.pop('emoji_key', None)
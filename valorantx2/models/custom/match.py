@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import TYPE_CHECKING, NamedTuple
 
 from valorantx.client import Client
 from valorantx.models.match import MatchDetails as ValorantXMatchDetails, RoundResult as ValorantXRoundResult
 
 from ...emojis import get_round_result_emoji
+from ...enums import RoundResultCode
 
 if TYPE_CHECKING:
     from valorantx.models.match import MatchPlayer as ValorantXMatchPlayer
@@ -14,9 +16,15 @@ if TYPE_CHECKING:
 __all__ = (
     'RoundResult',
     'MatchDetails',
+    'Placement',
 )
 
 
+class Placement(NamedTuple):
+    place: int
+    tied: bool
+
+
 class RoundResult(ValorantXRoundResult):
     def emoji_by_player(self, player: ValorantXMatchPlayer) -> str:
         return get_round_result_emoji(self.round_result_code, self.winning_team == player.team)
@@ -26,3 +34,74 @@ class MatchDetails(ValorantXMatchDetails):
     def __init__(self, client: Client, data: MatchDetailsPayload) -> None:
         super().__init__(client, data)
         self.round_results: list[RoundResult] = [RoundResult(self, round_result) for round_result in data['roundResults']]
+        self._members_by_acs: dict[str, list[ValorantXMatchPlayer]] = {}
+        self._opponents_by_acs: dict[str, list[ValorantXMatchPlayer]] = {}
+        self._round_timelines: dict[str, list[str]] = {}
+
+    # derived stats, computed on first use and shared by every embed of the match
+
+    @cached_property
+    def players_by_acs(self) -> list[ValorantXMatchPlayer]:
+        return sorted(self.players, key=lambda p: p.stats.acs, reverse=True)
+
+    @cached_property
+    def players_by_kills(self) -> list[ValorantXMatchPlayer]:
+        return sorted(self.players, key=lambda p: p.stats.kills, reverse=True)
+
+    @cached_property
+    def players_by_score(self) -> list[ValorantXMatchPlayer]:
+        return sorted(self.players, key=lambda p: p.stats.score, reverse=True)
+
+    @cached_property
+    def team_scores(self) -> dict[str, int]:
+        return {team.id: team.rounds_won for team in self.teams}
+
+    @cached_property
+    def placements(self) -> dict[str, Placement]:
+        """The kill placement of every player by puuid, used by deathmatch."""
+        players = self.players_by_kills
+        placements: dict[str, Placement] = {}
+        for index, player in enumerate(players):
+            kills = player.stats.kills
+            tied = (index > 0 and players[index - 1].stats.kills == kills) or (
+                index + 1 < len(players) and players[index + 1].stats.kills == kills
+            )
+            placements[player.puuid] = Placement(index + 1, tied)
+        return placements
+
+    def get_members_by_acs(self, player: ValorantXMatchPlayer) -> list[ValorantXMatchPlayer]:
+        """The players of the player's team, including the player, sorted by acs."""
+        try:
+            return self._members_by_acs[player.team_id]
+        except KeyError:
+            members = self._members_by_acs[player.team_id] = [p for p in self.players_by_acs if p.team_id == player.team_id]
+            return members
+
+    def get_opponents_by_acs(self, player: ValorantXMatchPlayer) -> list[ValorantXMatchPlayer]:
+        """The players of the other teams sorted by acs."""
+        try:
+            return self._opponents_by_acs[player.team_id]
+        except KeyError:
+            opponents = self._opponents_by_acs[player.team_id] = [
+                p for p in self.players_by_acs if p.team_id != player.team_id
+            ]
+            return opponents
+
+    def get_round_timeline(self, player: ValorantXMatchPlayer) -> list[str]:
+        """The round result emojis from the player's team point of view,
+        with a separator at the half and ending at a surrender."""
+        try:
+            return self._round_timelines[player.team_id]
+        except KeyError:
+            pass
+
+        timeline: list[str] = []
+        for i, round_result in enumerate(self.round_results, start=1):
+            if i == 12:
+                timeline.append(' | ')
+            timeline.append(round_result.emoji_by_player(player))
+            if round_result.round_result_code == RoundResultCode.surrendered.value:
+                break
+
+        self._round_timelines[player.team_id] = timeline
+        return timeline
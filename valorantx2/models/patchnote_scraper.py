@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from bs4 import BeautifulSoup, FeatureNotFound
 from valorantx.valorant_api import Asset
 
+from ..http import _http_error
+
 if TYPE_CHECKING:
     from typing_extensions import Self
 
@@ -13,9 +21,132 @@ if TYPE_CHECKING:
 # fmt: off
 __all__ = (
     'PatchNoteScraper',
+    'PatchNoteStore',
 )
 # fmt: on
 
+_log = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+
+class _PatchNoteParser:
+    """Incremental parser looking for the ``<title>`` and the highlights banner.
+
+    The article can be fed chunk by chunk, :attr:`done` is set as soon as both
+    fields are found so the rest of the article is never downloaded or parsed.
+    """
+
+    def __init__(self) -> None:
+        self.title: str | None = None
+        self.banner_url: str | None = None
+        self.done: bool = False
+        self._chunks: list[bytes] = []
+        try:
+            from lxml import etree
+        except ImportError:
+            self._parser = None
+        else:
+            # only title and img elements produce events
+            self._parser = etree.HTMLPullParser(events=('start', 'end'), tag=('title', 'img'))
+
+    def feed(self, data: bytes) -> bool:
+        if self._parser is None:
+            self._chunks.append(data)
+            return False
+
+        self._parser.feed(data)
+        return self._read_events()
+
+    def _read_events(self) -> bool:
+        assert self._parser is not None
+        for event, element in self._parser.read_events():
+            if element.tag == 'title':
+                if event == 'end' and self.title is None:
+                    self.title = element.text
+            elif event == 'start' and self.banner_url is None:
+                src = element.get('src')
+                if src is not None and 'Highlights' in src:
+                    self.banner_url = src
+        self.done = self.title is not None and self.banner_url is not None
+        return self.done
+
+    def close(self) -> None:
+        if self._parser is not None:
+            if not self.done:
+                with contextlib.suppress(Exception):
+                    self._parser.close()
+                # lxml emits the events of unclosed elements only once the parser is closed
+                self._read_events()
+            return
+
+        # lxml is missing, fall back to html.parser restricted to the two tags
+        from bs4 import BeautifulSoup, SoupStrainer
+
+        soup = BeautifulSoup(b''.join(self._chunks), 'html.parser', parse_only=SoupStrainer(['title', 'img']))
+        soup_title = soup.find('title')
+        if soup_title is not None:
+            self.title = soup_title.text
+        for banner in soup.find_all('img'):
+            src = banner.get('src')
+            if src is not None and 'Highlights' in src:
+                self.banner_url = src
+                break
+        self._chunks.clear()
+
+
+class PatchNoteStore:
+    """Persists the scraped fields and the validators of every patch note url."""
+
+    def __init__(self, path: Path | None = Path('.cache') / 'patch_notes.json') -> None:
+        self.path: Path | None = path
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        if self.path is None:
+            return {}
+        try:
+            with self.path.open('r', encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            _log.warning('failed to read patch note store %s', self.path, exc_info=e)
+            return {}
+
+    def _write(self, entries: dict[str, dict[str, Any]]) -> None:
+        assert self.path is not None
+        path = self.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=f'.{path.name}.', suffix='.tmp', dir=path.parent)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(entries, file, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+    async def get(self, url: str) -> dict[str, Any] | None:
+        if self._entries is None:
+            async with self._lock:
+                if self._entries is None:
+                    self._entries = await asyncio.get_running_loop().run_in_executor(None, self._read)
+        return self._entries.get(url)
+
+    async def set(self, url: str, entry: dict[str, Any]) -> None:
+        await self.get(url)
+        assert self._entries is not None
+        self._entries[url] = entry
+        if self.path is None:
+            return
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self._write, dict(self._entries))
+        except Exception as e:
+            _log.warning('failed to save patch note store %s', self.path, exc_info=e)
+
 
 class PatchNoteScraper:
     def __init__(self, client: Client, title: str | None, banner_url: str | None) -> None:
@@ -36,44 +167,55 @@ class PatchNoteScraper:
             return None
         return Asset._from_url(self._client.valorant_api.cache, self._banner_url)
 
-    @staticmethod
-    def __to_soup(text: str) -> BeautifulSoup:
-        # lxml is faster than html.parser
-        try:
-            # try to use lxml
-            soup = BeautifulSoup(text, 'lxml')
-        except FeatureNotFound:
-            # fallback to html.parser
-            soup = BeautifulSoup(text, 'html.parser')
-        return soup
-
-    @staticmethod
-    def __get_title(soup: BeautifulSoup) -> str | None:
-        soup_title = soup.find('title')
-        if soup_title is not None:
-            return soup_title.text
-        return None
-
-    @staticmethod
-    def __get_banner_url(soup: BeautifulSoup) -> str | None:
-        banners = soup.find_all('img')
-        for banner in banners:
-            if 'src' in banner.attrs:
-                if 'Highlights' in banner['src']:
-                    return banner['src']
-        return None
-
     @classmethod
-    async def fetch_from_url(cls, client: Client, url: str) -> Self:
-        text = await client.http.text_from_url(url)
-        soup = cls.__to_soup(text)
-        title = cls.__get_title(soup)
-        banner_url = cls.__get_banner_url(soup)
-        return cls(client, title, banner_url)
+    async def fetch_from_url(cls, client: Client, url: str, *, store: PatchNoteStore | None = None) -> Self:
+        """|coro|
+
+        Scrapes the title and the banner of the patch note.
+
+        With a ``store``, the request is conditional on the validators of the
+        last scrape and a ``304 Not Modified`` reuses its fields.
+        """
+        entry = await store.get(url) if store is not None else None
+        headers: dict[str, str] = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        loop = asyncio.get_running_loop()
+        parser = _PatchNoteParser()
+        async with client.http.get_from_url(url, headers=headers) as response:
+            if response.status == 304 and entry is not None:
+                _log.debug(f'patch note {url} not modified')
+                return cls(client, entry['title'], entry['banner_url'])
+            if response.status >= 400:
+                raise _http_error(response, await response.text())
+
+            # parse off the event loop and stop downloading once both fields are found
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                if await loop.run_in_executor(None, parser.feed, chunk):
+                    break
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+
+        await loop.run_in_executor(None, parser.close)
+        if store is not None:
+            await store.set(
+                url,
+                {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'title': parser.title,
+                    'banner_url': parser.banner_url,
+                },
+            )
+        return cls(client, parser.title, parser.banner_url)
 
     @classmethod
     def from_text(cls, client: Client, text: str) -> Self:
-        soup = cls.__to_soup(text)
-        title = cls.__get_title(soup)
-        banner_url = cls.__get_banner_url(soup)
-        return cls(client, title, banner_url)
+        parser = _PatchNoteParser()
+        parser.feed(text.encode())
+        parser.close()
+        return cls(client, parser.title, parser.banner_url)
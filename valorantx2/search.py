@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import bisect
+import unicodedata
+from typing import Generic, Iterable, Iterator, TypeVar
+
+# fmt: off
+__all__ = (
+    'SearchIndex',
+    'normalize',
+)
+# fmt: on
+
+T = TypeVar('T')
+
+# thai and other scripts without spaces can only be matched by substrings,
+# bigrams keep the posting lists small while still matching two-letter queries
+NGRAM_SIZE = 2
+
+
+def normalize(text: str) -> str:
+    # NFC keeps thai vowels and tone marks attached to their consonant
+    return unicodedata.normalize('NFC', text).casefold().strip()
+
+
+def _ngrams(text: str) -> set[str]:
+    if len(text) < NGRAM_SIZE:
+        return {text} if text else set()
+    return {text[i : i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class SearchIndex(Generic[T]):
+    """An immutable prefix and n-gram index over display names.
+
+    Results are ranked by full name prefix, then word prefix, then substring,
+    and by name within each rank.
+    """
+
+    __slots__ = ('_names', '_values', '_keys', '_prefixes', '_words', '_ngrams')
+
+    def __init__(self, entries: Iterable[tuple[str, T]]) -> None:
+        items = sorted(((normalize(name), name, value) for name, value in entries if name and name.strip()))
+        self._names: list[str] = [name for _, name, _ in items]
+        self._values: list[T] = [value for _, _, value in items]
+        self._keys: list[str] = [key for key, _, _ in items]
+
+        words: list[tuple[str, int]] = []
+        ngrams: dict[str, list[int]] = {}
+        for index, key in enumerate(self._keys):
+            for word in set(key.split()[1:]):
+                words.append((word, index))
+            for ngram in _ngrams(key):
+                ngrams.setdefault(ngram, []).append(index)
+
+        words.sort()
+        self._prefixes: list[str] = [word for word, _ in words]
+        self._words: list[int] = [index for _, index in words]
+        self._ngrams: dict[str, frozenset[int]] = {ngram: frozenset(indexes) for ngram, indexes in ngrams.items()}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _prefix_range(self, keys: list[str], prefix: str) -> range:
+        start = bisect.bisect_left(keys, prefix)
+        end = bisect.bisect_left(keys, prefix + '\U0010ffff', lo=start)
+        return range(start, end)
+
+    def _iter_matches(self, query: str) -> Iterator[int]:
+        # full name prefix, already sorted by name
+        yield from self._prefix_range(self._keys, query)
+
+        # word prefix
+        yield from sorted(self._words[i] for i in self._prefix_range(self._prefixes, query))
+
+        # substring
+        postings = sorted((self._ngrams.get(ngram, frozenset()) for ngram in _ngrams(query)), key=len)
+        if not postings:
+            return
+        candidates = postings[0].intersection(*postings[1:])
+        yield from sorted(index for index in candidates if query in self._keys[index])
+
+    def search(self, query: str, limit: int = 25) -> list[tuple[str, T]]:
+        """Returns up to ``limit`` ``(name, value)`` pairs matching ``query``."""
+        query = normalize(query)
+        if not query:
+            return list(zip(self._names[:limit], self._values[:limit]))
+
+        results: list[tuple[str, T]] = []
+        seen: set[int] = set()
+        for index in self._iter_matches(query):
+            if index in seen:
+                continue
+            seen.add(index)
+            results.append((self._names[index], self._values[index]))
+            if len(results) >= limit:
+                break
+        return results
@@ -1,10 +1,22 @@
+from __future__ import annotations
+
+import re
+import sys
+from typing import Any, Container
+
 from valorantx.utils import MISSING as MISSING
 
 __all__ = (
     'MISSING',
+    'compact_payload',
     'validate_riot_id',
 )
 
+_LOCALE_RE = re.compile(r'^[a-z]{2}-[A-Z]{2}$')
+
+# strings longer than this are mostly descriptions and urls, interning them saves nothing
+_INTERN_MAX_LENGTH = 64
+
 
 def validate_riot_id(riot_id: str) -> tuple[str, str]:
     if '#' not in riot_id:
@@ -22,3 +34,27 @@ def validate_riot_id(riot_id: str) -> tuple[str, str]:
         raise ValueError('Invalid Riot ID.')
 
     return game_name, tag_line
+
+
+def _is_localized(data: dict[str, Any]) -> bool:
+    return 'en-US' in data and all(_LOCALE_RE.match(key) for key in data)
+
+
+def compact_payload(data: Any, locales: Container[str]) -> Any:
+    """Returns a compact copy of a valorant-api payload.
+
+    Localized values (``{"en-US": ..., "th-TH": ...}``) only keep the given locales and ``en-US``,
+    keys and short strings are interned so the repeated ones share a single object.
+    """
+    if isinstance(data, str):
+        return sys.intern(data) if len(data) <= _INTERN_MAX_LENGTH else data
+    if isinstance(data, list):
+        return [compact_payload(value, locales) for value in data]
+    if isinstance(data, dict):
+        localized = _is_localized(data)
+        return {
+            sys.intern(key): compact_payload(value, locales)
+            for key, value in data.items()
+            if not localized or key == 'en-US' or key in locales
+        }
+    return data
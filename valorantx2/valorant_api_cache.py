@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+import hashlib
+import json
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
 
 from valorantx.valorant_api_cache import CacheState
 
@@ -11,6 +15,8 @@ from .models.custom.currencies import Currency
 from .models.custom.gamemodes import GameMode
 
 if TYPE_CHECKING:
+    from valorantx import Locale
+    from valorantx.valorant_api.http import HTTPClient
     from valorantx.valorant_api.types import agents, competitive_tiers, content_tiers, currencies, gamemodes
 
 # fmt: off
@@ -19,29 +25,215 @@ __all__ = (
 )
 # fmt: on
 
+_log = logging.getLogger(__name__)
+
+
+def _digest(item: Any) -> str:
+    body = json.dumps(item, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode()
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _iter_uuids(data: Any) -> Iterator[str]:
+    if isinstance(data, dict):
+        uuid = data.get('uuid')
+        if isinstance(uuid, str):
+            yield uuid
+        for value in data.values():
+            if isinstance(value, (dict, list)):
+                yield from _iter_uuids(value)
+    elif isinstance(data, list):
+        for value in data:
+            yield from _iter_uuids(value)
+
+
+def _reusing(name: str, store: Callable[..., Any]) -> Callable[..., Any]:
+    # unchanged payloads take the entity of the live cache instead of building a new one
+    @functools.wraps(store)
+    def wrapper(self: ValorantAPICache, data: Any, *args: Any, **kwargs: Any) -> Any:
+        uuid = data.get('uuid') if isinstance(data, dict) else None
+        live = self.__dict__.get('_live')
+        if live is not None and uuid in live._unchanged:
+            map_name = live._store_maps.get(name)
+            if map_name is not None:
+                entity = getattr(live, map_name).get(uuid)
+                if entity is not None:
+                    self._take_live_entities(live, data)
+                    return entity
+
+        entity = store(self, data, *args, **kwargs)
+        if uuid is not None and name not in self._store_maps:
+            for map_name, mapping in self._get_maps().items():
+                if mapping.get(uuid) is entity:
+                    self._store_maps[name] = map_name
+                    break
+        return entity
+
+    return wrapper
+
+
+def _wrap_store_methods(cls: type[ValorantAPICache], names: Iterable[str]) -> None:
+    for name in names:
+        if name.startswith('store_'):
+            setattr(cls, name, _reusing(name, getattr(cls, name)))
+
 
 class ValorantAPICache(CacheState):
+    """The valorant-api content, reloaded by building only the entities whose payload changed.
+
+    Entities built while reloading hold a staging cache as their state. Once swapped in,
+    the staging cache keeps nothing of its own and forwards every attribute to the live one.
+    """
+
+    # attributes that are not maps of entities
+    _bookkeeping: frozenset[str] = frozenset({'_digests', '_loading_digests', '_store_maps'})
+
+    def __init__(self, *, locale: Locale, http: HTTPClient, live: ValorantAPICache | None = None) -> None:
+        # the cache this one is loaded for, and forwards to after the swap
+        self._live: ValorantAPICache | None = live
+        # uuid -> digest of the top level payload the entity was built from
+        self._digests: dict[str, str] = {}
+        self._loading_digests: dict[str, str] = {}
+        # uuids whose payload did not change since the last load
+        self._unchanged: set[str] = set()
+        # store method -> name of the map it stores into
+        self._store_maps: dict[str, str] = dict(live._store_maps) if live is not None else {}
+        super().__init__(locale=locale, http=http)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _wrap_store_methods(cls, list(vars(cls)))
+
+    def __getattr__(self, name: str) -> Any:
+        live = self.__dict__.get('_live')
+        if live is None:
+            raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {name!r}')
+        return getattr(live, name)
+
+    # pickled into the snapshot, without the http client and the state of a load in progress
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = dict(self.__dict__)
+        for name in ('http', '_loading_digests', '_unchanged'):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if '_digests' in state:
+            self._loading_digests = {}
+            self._unchanged = set()
+
+    def restore(self, snapshot: ValorantAPICache) -> None:
+        """Takes the entities and the digests of a cache loaded from a snapshot."""
+        self._digests = snapshot._digests
+        self.swap(snapshot)
+
+    def _get_maps(self) -> dict[str, dict[Any, Any]]:
+        return {
+            name: value
+            for name, value in vars(self).items()
+            if name.startswith('_') and isinstance(value, dict) and name not in self._bookkeeping
+        }
+
+    def _take_live_entities(self, live: ValorantAPICache, data: Any) -> None:
+        # a store method also builds the nested entities (skins, chromas, levels, abilities...),
+        # they are reused along with their parent instead of being built again
+        uuids = set(_iter_uuids(data))
+        maps = self._get_maps()
+        for name, mapping in live._get_maps().items():
+            staging = maps.get(name)
+            if staging is None:
+                continue
+            for uuid in uuids.intersection(mapping):
+                staging[uuid] = mapping[uuid]
+
+    def diff_payload(self, data: Any, *, modified: bool) -> None:
+        """Compares a valorant-api document with the one of the last load, before its entities are built.
+
+        An unmodified document keeps all of its entities, a modified one the entities
+        whose top level payload has the same digest as before.
+        """
+        items = data.get('data') if isinstance(data, dict) else None
+        if isinstance(items, dict):
+            items = [items]
+        if not isinstance(items, list):
+            return
+
+        for item in items:
+            if not isinstance(item, dict) or not isinstance(item.get('uuid'), str):
+                continue
+            uuid = item['uuid']
+            previous = self._digests.get(uuid)
+            digest = previous if not modified and previous is not None else _digest(item)
+            self._loading_digests[uuid] = digest
+            if digest == previous:
+                self._unchanged.update(_iter_uuids(item))
+
+    def commit_digests(self) -> None:
+        """Makes the digests of the completed load the base of the next diff."""
+        self._digests = self._loading_digests
+        self._loading_digests = {}
+        self._unchanged = set()
+
+    async def reload_from(self, http: HTTPClient) -> None:
+        """|coro|
+
+        Loads the new content next to the live one and swaps it in once complete.
+
+        Entities whose payload did not change are reused instead of being rebuilt,
+        and commands never see a partially loaded cache.
+        """
+        staging = self.__class__(locale=self.locale, http=http, live=self)
+        try:
+            await staging.init()
+        except BaseException:
+            self._loading_digests = {}
+            self._unchanged = set()
+            raise
+        self.swap(staging)
+
+    def swap(self, staging: ValorantAPICache) -> None:
+        # no awaits in here, the swap is atomic for the event loop
+        maps = staging._get_maps()
+        current = self._get_maps()
+        total = sum(len(mapping) for mapping in maps.values())
+        reused = sum(
+            1
+            for name, mapping in maps.items()
+            for uuid, entity in mapping.items()
+            if current.get(name, {}).get(uuid) is entity
+        )
+
+        for name, mapping in maps.items():
+            setattr(self, name, mapping)
+        self._store_maps.update(staging._store_maps)
+
+        # the new entities reference the staging cache, it only forwards to this one from now on
+        staging.__dict__.clear()
+        staging._live = self
+
+        _log.info('valorant api cache swapped, reused %s of %s entities', reused, total)
+
     def store_content_tier(self, data: content_tiers.ContentTier) -> ContentTier:
-        content_tier_id = data['uuid']
-        self._content_tiers[content_tier_id] = content_tier = ContentTier(state=self, data=data)
+        self._content_tiers[data['uuid']] = content_tier = ContentTier(state=self, data=data)
         return content_tier
 
     def store_agent(self, data: agents.Agent) -> Agent:
-        agent_id = data['uuid']
-        self._agents[agent_id] = agent = Agent(state=self, data=data)
+        self._agents[data['uuid']] = agent = Agent(state=self, data=data)
         return agent
 
     def store_currency(self, data: currencies.Currency) -> Currency:
-        currency_id = data['uuid']
-        self._currencies[currency_id] = currency = Currency(state=self, data=data)
+        self._currencies[data['uuid']] = currency = Currency(state=self, data=data)
         return currency
 
     def store_game_mode(self, data: gamemodes.GameMode) -> GameMode:
-        game_mode_id = data['uuid']
-        self._game_modes[game_mode_id] = game_mode = GameMode(state=self, data=data)
+        self._game_modes[data['uuid']] = game_mode = GameMode(state=self, data=data)
         return game_mode
 
     def store_competitive_tier(self, data: competitive_tiers.CompetitiveTier) -> CompetitiveTier:
-        competitive_tier_id = data['uuid']
-        self._competitive_tiers[competitive_tier_id] = competitive_tier = CompetitiveTier(state=self, data=data)
+        self._competitive_tiers[data['uuid']] = competitive_tier = CompetitiveTier(state=self, data=data)
         return competitive_tier
+
+
+# the inherited store methods too, subclasses wrap their own in __init_subclass__
+_wrap_store_methods(ValorantAPICache, dir(ValorantAPICache))
@@ -1,14 +1,32 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import contextlib
+import functools
+import json
+import logging
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
 
 from valorantx import Locale
+from valorantx.models import Skin
 from valorantx.valorant_api_client import Client
 
+from .catalog import FacetIndex
+from .http import BodyStore, CachedResponse, DiskBodyStore, MemoryBodyStore, RevalidationCache
+from .search import SearchIndex
+from .utils import compact_payload
 from .valorant_api_cache import ValorantAPICache
 
 if TYPE_CHECKING:
     from aiohttp import ClientSession
+    from valorantx.valorant_api.models import Version
+
+    from .models.custom.competitive_tiers import CompetitiveTier, Tier
 
 # fmt: off
 __all__ = (
@@ -16,8 +34,258 @@ __all__ = (
 )
 # fmt: on
 
+_log = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 6
+
+# search kind -> client attribute listing the items
+SEARCHABLE: dict[str, str] = {
+    'agent': 'agents',
+    'buddy': 'buddies',
+    'bundle': 'bundles',
+    'content_tier': 'content_tiers',
+    'spray': 'sprays',
+    'weapon': 'weapons',
+    'skin': 'skins',
+}
+
+# locales kept in the localized values of the static content, en-US is always kept
+DEFAULT_LOCALES: tuple[str, ...] = ('en-US', 'th-TH')
+
+
+def get_version_key(version: Version) -> str:
+    return version.riot_client_build
+
+
+def _parse_payload(body: bytes, locales: frozenset[str] | None) -> Any:
+    data = json.loads(body)
+    if locales is not None:
+        data = compact_payload(data, locales)
+    return data
+
 
 class ValorantAPIClient(Client):
-    def __init__(self, session: ClientSession, locale: Locale = Locale.english) -> None:
+    def __init__(
+        self,
+        session: ClientSession,
+        locale: Locale = Locale.english,
+        *,
+        snapshot_path: Path | None = Path('.cache') / 'valorant_api.pickle',
+        locales: Iterable[str] | None = DEFAULT_LOCALES,
+    ) -> None:
         super().__init__(session, locale)
+        # None keeps every locale
+        self.locales: frozenset[str] | None = frozenset(locales) if locales is not None else None
         self.cache: ValorantAPICache = ValorantAPICache(locale=locale, http=self.http)
+        self.snapshot_path: Path | None = snapshot_path
+        self.snapshot_version: str | None = None
+        # (kind, locale) -> index of display names to uuids
+        self._search_indexes: dict[tuple[str, str], SearchIndex[str]] = {}
+        self._skin_catalog: FacetIndex[Skin] | None = None
+        # validators of the responses, a reload only downloads the changed documents
+        # and reads the others back from the body store next to the snapshot
+        store: BodyStore = DiskBodyStore(snapshot_path.parent / 'valorant_api') if snapshot_path else MemoryBodyStore()
+        self.revalidation: RevalidationCache = RevalidationCache(store=store)
+        self._session: ClientSession = session
+        self._http_request = self.http.request
+        self.http.request = self._request  # type: ignore
+
+    @staticmethod
+    def _get_request_key(route: Any, **kwargs: Any) -> str:
+        params = kwargs.get('params')
+        return f'{route.method} {route.url} {sorted(params.items()) if params else ""}'
+
+    async def _request(self, route: Any, **kwargs: Any) -> Any:
+        if route.method != 'GET':
+            return await self._http_request(route, **kwargs)
+
+        key = self._get_request_key(route, **kwargs)
+        data, modified = await self.revalidation.revalidate(
+            self._session,
+            key,
+            route.url,
+            params=kwargs.get('params'),
+            parse=functools.partial(_parse_payload, locales=self.locales),
+        )
+        self.cache.diff_payload(data, modified=modified)
+        return data
+
+    # init
+
+    async def init(self) -> None:
+        self.clear_indexes()
+        if await self.load_snapshot():
+            return
+        await self._load_and_snapshot(super().init)
+
+    async def reload(self) -> None:
+        revalidation = self.revalidation
+        revalidation.reset_stats()
+        await self._load_and_snapshot(self._reload_cache)
+        self.clear_indexes()
+        _log.info(
+            'reloaded valorant api, %d of %d documents not modified, %d bytes saved',
+            revalidation.hits,
+            revalidation.hits + revalidation.misses,
+            revalidation.saved_bytes,
+        )
+
+    async def _reload_cache(self) -> None:
+        await self.cache.reload_from(self.http)
+
+    async def _load_and_snapshot(self, loader: Any) -> None:
+        started = time.perf_counter()
+        await loader()
+        self.cache.commit_digests()
+        version = await self.fetch_version()
+        _log.info('loaded valorant api from the network in %.2fs', time.perf_counter() - started)
+
+        self.snapshot_version = get_version_key(version)
+        await self.save_snapshot(self.snapshot_version)
+
+    # competitive tiers
+
+    def get_latest_tier(self, tier: int) -> Tier | None:
+        """Returns the tier of the latest competitive tier table, the one of the current episode."""
+        competitive_tiers: list[CompetitiveTier] = self.competitive_tiers  # type: ignore
+        if not competitive_tiers:
+            return None
+        return competitive_tiers[-1].get_tier(tier)
+
+    # search
+
+    def clear_indexes(self) -> None:
+        self._search_indexes.clear()
+        self._skin_catalog = None
+
+    def get_search_index(self, kind: str, locale: Locale) -> SearchIndex[str]:
+        key = (kind, str(locale))
+        try:
+            return self._search_indexes[key]
+        except KeyError:
+            pass
+
+        items = getattr(self, SEARCHABLE[kind])
+        self._search_indexes[key] = index = SearchIndex((item.display_name_localized(locale), item.uuid) for item in items)
+        return index
+
+    def build_search_indexes(self, locales: Iterable[Locale]) -> None:
+        for locale in locales:
+            for kind in SEARCHABLE:
+                self.get_search_index(kind, locale)
+        self.get_skin_catalog()
+
+    def get_skin_catalog(self) -> FacetIndex[Skin]:
+        """Returns the skins indexed by ``weapon``, ``content_tier``, ``bundle`` and ``price``."""
+        if self._skin_catalog is not None:
+            return self._skin_catalog
+
+        skin_bundles: dict[str, list[str]] = {}
+        for bundle in self.bundles:
+            for item in bundle.items:
+                if isinstance(item, Skin):
+                    skin_bundles.setdefault(item.uuid, []).append(bundle.uuid)
+
+        self._skin_catalog = catalog = FacetIndex(
+            sorted(self.skins, key=lambda skin: skin.display_name.default),
+            {
+                'weapon': lambda skin: (skin.parent.uuid,) if skin.parent is not None else (),
+                'content_tier': lambda skin: (skin.rarity.uuid,) if skin.rarity is not None else (),
+                'bundle': lambda skin: skin_bundles.get(skin.uuid, ()),
+                'price': lambda skin: (skin.price,),
+            },
+        )
+        return catalog
+
+    # snapshot
+
+    def _read_snapshot(self) -> dict[str, Any] | None:
+        if self.snapshot_path is None:
+            return None
+        try:
+            with self.snapshot_path.open('rb') as file:
+                snapshot = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            _log.warning('failed to read valorant api snapshot %s', self.snapshot_path, exc_info=e)
+            return None
+
+        if (
+            snapshot.get('format') != SNAPSHOT_FORMAT
+            or snapshot.get('locale') != str(self.cache.locale)
+            or snapshot.get('locales') != self.locales
+        ):
+            return None
+        return snapshot
+
+    def _write_snapshot(self, body: bytes) -> None:
+        assert self.snapshot_path is not None
+        path = self.snapshot_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=f'.{path.name}.', suffix='.tmp', dir=path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(body)
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+    async def load_snapshot(self) -> bool:
+        """|coro|
+
+        Loads the parsed static content from the on-disk snapshot without touching the network.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the snapshot was loaded.
+        """
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        snapshot = await loop.run_in_executor(None, self._read_snapshot)
+        if snapshot is None:
+            return False
+
+        # the entities of the snapshot resolve against the live cache from now on
+        self.cache.restore(snapshot['cache'])
+
+        # the next reload revalidates the documents against the bodies on disk instead of downloading them again
+        for key, validators in snapshot['validators'].items():
+            self.revalidation.set(key, CachedResponse(*validators))
+
+        self.snapshot_version = snapshot['version']
+        _log.info(
+            'loaded valorant api snapshot for version %s in %.2fs',
+            self.snapshot_version,
+            time.perf_counter() - started,
+        )
+        return True
+
+    async def save_snapshot(self, version: str) -> None:
+        if self.snapshot_path is None:
+            return
+
+        snapshot = {
+            'format': SNAPSHOT_FORMAT,
+            'version': version,
+            'locale': str(self.cache.locale),
+            'locales': self.locales,
+            # the parsed and compacted entities, a boot does not parse the responses again
+            'cache': self.cache,
+            'validators': self.revalidation.get_validators(),
+        }
+        loop = asyncio.get_running_loop()
+        try:
+            # pickled on the event loop, nothing can change the cache while it is walked
+            body = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+            await loop.run_in_executor(None, self._write_snapshot, body)
+        except Exception as e:
+            _log.warning('failed to save valorant api snapshot %s', self.snapshot_path, exc_info=e)
+        else:
+            _log.info('saved valorant api snapshot for version %s', version)
+
+    def is_snapshot_of(self, version: Version) -> bool:
+        return self.snapshot_version is not None and self.snapshot_version == get_version_key(version)